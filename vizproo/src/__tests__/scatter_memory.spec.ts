@@ -0,0 +1,71 @@
+// Copyright (c) MATIUS
+// Distributed under the terms of the Modified BSD License.
+
+// Benchmark de memoria del procesamiento de ScatterPlot. Mide la memoria
+// retenida (heap más ArrayBuffers) después de forzar el recolector, por lo
+// que necesita `--expose-gc`:
+//
+//   jlpm run test:memory
+//
+// Sin `--expose-gc` las pruebas se omiten.
+
+import { scatterPoints } from '../base/compute';
+
+const ROWS = 200_000;
+/**
+ * Bytes retenidos por fila permitidos a los arreglos de puntos
+ * (x, y, tamaño: 8 bytes; índice y color: 4 bytes).
+ */
+const MAX_BYTES_PER_ROW = 40;
+
+const gc: (() => void) | undefined = (globalThis as any).gc;
+const withGc = gc ? it : it.skip;
+
+function usage(): number {
+  const memory = process.memoryUsage();
+  return memory.heapUsed + memory.arrayBuffers;
+}
+
+function retained<T>(build: () => T): { bytes: number; value: T } {
+  gc!();
+  const before = usage();
+  const value = build();
+  gc!();
+  return { bytes: usage() - before, value };
+}
+
+function columns() {
+  let seed = 1;
+  const random = () => (seed = (seed * 16807) % 2147483647) / 2147483647;
+  const x = new Float64Array(ROWS).map(random);
+  const y = new Float64Array(ROWS).map(random);
+  const size = new Float64Array(ROWS).map(random);
+  const hue = new Float64Array(ROWS).map(() => Math.floor(random() * 5));
+  return { x, y, size, hue };
+}
+
+describe('ScatterPlot memory', () => {
+  withGc('keeps points in compact parallel arrays', () => {
+    const args = columns();
+    const { bytes, value } = retained(() => scatterPoints(args));
+    expect(value.index.length).toBe(ROWS);
+    expect(bytes / ROWS).toBeLessThan(MAX_BYTES_PER_ROW);
+  });
+
+  withGc('retains far less than copying every row', () => {
+    const args = columns();
+    const records = Array.from(args.x, (x, i) => ({
+      x,
+      y: args.y[i],
+      size: args.size[i],
+      hue: 'c' + args.hue[i],
+    }));
+    const compact = retained(() => scatterPoints(args));
+    // Representación anterior: dos copias de cada fila
+    const copies = retained(() =>
+      records.map((row, i) => ({ ...row, x_: row.x, y_: row.y, id: i, originalData: { ...row } }))
+    );
+    expect(compact.value.index.length).toBe(copies.value.length);
+    expect(compact.bytes * 10).toBeLessThan(copies.bytes);
+  });
+});
@@ -1,5 +1,13 @@
-import { DOMWidgetModel, DOMWidgetView } from "@jupyter-widgets/base";
+import {
+  DOMWidgetModel,
+  DOMWidgetView,
+  IBackboneModelOptions,
+  ISerializers,
+  WidgetModel,
+  unpack_models,
+} from "@jupyter-widgets/base";
 import { BaseWidget, BaseWidgetParams } from "./base_widget";
+import { ColumnDomain, DataTable, deserializeTable, handleColumnsMessage } from "./data_table";
 import "../../css/widget.css";
 
 import packageData from "../../package.json";
@@ -54,6 +62,84 @@ export abstract class BaseModel extends DOMWidgetModel {
   public static readonly view_module_version = packageData.version;
 }
 
+/**
+ * Modelo base para widgets que reciben datos tabulares desde Python.
+ * Deserializa `dataColumns` una sola vez en una `DataTable` compartida
+ * por todas las vistas del modelo. Si el widget referencia un `Dataset`,
+ * la tabla se toma de ese modelo compartido.
+ */
+export abstract class DataModel extends BaseModel {
+  /**
+   * Valores por defecto del modelo, incluyendo una tabla vacía.
+   */
+  defaults() {
+    return {
+      ...super.defaults(),
+      dataColumns: DataTable.empty(),
+      domains: {},
+      dataset: null,
+    };
+  }
+
+  /**
+   * Conecta el modelo con su dataset compartido, si existe.
+   * @param attributes - Atributos iniciales del modelo.
+   * @param options - Opciones de Backbone del modelo.
+   */
+  initialize(attributes: any, options: IBackboneModelOptions) {
+    super.initialize(attributes, options);
+    this.on("change:dataset", () => this.bindDataset(true), this);
+    this.on("msg:custom", (content: any, buffers: any) => handleColumnsMessage(this, content, buffers), this);
+    this.bindDataset(false);
+  }
+
+  /**
+   * Reenvía los cambios de datos del dataset como `change:dataColumns`,
+   * de modo que las vistas no distingan entre datos propios y compartidos.
+   * @param notify - Si es verdadero, notifica el cambio de referencia.
+   */
+  private bindDataset(notify: boolean) {
+    const previous: WidgetModel | null = this.previous("dataset");
+    if (previous) this.stopListening(previous);
+    const dataset: WidgetModel | null = this.get("dataset");
+    if (dataset) {
+      this.listenTo(dataset, "change:dataColumns", () => this.trigger("change:dataColumns", this));
+      this.listenTo(dataset, "change:domains", () => this.trigger("change:domains", this));
+    }
+    if (notify) this.trigger("change:dataColumns", this);
+  }
+
+  /**
+   * Devuelve la tabla de datos vigente (propia o del dataset compartido).
+   * @returns Tabla columnar del widget.
+   */
+  table(): DataTable {
+    const dataset: WidgetModel | null = this.get("dataset");
+    return dataset ? dataset.get("dataColumns") : this.get("dataColumns");
+  }
+
+  /**
+   * Devuelve los dominios de columnas calculados en Python (propios o del
+   * dataset compartido), de modo que los gráficos que usan las mismas
+   * columnas compartan ejes sin recorrer los datos.
+   * @returns Dominio por nombre de columna.
+   */
+  domains(): Record<string, ColumnDomain> {
+    const dataset: WidgetModel | null = this.get("dataset");
+    return (dataset ? dataset.get("domains") : this.get("domains")) || {};
+  }
+
+  /**
+   * Serializadores del modelo: `dataColumns` llega en formato columnar y
+   * `dataset` como referencia a otro modelo.
+   */
+  static serializers: ISerializers = {
+    ...BaseModel.serializers,
+    dataColumns: { deserialize: deserializeTable },
+    dataset: { deserialize: unpack_models },
+  };
+}
+
 /**
  * Vista base para widgets Jupyter.
  * Maneja obtención del elemento, cálculo de tamaños y ciclo de renderizado.
@@ -79,6 +165,15 @@ export abstract class BaseView<T extends BaseWidget = BaseWidget> extends DOMWid
    * Instancia del widget que realiza el renderizado.
    */
   widget!: T;
+  /**
+   * Número del último dibujo pedido; descarta los cálculos de pedidos
+   * anteriores que terminen después.
+   */
+  private drawRequest = 0;
+  /**
+   * Último cálculo de `prepare`, reutilizado mientras no cambien sus entradas.
+   */
+  private prepared: { inputs: any[]; result: Promise<any> } | null = null;
 
   /**
    * Dibuja el widget dentro del elemento suministrado.
@@ -93,6 +188,54 @@ export abstract class BaseView<T extends BaseWidget = BaseWidget> extends DOMWid
    */
   abstract params(): BaseWidgetParams;
 
+  /**
+   * Completa los parámetros con cálculos hechos fuera del hilo principal
+   * (ver `compute_pool.ts`). Por defecto los devuelve sin cambios.
+   * @param params - Parámetros obtenidos con `params()`.
+   * @returns Parámetros listos para dibujar.
+   */
+  prepare(params: BaseWidgetParams): Promise<BaseWidgetParams> {
+    return Promise.resolve(params);
+  }
+
+  /**
+   * Reutiliza el último cálculo si sus entradas no cambiaron, de modo que
+   * redimensionar o cambiar opciones visuales no repite el trabajo.
+   * @param inputs - Entradas del cálculo, comparadas por identidad.
+   * @param compute - Cálculo a ejecutar si cambió alguna entrada.
+   * @returns Resultado del cálculo.
+   */
+  protected reuse<R>(inputs: any[], compute: () => Promise<R>): Promise<R> {
+    const last = this.prepared;
+    if (last && last.inputs.length === inputs.length && last.inputs.every((input, i) => input === inputs[i])) {
+      return last.result;
+    }
+    const result = compute();
+    this.prepared = { inputs, result };
+    result.catch(() => {
+      if (this.prepared && this.prepared.result === result) this.prepared = null;
+    });
+    return result;
+  }
+
+  /**
+   * Prepara los parámetros y dibuja con ellos. Si el cálculo falla se dibuja
+   * con los parámetros originales, que el gráfico procesa por su cuenta.
+   * @param render - Dibujo a realizar, inicial o con "debounce".
+   */
+  draw(render: (params: BaseWidgetParams) => void): void {
+    const request = ++this.drawRequest;
+    const params = this.params();
+    this.prepare(params)
+      .catch((err) => {
+        console.log(err);
+        return params;
+      })
+      .then((prepared) => {
+        if (request === this.drawRequest) render(prepared);
+      });
+  }
+
   /**
    * Inicia el proceso de renderizado con reintentos hasta que
    * existan dimensiones válidas o se alcance el tiempo máximo.
@@ -132,7 +275,7 @@ export abstract class BaseView<T extends BaseWidget = BaseWidget> extends DOMWid
    */
   replot(): void {
     this.setSizes();
-    this.widget.replot(this.params());
+    this.draw((params) => this.widget.replot(params));
   }
 
   /**
@@ -0,0 +1,274 @@
+/**
+ * Cálculos numéricos de los gráficos sobre columnas en TypedArrays.
+ *
+ * Estas funciones se ejecutan dentro de los workers de `compute_pool.ts`,
+ * que copian su código fuente con `toString()`: no pueden importar nada
+ * ni usar variables del módulo, solo llamarse entre ellas. Los valores
+ * faltantes llegan como NaN.
+ */
+
+/**
+ * Puntos válidos de un gráfico de dispersión.
+ */
+export interface ScatterPoints {
+    /**
+     * Fila original de cada punto.
+     */
+    index: Uint32Array;
+    /**
+     * Valores X de cada punto.
+     */
+    x: Float64Array;
+    /**
+     * Valores Y de cada punto.
+     */
+    y: Float64Array;
+    /**
+     * Valores de tamaño de cada punto (NaN si falta), o null sin columna de tamaño.
+     */
+    size: Float64Array | null;
+    /**
+     * Categoría de color de cada punto (`MISSING` si falta), o null sin columna de color.
+     */
+    hue: Uint32Array | null;
+    /**
+     * Primera fila de cada categoría de color, en orden de aparición, usada
+     * para recuperar su etiqueta.
+     */
+    hueFirst: Uint32Array;
+    /**
+     * Extensión [mínimo, máximo] de X.
+     */
+    xExtent: [number, number];
+    /**
+     * Extensión [mínimo, máximo] de Y.
+     */
+    yExtent: [number, number];
+    /**
+     * Extensión del tamaño, o null si ningún punto tiene tamaño.
+     */
+    sizeExtent: [number, number] | null;
+}
+
+/**
+ * Código de categoría de los puntos sin valor de color.
+ */
+export const MISSING = 0xffffffff;
+
+/**
+ * Promedio por grupo, en el orden en que aparece cada grupo.
+ */
+export interface GroupMeans {
+    /**
+     * Primera fila de cada grupo, usada para recuperar su etiqueta.
+     */
+    first: Uint32Array;
+    /**
+     * Promedio de los valores no faltantes de cada grupo (0 si no tiene).
+     */
+    means: Float64Array;
+}
+
+/**
+ * Proyección de varias dimensiones sobre el plano.
+ */
+export interface Projection {
+    /**
+     * Valores normalizados a [0, 1], fila por fila (n × dimensiones).
+     */
+    normalized: Float64Array;
+    /**
+     * Coordenada X de cada fila, en unidades del radio.
+     */
+    x: Float64Array;
+    /**
+     * Coordenada Y de cada fila, en unidades del radio.
+     */
+    y: Float64Array;
+}
+
+/**
+ * Calcula la extensión de un arreglo ignorando los NaN.
+ * @param values - Valores numéricos.
+ * @returns [mínimo, máximo], o [NaN, NaN] si no hay valores.
+ */
+export function extentOf(values: ArrayLike<number>): [number, number] {
+    let min = NaN;
+    let max = NaN;
+    for (let i = 0; i < values.length; i++) {
+        const value = values[i];
+        if (value !== value) continue;
+        if (!(value >= min)) min = value;
+        if (!(value <= max)) max = value;
+    }
+    return [min, max];
+}
+
+/**
+ * Filtra las filas con X e Y válidos de un gráfico de dispersión y
+ * codifica su color.
+ * @param args - Columnas X, Y, tamaño y claves de color (estas dos opcionales).
+ * @returns Puntos válidos con sus extensiones.
+ */
+export function scatterPoints(args: {
+    x: Float64Array;
+    y: Float64Array;
+    size: Float64Array | null;
+    hue: Float64Array | null;
+}): ScatterPoints {
+    const { x, y, size, hue } = args;
+    let count = 0;
+    for (let i = 0; i < x.length; i++) {
+        if (x[i] === x[i] && y[i] === y[i]) count++;
+    }
+    const index = new Uint32Array(count);
+    const xs = new Float64Array(count);
+    const ys = new Float64Array(count);
+    const sizes = size ? new Float64Array(count) : null;
+    const hues = hue ? new Uint32Array(count) : null;
+    const categories = new Map<number, number>();
+    const hueFirst: number[] = [];
+    let j = 0;
+    for (let i = 0; i < x.length; i++) {
+        if (x[i] !== x[i] || y[i] !== y[i]) continue;
+        index[j] = i;
+        xs[j] = x[i];
+        ys[j] = y[i];
+        if (sizes) sizes[j] = size![i];
+        if (hues) {
+            const key = hue![i];
+            let code = categories.get(key);
+            if (key !== key) {
+                code = 0xffffffff; // MISSING: las constantes del módulo no llegan al worker
+            } else if (code === undefined) {
+                code = hueFirst.length;
+                categories.set(key, code);
+                hueFirst.push(i);
+            }
+            hues[j] = code;
+        }
+        j++;
+    }
+    const sizeExtent = sizes ? extentOf(sizes) : null;
+    return {
+        index,
+        x: xs,
+        y: ys,
+        size: sizes,
+        hue: hues,
+        hueFirst: Uint32Array.from(hueFirst),
+        xExtent: extentOf(xs),
+        yExtent: extentOf(ys),
+        sizeExtent: sizeExtent && sizeExtent[0] === sizeExtent[0] ? sizeExtent : null,
+    };
+}
+
+/**
+ * Agrupa filas por clave y promedia sus valores.
+ * @param args - Claves numéricas (valores o códigos; NaN si falta) y valores.
+ * @returns Primera fila y promedio de cada grupo.
+ */
+export function groupMeans(args: { keys: Float64Array; values: Float64Array }): GroupMeans {
+    const { keys, values } = args;
+    const groups = new Map<number, number>();
+    const first: number[] = [];
+    const sums: number[] = [];
+    const counts: number[] = [];
+    for (let i = 0; i < keys.length; i++) {
+        const key = keys[i];
+        if (key !== key) continue;
+        let group = groups.get(key);
+        if (group === undefined) {
+            group = first.length;
+            groups.set(key, group);
+            first.push(i);
+            sums.push(0);
+            counts.push(0);
+        }
+        const value = values[i];
+        if (value === value) {
+            sums[group] += value;
+            counts[group]++;
+        }
+    }
+    const means = new Float64Array(first.length);
+    for (let g = 0; g < first.length; g++) {
+        means[g] = counts[g] ? sums[g] / counts[g] : 0;
+    }
+    return { first: Uint32Array.from(first), means };
+}
+
+/**
+ * Normaliza columnas a [0, 1] con su extensión.
+ * @param columns - Valores de cada dimensión.
+ * @param extents - Extensión de cada dimensión; si falta se calcula.
+ * @returns Valores normalizados fila por fila (n × dimensiones).
+ */
+export function normalizeColumns(columns: Float64Array[], extents: ([number, number] | null)[]): Float64Array {
+    const dimensions = columns.length;
+    const length = dimensions ? columns[0].length : 0;
+    const normalized = new Float64Array(length * dimensions);
+    for (let d = 0; d < dimensions; d++) {
+        const column = columns[d];
+        const [min, max] = extents[d] || extentOf(column);
+        const span = max - min;
+        for (let i = 0; i < length; i++) {
+            normalized[i * dimensions + d] = span ? (column[i] - min) / span : 0.5;
+        }
+    }
+    return normalized;
+}
+
+/**
+ * Proyecta valores normalizados con anclas en el plano.
+ * @param normalized - Valores normalizados fila por fila.
+ * @param dimensions - Cantidad de dimensiones.
+ * @param anchors - Coordenadas (x, y) de cada ancla, intercaladas.
+ * @param radial - Si es verdadero (RadViz) divide por la suma de los pesos;
+ *   si no (Star Coordinates) suma los vectores.
+ * @param x - Arreglo donde se escriben las coordenadas X.
+ * @param y - Arreglo donde se escriben las coordenadas Y.
+ */
+export function project(
+    normalized: Float64Array,
+    dimensions: number,
+    anchors: Float64Array,
+    radial: boolean,
+    x: Float64Array,
+    y: Float64Array
+): void {
+    for (let i = 0; i < x.length; i++) {
+        let sum = 0;
+        let px = 0;
+        let py = 0;
+        const offset = i * dimensions;
+        for (let d = 0; d < dimensions; d++) {
+            const w = normalized[offset + d];
+            sum += w;
+            px += w * anchors[2 * d];
+            py += w * anchors[2 * d + 1];
+        }
+        x[i] = radial ? px / sum : px;
+        y[i] = radial ? py / sum : py;
+    }
+}
+
+/**
+ * Normaliza y proyecta las dimensiones de RadViz o Star Coordinates.
+ * @param args - Columnas, extensiones opcionales, anclas y tipo de proyección.
+ * @returns Valores normalizados y coordenadas de cada fila.
+ */
+export function projectPoints(args: {
+    columns: Float64Array[];
+    extents: ([number, number] | null)[];
+    anchors: Float64Array;
+    radial: boolean;
+}): Projection {
+    const { columns, extents, anchors, radial } = args;
+    const length = columns.length ? columns[0].length : 0;
+    const normalized = normalizeColumns(columns, extents);
+    const x = new Float64Array(length);
+    const y = new Float64Array(length);
+    project(normalized, columns.length, anchors, radial, x, y);
+    return { normalized, x, y };
+}
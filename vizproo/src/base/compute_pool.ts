@@ -0,0 +1,356 @@
+import {
+    extentOf,
+    groupMeans,
+    normalizeColumns,
+    project,
+    projectPoints,
+    scatterPoints,
+} from "./compute";
+
+/**
+ * Cálculos que se pueden pedir al pool, por nombre.
+ */
+const KERNELS = { scatterPoints, groupMeans, projectPoints };
+
+/**
+ * Funciones que se copian al código de cada worker: los cálculos y las
+ * auxiliares que usan.
+ */
+const WORKER_FUNCTIONS: ((...args: any[]) => any)[] = [extentOf, normalizeColumns, project, scatterPoints, groupMeans, projectPoints];
+
+/**
+ * Cantidad máxima de workers del pool compartido.
+ */
+const MAX_WORKERS = 4;
+
+/**
+ * Nombre de un cálculo disponible en el pool.
+ */
+export type Kernel = keyof typeof KERNELS;
+
+type KernelArgs<K extends Kernel> = Parameters<(typeof KERNELS)[K]>[0];
+type KernelResult<K extends Kernel> = ReturnType<(typeof KERNELS)[K]>;
+
+/**
+ * Cálculo pendiente o en curso en un worker.
+ */
+interface Task {
+    id: number;
+    kernel: Kernel;
+    args: any;
+    transfer: Transferable[];
+    resolve: (result: any) => void;
+    reject: (error: Error) => void;
+}
+
+/**
+ * Reúne los buffers de los TypedArrays de un valor (hasta dos niveles de
+ * objetos o listas) para transferirlos en lugar de copiarlos.
+ * También se copia al código de los workers para devolver los resultados.
+ * @param value - Argumentos o resultado de un cálculo.
+ * @returns Buffers distintos encontrados.
+ */
+export function transferables(value: any): ArrayBuffer[] {
+    const buffers: ArrayBuffer[] = [];
+    const visit = (item: any, depth: number) => {
+        if (ArrayBuffer.isView(item)) {
+            if (buffers.indexOf(item.buffer as ArrayBuffer) < 0) buffers.push(item.buffer as ArrayBuffer);
+        } else if (item && typeof item === "object" && depth < 2) {
+            Object.keys(item).forEach((key) => visit(item[key], depth + 1));
+        }
+    };
+    visit(value, 0);
+    return buffers;
+}
+
+/**
+ * Arma el código fuente de un worker con las funciones de `compute.ts`.
+ * Se usan los nombres reales de las funciones para que el código siga
+ * siendo válido si el bundle las renombra al minificar.
+ * @returns Código JavaScript del worker.
+ */
+function workerSource(): string {
+    const functions = WORKER_FUNCTIONS.concat([transferables]).map((fn) => fn.toString());
+    const kernels = (Object.keys(KERNELS) as Kernel[]).map((name) => `${JSON.stringify(name)}: ${KERNELS[name].name}`);
+    return `${functions.join("\n")}
+const kernels = { ${kernels.join(", ")} };
+self.onmessage = function (event) {
+    const { id, kernel, args } = event.data;
+    let result;
+    try {
+        result = kernels[kernel](args);
+    } catch (error) {
+        self.postMessage({ id, error: String(error) });
+        return;
+    }
+    self.postMessage({ id, result }, ${transferables.name}(result));
+};
+`;
+}
+
+/**
+ * Pool de Web Workers para los cálculos de los gráficos.
+ * Los workers se crean a demanda desde un Blob URL (sin archivos extra en
+ * el bundle) y reciben las columnas como buffers transferibles, de modo
+ * que el hilo principal solo arma los argumentos y dibuja. Si el navegador
+ * no permite workers (por ejemplo por su política de seguridad) los
+ * cálculos se ejecutan en el hilo principal.
+ */
+export class ComputePool {
+    /**
+     * Cantidad máxima de workers.
+     */
+    readonly size: number;
+    /**
+     * URL del código de los workers, creada con el primero.
+     */
+    private url: string | null = null;
+    /**
+     * Workers creados.
+     */
+    private workers: Worker[] = [];
+    /**
+     * Workers sin cálculo en curso.
+     */
+    private idle: Worker[] = [];
+    /**
+     * Cálculo en curso de cada worker.
+     */
+    private running = new Map<Worker, Task>();
+    /**
+     * Cálculos esperando un worker libre.
+     */
+    private queue: Task[] = [];
+    /**
+     * Identificador del próximo cálculo.
+     */
+    private nextId = 0;
+    /**
+     * Si los workers fallaron y los cálculos se hacen en el hilo principal.
+     */
+    private disabled = false;
+
+    /**
+     * Crea un pool vacío.
+     * @param size - Cantidad máxima de workers.
+     */
+    constructor(size: number) {
+        this.size = Math.max(1, size);
+    }
+
+    /**
+     * Ejecuta un cálculo en un worker libre, o lo encola.
+     * @param kernel - Nombre del cálculo.
+     * @param args - Argumentos del cálculo.
+     * @param transfer - Buffers de `args` que se transfieren al worker; quedan
+     *   inutilizables en el hilo principal.
+     * @returns Resultado del cálculo.
+     */
+    run<K extends Kernel>(kernel: K, args: KernelArgs<K>, transfer: Transferable[] = []): Promise<KernelResult<K>> {
+        return new Promise((resolve, reject) => {
+            const task: Task = { id: this.nextId++, kernel, args, transfer, resolve, reject };
+            if (!this.available()) {
+                this.runInline(task);
+                return;
+            }
+            this.queue.push(task);
+            this.dispatch();
+        });
+    }
+
+    /**
+     * Termina los workers del pool.
+     */
+    terminate(): void {
+        this.workers.forEach((worker) => worker.terminate());
+        this.running.forEach((task) => task.reject(new Error("Compute pool terminated")));
+        this.workers = [];
+        this.idle = [];
+        this.running.clear();
+        if (this.url) URL.revokeObjectURL(this.url);
+        this.url = null;
+    }
+
+    /**
+     * Indica si se pueden usar workers.
+     */
+    private available(): boolean {
+        return !this.disabled && typeof Worker !== "undefined" && typeof URL.createObjectURL === "function";
+    }
+
+    /**
+     * Asigna los cálculos encolados a los workers libres.
+     */
+    private dispatch(): void {
+        while (this.queue.length) {
+            const worker = this.idle.pop() || this.spawn();
+            if (!worker) return;
+            const task = this.queue.shift()!;
+            this.running.set(worker, task);
+            worker.postMessage({ id: task.id, kernel: task.kernel, args: task.args }, task.transfer);
+        }
+    }
+
+    /**
+     * Crea un worker si el pool no está lleno.
+     * @returns Worker nuevo, o null si no se puede crear.
+     */
+    private spawn(): Worker | null {
+        if (this.disabled || this.workers.length >= this.size) return null;
+        let worker: Worker;
+        try {
+            if (!this.url) {
+                this.url = URL.createObjectURL(new Blob([workerSource()], { type: "text/javascript" }));
+            }
+            worker = new Worker(this.url);
+        } catch (err) {
+            this.fail(err);
+            return null;
+        }
+        worker.onmessage = (event: MessageEvent) => this.finish(worker, event.data);
+        worker.onerror = (event: ErrorEvent) => {
+            event.preventDefault();
+            this.fail(event.message || "Compute worker failed");
+        };
+        this.workers.push(worker);
+        return worker;
+    }
+
+    /**
+     * Entrega el resultado de un worker y le asigna el siguiente cálculo.
+     * @param worker - Worker que terminó.
+     * @param message - Resultado o error del cálculo.
+     */
+    private finish(worker: Worker, message: { id: number; result?: any; error?: string }): void {
+        const task = this.running.get(worker);
+        this.running.delete(worker);
+        this.idle.push(worker);
+        if (task && task.id === message.id) {
+            if (message.error !== undefined) task.reject(new Error(message.error));
+            else task.resolve(message.result);
+        }
+        this.dispatch();
+    }
+
+    /**
+     * Desactiva los workers cuando no se pueden cargar. Los cálculos en curso
+     * se rechazan (sus buffers ya se transfirieron) y los encolados se
+     * ejecutan en el hilo principal.
+     * @param reason - Causa del fallo.
+     */
+    private fail(reason: unknown): void {
+        this.disabled = true;
+        this.terminate();
+        const queued = this.queue;
+        this.queue = [];
+        queued.forEach((task) => this.runInline(task));
+        console.log(`vizproo: computing on the main thread (${reason})`);
+    }
+
+    /**
+     * Ejecuta un cálculo en el hilo principal.
+     * @param task - Cálculo a ejecutar.
+     */
+    private runInline(task: Task): void {
+        try {
+            task.resolve((KERNELS[task.kernel] as (args: any) => any)(task.args));
+        } catch (err) {
+            task.reject(err instanceof Error ? err : new Error(String(err)));
+        }
+    }
+}
+
+/**
+ * Pool compartido por todos los gráficos, creado al primer uso.
+ */
+let sharedPool: ComputePool | null = null;
+
+/**
+ * Devuelve el pool de workers compartido.
+ * Usa un worker menos que los núcleos disponibles (al menos uno) para no
+ * competir con el hilo principal.
+ * @returns Pool compartido.
+ */
+export function computePool(): ComputePool {
+    if (!sharedPool) {
+        const cores = (typeof navigator !== "undefined" && navigator.hardwareConcurrency) || 2;
+        sharedPool = new ComputePool(Math.min(MAX_WORKERS, cores - 1));
+    }
+    return sharedPool;
+}
+
+/**
+ * Ejecuta un cálculo en el pool compartido transfiriendo todos los
+ * TypedArrays de sus argumentos. Si el worker falla (por ejemplo porque no
+ * se pudo cargar) los argumentos, ya transferidos, se vuelven a armar y el
+ * cálculo se repite en el hilo principal.
+ * @param kernel - Nombre del cálculo.
+ * @param args - Arma los argumentos con copias propias de las columnas.
+ * @returns Resultado del cálculo.
+ */
+export function compute<K extends Kernel>(kernel: K, args: () => KernelArgs<K>): Promise<KernelResult<K>> {
+    const pool = computePool();
+    const first = args();
+    return pool.run(kernel, first, transferables(first)).catch(() => pool.run(kernel, args()));
+}
+
+/**
+ * Convierte una columna de registros en números, con NaN en los faltantes.
+ * Se usa cuando el gráfico recibe filas en lugar de una tabla (por ejemplo
+ * los paneles de `FacetGrid`).
+ * @param data - Registros.
+ * @param name - Columna a convertir.
+ * @returns Valores numéricos.
+ */
+export function recordNumbers(data: any[], name: string): Float64Array {
+    const numbers = new Float64Array(data.length);
+    for (let i = 0; i < data.length; i++) {
+        const value = data[i][name];
+        if (typeof value === "number") numbers[i] = value;
+        else if (typeof value === "boolean") numbers[i] = value ? 1 : 0;
+        else if (value instanceof Date) numbers[i] = value.getTime();
+        else numbers[i] = Number.parseFloat(value);
+    }
+    return numbers;
+}
+
+/**
+ * Convierte una columna de registros en claves numéricas para agrupar,
+ * asignando un código a cada texto distinto; los faltantes quedan como NaN.
+ * @param data - Registros.
+ * @param name - Columna a convertir.
+ * @returns Código de cada fila.
+ */
+export function recordKeys(data: any[], name: string): Float64Array {
+    const codes = new Map<string, number>();
+    const keys = new Float64Array(data.length);
+    for (let i = 0; i < data.length; i++) {
+        const value = data[i][name];
+        if (value === null || value === undefined) {
+            keys[i] = NaN;
+            continue;
+        }
+        const text = String(value);
+        let code = codes.get(text);
+        if (code === undefined) {
+            code = codes.size;
+            codes.set(text, code);
+        }
+        keys[i] = code;
+    }
+    return keys;
+}
+
+/**
+ * Intercala las coordenadas de las anclas de una proyección (x0, y0, x1, ...).
+ * @param anchors - Anclas con coordenadas unitarias.
+ * @returns Coordenadas para `projectPoints` y `project`.
+ */
+export function anchorCoordinates(anchors: { x: number; y: number }[]): Float64Array {
+    const coordinates = new Float64Array(anchors.length * 2);
+    anchors.forEach((anchor, i) => {
+        coordinates[2 * i] = anchor.x;
+        coordinates[2 * i + 1] = anchor.y;
+    });
+    return coordinates;
+}
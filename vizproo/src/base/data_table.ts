@@ -0,0 +1,424 @@
+import { WidgetModel, put_buffers } from "@jupyter-widgets/base";
+
+/**
+ * Codificación de una columna en el envío desde Python.
+ * - `number`: TypedArray numérico.
+ * - `bool`: un byte por valor.
+ * - `datetime`: milisegundos int64 desde la época.
+ * - `dictionary`: códigos enteros sobre una lista de valores distintos.
+ * - `list`: lista JSON sin codificar.
+ */
+export type ColumnKind = "number" | "bool" | "datetime" | "dictionary" | "list";
+
+/**
+ * Columna tal como llega desde Python: buffer binario o lista JSON.
+ */
+export interface ColumnPayload {
+    name: string;
+    kind: ColumnKind;
+    dtype?: string;
+    data: DataView | any[];
+    validity?: DataView;
+    dictionary?: any[];
+    compression?: "deflate";
+    /**
+     * Índices (uint32) de las filas que reemplaza un parche; si falta, la
+     * columna viaja completa.
+     */
+    rows?: DataView;
+}
+
+/**
+ * Estado serializado de una tabla columnar.
+ */
+export interface TablePayload {
+    length: number;
+    columns: ColumnPayload[];
+}
+
+/**
+ * Estadísticos de escala de una columna numérica calculados en Python.
+ */
+export interface ColumnDomain {
+    min: number;
+    max: number;
+    /**
+     * Dominio redondeado como `scale.nice()` de d3.
+     */
+    nice: [number, number];
+    /**
+     * Cuantiles 5, 25, 50, 75 y 95.
+     */
+    quantiles: number[];
+}
+
+/**
+ * Extensión [mínimo, máximo] de un dominio calculado en Python.
+ * @param domain - Dominio de la columna, si existe.
+ * @returns Extensión o undefined si la columna no es numérica.
+ */
+export function domainExtent(domain: ColumnDomain | undefined): [number, number] | undefined {
+    return domain ? [domain.min, domain.max] : undefined;
+}
+
+/**
+ * Constructores de TypedArray según el dtype enviado por Python.
+ */
+const TYPED_ARRAYS: Record<string, any> = {
+    float64: Float64Array,
+    float32: Float32Array,
+    int32: Int32Array,
+    int16: Int16Array,
+    int8: Int8Array,
+    uint32: Uint32Array,
+    uint16: Uint16Array,
+    uint8: Uint8Array,
+};
+
+/**
+ * Cifras significativas con que Python garantiza los valores float32
+ * (`_FLOAT32_DIGITS` en columns.py).
+ */
+const FLOAT32_DIGITS = 6;
+
+/**
+ * Columna decodificada de una tabla.
+ * Los valores se mantienen en su forma compacta (TypedArray o códigos) y
+ * se convierten a valores de JavaScript solo al leerlos.
+ */
+export class Column {
+    /**
+     * Codificación de la columna.
+     */
+    readonly kind: ColumnKind;
+    /**
+     * Valores crudos: números, códigos o lista JSON.
+     */
+    readonly values: ArrayLike<any>;
+    /**
+     * Mapa de bits de validez (1 si el valor existe), o null si no hay faltantes.
+     */
+    readonly validity: Uint8Array | null;
+    /**
+     * Valores distintos de una columna `dictionary`.
+     */
+    readonly dictionary: any[] | null;
+    /**
+     * Si los valores viajaron como float32 y deben redondearse al leerlos.
+     */
+    private readonly float32: boolean;
+
+    constructor(kind: ColumnKind, values: ArrayLike<any>, validity: Uint8Array | null = null, dictionary: any[] | null = null) {
+        this.kind = kind;
+        this.values = values;
+        this.validity = validity;
+        this.dictionary = dictionary;
+        this.float32 = values instanceof Float32Array;
+    }
+
+    /**
+     * Indica si la fila tiene valor.
+     * @param index - Índice de la fila.
+     */
+    isValid(index: number): boolean {
+        return !this.validity || ((this.validity[index >> 3] >> (index & 7)) & 1) === 1;
+    }
+
+    /**
+     * Devuelve el valor de una fila como valor de JavaScript.
+     * @param index - Índice de la fila.
+     * @returns Valor decodificado, o null si falta.
+     */
+    get(index: number): any {
+        if (!this.isValid(index)) return null;
+        const value = this.values[index];
+        switch (this.kind) {
+            case "bool":
+                return value === 1;
+            case "datetime":
+                return new Date(value);
+            case "dictionary":
+                return this.dictionary![value];
+            default:
+                return this.float32 ? parseFloat(value.toPrecision(FLOAT32_DIGITS)) : value;
+        }
+    }
+
+    /**
+     * Copia los valores como números para los cálculos de `compute.ts`.
+     * Las fechas quedan en milisegundos, los booleanos en 0/1 y el texto se
+     * interpreta con `parseFloat`; los faltantes quedan como NaN.
+     * @returns Copia nueva, transferible a un worker.
+     */
+    numbers(): Float64Array {
+        const values = this.values;
+        const numbers = new Float64Array(values.length);
+        const text = this.kind === "dictionary" || this.kind === "list";
+        for (let i = 0; i < values.length; i++) {
+            if (!this.isValid(i)) numbers[i] = NaN;
+            else if (text) numbers[i] = Number.parseFloat(this.kind === "dictionary" ? this.dictionary![values[i]] : values[i]);
+            else numbers[i] = values[i];
+        }
+        return numbers;
+    }
+
+    /**
+     * Copia los valores como claves numéricas para agrupar: los códigos de
+     * una columna `dictionary`, los valores de las columnas numéricas y
+     * códigos por texto en las columnas `list`. Los faltantes quedan como NaN.
+     * @returns Copia nueva, transferible a un worker.
+     */
+    keys(): Float64Array {
+        if (this.kind !== "list") return this.kind === "dictionary" ? this.codes() : this.numbers();
+        const codes = new Map<string, number>();
+        const keys = new Float64Array(this.values.length);
+        for (let i = 0; i < keys.length; i++) {
+            const value = this.get(i);
+            if (value === null) {
+                keys[i] = NaN;
+                continue;
+            }
+            const text = String(value);
+            let code = codes.get(text);
+            if (code === undefined) {
+                code = codes.size;
+                codes.set(text, code);
+            }
+            keys[i] = code;
+        }
+        return keys;
+    }
+
+    /**
+     * Copia los códigos de una columna `dictionary`, con NaN en los faltantes.
+     */
+    private codes(): Float64Array {
+        const codes = new Float64Array(this.values.length);
+        for (let i = 0; i < codes.length; i++) {
+            codes[i] = this.isValid(i) ? this.values[i] : NaN;
+        }
+        return codes;
+    }
+
+    /**
+     * Crea una copia de la columna con algunas filas reemplazadas.
+     * @param rows - Índices de las filas cambiadas.
+     * @param update - Valores nuevos de esas filas, en el mismo orden, con el
+     *   mapa de validez de la columna completa.
+     * @returns Columna actualizada.
+     */
+    patch(rows: ArrayLike<number>, update: Column): Column {
+        const values = (this.values as any).slice();
+        for (let i = 0; i < rows.length; i++) {
+            values[rows[i]] = update.values[i];
+        }
+        return new Column(this.kind, values, update.validity, this.dictionary);
+    }
+}
+
+/**
+ * Tabla columnar inmutable compartida por las vistas de un modelo.
+ * Las filas como objetos solo se construyen cuando se solicitan y se
+ * memorizan para no repetir el trabajo en cada replot.
+ */
+export class DataTable {
+    /**
+     * Cantidad de filas.
+     */
+    readonly length: number;
+    /**
+     * Columnas por nombre.
+     */
+    readonly columns: Map<string, Column>;
+    /**
+     * Filas materializadas, construidas la primera vez que se piden.
+     */
+    private rows: any[] | null = null;
+
+    constructor(length: number, columns: Map<string, Column>) {
+        this.length = length;
+        this.columns = columns;
+    }
+
+    /**
+     * Tabla vacía usada como valor por defecto de los modelos.
+     */
+    static empty(): DataTable {
+        return new DataTable(0, new Map());
+    }
+
+    /**
+     * Nombres de las columnas disponibles.
+     */
+    get names(): string[] {
+        return Array.from(this.columns.keys());
+    }
+
+    /**
+     * Devuelve una columna.
+     * @param name - Nombre de la columna.
+     * @returns Columna o undefined si no existe.
+     */
+    column(name: string): Column | undefined {
+        return this.columns.get(name);
+    }
+
+    /**
+     * Devuelve las filas como objetos (formato de registros).
+     * @returns Lista de registros (memorizada).
+     */
+    records(): any[] {
+        if (this.rows) return this.rows;
+        const names = this.names;
+        const columns = names.map((name) => this.columns.get(name)!);
+        const rows = new Array(this.length);
+        for (let i = 0; i < this.length; i++) {
+            const row: any = {};
+            for (let j = 0; j < names.length; j++) {
+                row[names[j]] = columns[j].get(i);
+            }
+            rows[i] = row;
+        }
+        this.rows = rows;
+        return rows;
+    }
+
+    /**
+     * Devuelve una fila como objeto sin materializar la tabla completa.
+     * @param index - Índice de la fila.
+     * @returns Registro de la fila (el memorizado si ya se pidieron los registros).
+     */
+    row(index: number): any {
+        if (this.rows) return this.rows[index];
+        const row: any = {};
+        this.columns.forEach((column, name) => {
+            row[name] = column.get(index);
+        });
+        return row;
+    }
+
+    /**
+     * Crea una nueva tabla con columnas adicionales, conservando las actuales.
+     * @param added - Columnas decodificadas por nombre.
+     * @returns Nueva tabla con las columnas agregadas.
+     */
+    extend(added: Map<string, Column>): DataTable {
+        const columns = new Map(this.columns);
+        added.forEach((column, name) => columns.set(name, column));
+        return new DataTable(this.length, columns);
+    }
+}
+
+/**
+ * Convierte un DataView en el TypedArray correspondiente sin copiar,
+ * salvo que el buffer no esté alineado al tamaño del elemento.
+ * @param view - Buffer recibido desde el kernel.
+ * @param dtype - Tipo de dato enviado por Python.
+ * @returns TypedArray con los valores de la columna.
+ */
+function toTypedArray(view: DataView, dtype: string): ArrayLike<number> {
+    const ctor = TYPED_ARRAYS[dtype];
+    const size = ctor.BYTES_PER_ELEMENT;
+    if (view.byteOffset % size === 0) {
+        return new ctor(view.buffer, view.byteOffset, view.byteLength / size);
+    }
+    const copy = view.buffer.slice(view.byteOffset, view.byteOffset + view.byteLength);
+    return new ctor(copy);
+}
+
+/**
+ * Lee un buffer de int64 little-endian como milisegundos.
+ * Las fechas quedan muy por debajo de 2^53, por lo que la conversión a
+ * número es exacta.
+ * @param view - Buffer recibido desde el kernel.
+ * @returns Milisegundos desde la época.
+ */
+function int64ToNumbers(view: DataView): Float64Array {
+    const values = new Float64Array(view.byteLength / 8);
+    for (let i = 0; i < values.length; i++) {
+        const offset = i * 8;
+        values[i] = view.getInt32(offset + 4, true) * 4294967296 + view.getUint32(offset, true);
+    }
+    return values;
+}
+
+/**
+ * Descomprime un buffer deflate (zlib) con la API de streams del navegador.
+ * @param view - Buffer comprimido.
+ * @returns Buffer descomprimido.
+ */
+async function inflate(view: DataView): Promise<DataView> {
+    const stream = new Blob([view]).stream().pipeThrough(new DecompressionStream("deflate"));
+    return new DataView(await new Response(stream).arrayBuffer());
+}
+
+/**
+ * Decodifica una columna serializada por Python.
+ * @param payload - Columna recibida desde Python.
+ * @returns Columna lista para leerse.
+ */
+async function decodeColumn(payload: ColumnPayload): Promise<Column> {
+    if (payload.compression === "deflate" && payload.data instanceof DataView) {
+        payload = { ...payload, data: await inflate(payload.data), compression: undefined };
+    }
+    const validity = payload.validity
+        ? new Uint8Array(payload.validity.buffer, payload.validity.byteOffset, payload.validity.byteLength)
+        : null;
+    const dictionary = payload.dictionary || null;
+    if (!(payload.data instanceof DataView)) {
+        return new Column(payload.kind, payload.data, validity, dictionary);
+    }
+    const values = payload.kind === "datetime"
+        ? int64ToNumbers(payload.data)
+        : toTypedArray(payload.data, payload.dtype!);
+    return new Column(payload.kind, values, validity, dictionary);
+}
+
+/**
+ * Decodifica un conjunto de columnas, descomprimiéndolas en paralelo.
+ * @param payloads - Columnas recibidas desde Python.
+ * @returns Columnas decodificadas por nombre.
+ */
+async function decodeColumns(payloads: ColumnPayload[]): Promise<Map<string, Column>> {
+    const decoded = await Promise.all(payloads.map(decodeColumn));
+    const columns = new Map<string, Column>();
+    payloads.forEach((payload, i) => columns.set(payload.name, decoded[i]));
+    return columns;
+}
+
+/**
+ * Deserializa el estado columnar enviado por Python.
+ * Es asíncrono porque las columnas pueden llegar comprimidas.
+ * @param payload - Estado serializado de la tabla.
+ * @returns Tabla columnar lista para usarse en las vistas.
+ */
+export async function deserializeTable(payload: TablePayload | null): Promise<DataTable> {
+    if (!payload || !payload.columns) return DataTable.empty();
+    return new DataTable(payload.length, await decodeColumns(payload.columns));
+}
+
+/**
+ * Atiende los mensajes con columnas enviados por Python:
+ * - `add_columns`: columnas que un gráfico pasa a necesitar.
+ * - `patch_columns`: columnas que cambiaron al reasignar los datos; las que
+ *   traen `rows` solo reemplazan esas filas.
+ * @param model - Modelo dueño del trait `dataColumns`.
+ * @param content - Contenido del mensaje.
+ * @param buffers - Buffers binarios del mensaje.
+ */
+export function handleColumnsMessage(model: WidgetModel, content: any, buffers: (ArrayBuffer | DataView)[]): void {
+    if (!content || (content.event !== "add_columns" && content.event !== "patch_columns")) return;
+    put_buffers(content, content.buffer_paths, buffers);
+    const payloads: ColumnPayload[] = content.columns;
+    decodeColumns(payloads).then((columns) => {
+        const table: DataTable = model.get("dataColumns");
+        payloads.forEach((payload) => {
+            const current = table.column(payload.name);
+            if (payload.rows && current) {
+                const rows = toTypedArray(payload.rows, "uint32");
+                columns.set(payload.name, current.patch(rows, columns.get(payload.name)!));
+            }
+        });
+        model.set("dataColumns", table.extend(columns));
+    });
+}
@@ -0,0 +1,51 @@
+import { IBackboneModelOptions, ISerializers, WidgetModel } from "@jupyter-widgets/base";
+import { BaseModel } from "./base";
+import { DataTable, deserializeTable, handleColumnsMessage } from "./data_table";
+
+/**
+ * Modelo de un conjunto de datos compartido.
+ * No tiene vista: los gráficos y controles lo referencian mediante su
+ * trait `dataset`, por lo que la tabla se recibe y deserializa una sola vez
+ * y la misma `DataTable` es usada por todas las vistas.
+ */
+export class DatasetModel extends WidgetModel {
+  /**
+   * Valores por defecto del modelo.
+   */
+  defaults() {
+    return {
+      ...super.defaults(),
+      _model_name: DatasetModel.model_name,
+      _model_module: BaseModel.model_module,
+      _model_module_version: BaseModel.model_module_version,
+      _view_name: null,
+      _view_module: null,
+      _view_module_version: "",
+      dataColumns: DataTable.empty(),
+      domains: {},
+    };
+  }
+
+  /**
+   * Escucha los mensajes con columnas adicionales enviados por Python.
+   * @param attributes - Atributos iniciales del modelo.
+   * @param options - Opciones de Backbone del modelo.
+   */
+  initialize(attributes: any, options: IBackboneModelOptions) {
+    super.initialize(attributes, options);
+    this.on("msg:custom", (content: any, buffers: any) => handleColumnsMessage(this, content, buffers), this);
+  }
+
+  /**
+   * Serializadores del modelo: `dataColumns` llega en formato columnar.
+   */
+  static serializers: ISerializers = {
+    ...WidgetModel.serializers,
+    dataColumns: { deserialize: deserializeTable },
+  };
+
+  /**
+   * Nombre de la clase de modelo.
+   */
+  public static readonly model_name = "DatasetModel";
+}
@@ -0,0 +1,7 @@
+// Copyright (c) MATIUS
+// Distributed under the terms of the Modified BSD License.
+
+/**
+ * Exports the shared data models.
+ */
+export { DatasetModel } from "./base/dataset";
@@ -5,3 +5,7 @@ export { BarPlotModel, BarPlotView } from "./graphs/barplot";
 export { ScatterPlotModel, ScatterPlotView } from "./graphs/scatterplot";
 export { RadVizModel, RadVizView } from "./graphs/radviz";
 export { StarCoordinatesModel, StarCoordinatesView } from "./graphs/starcoordinates";
+export { FacetGridModel, FacetGridView } from "./graphs/facetgrid";
+export { LineChartModel, LineChartView } from "./graphs/linechart";
+export { HexbinPlotModel, HexbinPlotView } from "./graphs/hexbinplot";
+export { ScatterMatrixModel, ScatterMatrixView } from "./graphs/scattermatrix";
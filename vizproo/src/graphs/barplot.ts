@@ -1,6 +1,8 @@
 import * as d3 from "d3";
 import { BasePlot } from "./baseplot";
-import { BaseModel, BaseView } from "../base/base";
+import { DataModel, BaseView } from "../base/base";
+import { groupMeans } from "../base/compute";
+import { compute, recordKeys, recordNumbers } from "../base/compute_pool";
 import { 
     ClickSelectButton,   
     BoxSelectButton,
@@ -10,7 +12,6 @@ import {
  
 import { 
         BarPlotParams,
-        AggregatedValues,
         ProcessedDataRow,
         ScaleConfig
     } from "./interface";
@@ -20,56 +21,14 @@ import {
  * Soporta orientación vertical/horizontal, selección por clic/caja y barra lateral.
  */
 export class BarPlot extends BasePlot {
-    /**
-     * Normaliza datos según la orientación (vertical/horizontal).
-     * @param direction - Dirección del gráfico ('vertical' | 'horizontal').
-     * @param xValue - Nombre de la columna para el eje X.
-     * @param yValue - Nombre de la columna para el eje Y.
-     * @param data - Datos originales.
-     * @returns Datos con claves auxiliares x_ y y_ además de un id.
-     */
-    private verifyDirection(direction: string, xValue: string, yValue: string, data: any[]): any[] {
-        if (direction === 'vertical') {
-            return data.map((item, index) => ({
-                ...item,
-                x_: item[xValue],
-                y_: item[yValue],
-                id: index
-            }));
-        } else {
-            return data.map((item, index) => ({
-                ...item,
-                x_: item[yValue],
-                y_: item[xValue],
-                id: index
-            }));
-        }
-    }
-
-    /**
-     * Obtiene todos los valores únicos del atributo hue como strings.
-     * @param RenamedData - Datos normalizados.
-     * @param hue_value - Nombre del atributo usado para color.
-     * @returns Lista de categorías únicas para el color.
-     */
-    private get_all_hues(RenamedData: any[], hue_value: string): string[] {
-        return RenamedData.reduce((all, row) => {
-            const hueValueAsString = String(row[hue_value]);
-            if (!all.includes(hueValueAsString)) {
-                all.push(hueValueAsString);
-            }
-            return all;
-        }, [] as string[]);
-    }
-
     /**
      * Renderiza el gráfico de barras y configura herramientas de selección.
      * @param params - Datos, mapeos, orientación, dimensiones y callbacks.
      */
     plot(params: BarPlotParams): void {
-        const { data, xValue, yValue, hue, setSelectedValues, direction, height, noAxes, noSideBar } = params;
+        const { data, xValue, yValue, hue, setSelectedValues, direction, height, noAxes, noSideBar, groupDomain, valueDomain, hueDomain } = params;
         let width = params.width;
-        let clickSelectButton: ClickSelectButton<SVGRectElement> | null = null;
+        let clickSelectButton: ClickSelectButton<SVGRectElement> | null = params.clickSelectButton ?? null;
         let boxSelectButton: BoxSelectButton<SVGRectElement> | null = null;
         let deselectAllButton: DeselectAllButton | null = null;
         
@@ -89,7 +48,7 @@ export class BarPlot extends BasePlot {
                 const selectedData = GG.selectAll(".bar.selected").data();
                 // Filtrar los atributos internos antes de guardar
                 const cleanedData = selectedData.map((d: any) => {
-                    const { x_, y_, id, originalData, allOriginalData, ...rest } = d;
+                    const { x_, y_, id, originalData, ...rest } = d;
                     return rest;
                 });
                 setSelectedValues(cleanedData);
@@ -103,14 +62,21 @@ export class BarPlot extends BasePlot {
             }
         };
         const isVertical = direction === 'vertical';
+        const groupKey = isVertical ? xValue : yValue;
+        const valueKey = isVertical ? yValue : xValue;
 
-        const RenamedData = this.verifyDirection(direction, xValue, yValue, data);
+        // Promedios por grupo: calculados en un worker por la vista o aquí a partir de los registros
+        const means = params.groups ?? groupMeans({
+            keys: recordKeys(data, groupKey),
+            values: recordNumbers(data, valueKey),
+        });
+        const labels = Array.from(means.first, (row) => String(data[row][groupKey]));
 
         let hue_value: string;
         if (hue) hue_value = hue;
         else hue_value = 'x_';
 
-        const allHues = this.get_all_hues(RenamedData, hue_value);
+        const allHues = hueDomain ?? labels;
 
         if (hue_value === 'x_') {
             createSingleBars(this);
@@ -121,44 +87,22 @@ export class BarPlot extends BasePlot {
          * @param plot - Instancia del gráfico.
          */
         function createSingleBars(plot: BarPlot){
-            // Agrega por categoría: suma y cuenta
-            const agg: Record<string, AggregatedValues & { rows: any[] }> = {};
-            for (const row of RenamedData) {
-                const x = String(row.x_);
-                const y = Number(row.y_);
-                if (agg[x]) {
-                    agg[x].sum += y;
-                    agg[x].count += 1;
-                    agg[x].rows.push(row);
-                } else {
-                    agg[x] = { sum: y, count: 1, rows: [row] };
-                }
-            }
-
-            const processedData: ProcessedDataRow[] = Object.keys(agg).map((key, index) => {
-                const aggregatedGroup = agg[key];
-                const firstRow = aggregatedGroup.rows[0];
-                
-                // Crear el objeto procesado manteniendo todos los atributos originales
-                const { x_, y_, id, ...originalAttributes } = firstRow;
-                
-                const processedRow: ProcessedDataRow = {
-                    ...originalAttributes, // Primero todos los atributos originales
+            const processedData: ProcessedDataRow[] = labels.map((key, index) => {
+                const firstRow = data[means.first[index]];
+                return {
+                    ...firstRow, // Primero todos los atributos originales
                     id: index,
                     x_: key,
-                    y_: aggregatedGroup.sum / aggregatedGroup.count,
+                    y_: means.means[index],
                     originalData: firstRow,
-                    allOriginalData: aggregatedGroup.rows,
                 };
-                
-                return processedRow;
             });
             
-            const groups: string[] = processedData
+            const groups: string[] = groupDomain ?? processedData
                 .map((r) => r.x_)
                 .sort((a, b) => a.localeCompare(b));
 
-            const side_domain: [number, number] = [
+            const side_domain: [number, number] = valueDomain ? [...valueDomain] as [number, number] : [
                 d3.min(processedData, (d) => d.y_) ?? 0,
                 d3.max(processedData, (d) => d.y_) ?? 0,
             ];
@@ -269,7 +213,7 @@ export class BarPlot extends BasePlot {
  * Modelo para BarPlot.
  * Define propiedades reactivas: datos, mapeos, orientación y valores seleccionados.
  */
-export class BarPlotModel extends BaseModel {
+export class BarPlotModel extends DataModel {
   /**
    * Valores por defecto del modelo.
    */
@@ -278,12 +222,12 @@ export class BarPlotModel extends BaseModel {
         ...super.defaults(),
         _model_name: BarPlotModel.model_name,
         _view_name: BarPlotModel.view_name,
-
-        dataRecords: [],
         direction: String,
         x: String,
         y: String,
         hue: String,
+        groupDomain: [],
+        valueDomain: [],
         elementId: String,
         selectedValuesRecords: [],
     };
@@ -306,9 +250,10 @@ export class BarPlotView extends BaseView<BarPlot> {
      * @returns Parámetros de renderizado para el gráfico de barras.
      */
     params(): BarPlotParams {
-
+        const groupDomain: string[] = this.model.get("groupDomain");
+        const valueDomain: number[] = this.model.get("valueDomain");
         return {
-            data: this.model.get("dataRecords"),
+            data: (this.model as DataModel).table().records(),
             xValue: this.model.get("x"),
             yValue: this.model.get("y"),
             hue: this.model.get("hue"),
@@ -318,9 +263,30 @@ export class BarPlotView extends BaseView<BarPlot> {
             height: this.height,
             noAxes: false,
             noSideBar: false,
+            groupDomain: groupDomain.length ? groupDomain : undefined,
+            valueDomain: valueDomain.length === 2 ? [valueDomain[0], valueDomain[1]] : undefined,
         };
     }
 
+    /**
+     * Calcula en un worker los promedios por grupo, reutilizándolos mientras
+     * la tabla, las columnas y la orientación no cambien.
+     * @param params - Parámetros obtenidos con `params()`.
+     * @returns Parámetros con los promedios calculados.
+     */
+    async prepare(params: BarPlotParams): Promise<BarPlotParams> {
+        const isVertical = params.direction === 'vertical';
+        const table = (this.model as DataModel).table();
+        const keys = table.column(isVertical ? params.xValue : params.yValue);
+        const values = table.column(isVertical ? params.yValue : params.xValue);
+        if (!keys || !values) return params;
+        const groups = await this.reuse([table, params.xValue, params.yValue, params.direction], () => compute("groupMeans", () => ({
+            keys: keys.keys(),
+            values: values.numbers(),
+        })));
+        return { ...params, groups };
+    }
+
     /**
      * Inicializa el widget, conecta listeners de cambios y renderiza.
      * @param element - Elemento contenedor del widget.
@@ -328,14 +294,15 @@ export class BarPlotView extends BaseView<BarPlot> {
     plot(element: HTMLElement) {
         this.widget = new BarPlot(element);
 
-        this.model.on("change:dataRecords", () => this.replot(), this);
+        this.model.on("change:dataColumns", () => this.replot(), this);
+        this.model.on("change:groupDomain", () => this.replot(), this);
         this.model.on("change:x", () => this.replot(), this);
         this.model.on("change:y", () => this.replot(), this);
         this.model.on("change:hue", () => this.replot(), this);
         this.model.on("change:direction", () => this.replot(), this);
         window.addEventListener("resize", () => this.replot());
 
-        this.widget.plot(this.params());
+        this.draw((params) => this.widget.plot(params));
     }
 
     /**
@@ -0,0 +1,286 @@
+import * as d3 from "d3";
+import { BaseWidget } from "../base/base_widget";
+import { DataModel, BaseView } from "../base/base";
+import { domainExtent } from "../base/data_table";
+import { ScatterPlot } from "./scatterplot";
+import { BarPlot } from "./barplot";
+import {
+    ClickSelectButton,
+    DeselectAllButton,
+    SideBar
+} from "./tools/tools";
+
+import { FacetGridParams } from "./interface";
+
+/**
+ * Alto reservado para el título de cada panel.
+ */
+const FACET_TITLE_HEIGHT = 18;
+
+/**
+ * Rejilla de gráficos pequeños (small multiples), uno por valor de faceta.
+ * Todos los paneles se dibujan en una sola vista, comparten escalas y una
+ * única barra lateral de herramientas.
+ */
+export class FacetGrid extends BaseWidget {
+    /**
+     * Obtiene los valores distintos de una columna como strings.
+     * @param data - Registros de datos.
+     * @param column - Nombre de la columna.
+     * @returns Valores únicos en orden de aparición.
+     */
+    private uniqueStrings(data: any[], column: string): string[] {
+        const values = new Set<string>();
+        for (const row of data) {
+            const value = row[column];
+            if (value !== undefined && value !== null) values.add(String(value));
+        }
+        return Array.from(values);
+    }
+
+    /**
+     * Calcula una extensión numérica sobre todas las filas.
+     * @param data - Registros de datos.
+     * @param column - Nombre de la columna.
+     * @returns Mínimo y máximo de la columna.
+     */
+    private numericExtent(data: any[], column: string): [number, number] {
+        return d3.extent(data, (row) => {
+            const value = Number.parseFloat(row[column]);
+            return Number.isNaN(value) ? undefined : value;
+        }) as [number, number];
+    }
+
+    /**
+     * Calcula el dominio compartido del eje de valores de las barras: el
+     * rango de los promedios por grupo de todos los paneles, incluyendo 0.
+     * @param params - Parámetros de la rejilla.
+     * @param groupKey - Columna de los grupos.
+     * @param valueKey - Columna de los valores.
+     * @returns Dominio del eje de valores.
+     */
+    private barValueDomain(params: FacetGridParams, groupKey: string, valueKey: string): [number, number] {
+        const { data, facetOffsets } = params;
+        let low = 0;
+        let high = 0;
+        for (let p = 0; p + 1 < facetOffsets.length; p++) {
+            const agg = new Map<string, { sum: number; count: number }>();
+            for (let i = facetOffsets[p]; i < facetOffsets[p + 1]; i++) {
+                const key = String(data[i][groupKey]);
+                const entry = agg.get(key) ?? { sum: 0, count: 0 };
+                entry.sum += Number(data[i][valueKey]);
+                entry.count += 1;
+                agg.set(key, entry);
+            }
+            agg.forEach(({ sum, count }) => {
+                low = Math.min(low, sum / count);
+                high = Math.max(high, sum / count);
+            });
+        }
+        return [low, high];
+    }
+
+    /**
+     * Renderiza todos los paneles y la barra lateral compartida.
+     * @param params - Datos ordenados por faceta, offsets, mapeos y callbacks.
+     */
+    plot(params: FacetGridParams): void {
+        const { data, chart, facetLabels, facetOffsets, columns, panelHeight, width, setSelectedValues } = params;
+        if (width == null) {
+            throw new Error("Width must be defined");// mensajes de error
+        }
+        const perRow = Math.max(columns, 1);
+        const panelWidth = Math.max(Math.floor((width - SideBar.SIDE_BAR_WIDTH) / perRow), 1);
+
+        const grid = document.createElement("div");
+        grid.className = "facet_grid";
+        grid.style.gridTemplateColumns = `repeat(${perRow}, ${panelWidth}px)`;
+        this.element.appendChild(grid);
+
+        // Selección de cada panel; el modelo recibe la unión.
+        const selections: any[][] = facetLabels.map(() => []);
+        const callUpdateSelected = () => {
+            if (setSelectedValues) setSelectedValues(([] as any[]).concat(...selections));
+        };
+
+        const clickSelectButton = new ClickSelectButton<any>(true);
+        const isVertical = params.direction !== 'horizontal';
+        const groupKey = isVertical ? params.x : params.y;
+        const valueKey = isVertical ? params.y : params.x;
+
+        // Escalas compartidas: se usan los dominios calculados en Python y
+        // solo se recorren los datos si no están disponibles.
+        const domains = params.domains ?? {};
+        const xDomain = chart === 'scatter'
+            ? domains[params.x]?.nice ?? this.numericExtent(data, params.x)
+            : undefined;
+        const yDomain = chart === 'scatter'
+            ? domains[params.y]?.nice ?? this.numericExtent(data, params.y)
+            : undefined;
+        const sizeDomain = chart === 'scatter' ? domainExtent(domains[params.size]) : undefined;
+        const groupDomain = chart === 'bar'
+            ? this.uniqueStrings(data, groupKey).sort((a, b) => a.localeCompare(b))
+            : undefined;
+        const valueDomain = chart === 'bar' ? this.barValueDomain(params, groupKey, valueKey) : undefined;
+        const hueDomain = params.hue ? this.uniqueStrings(data, params.hue) : groupDomain;
+
+        facetLabels.forEach((label, p) => {
+            const panel = document.createElement("div");
+            panel.className = "facet_panel";
+            const title = document.createElement("div");
+            title.className = "facet_title";
+            title.textContent = label;
+            panel.appendChild(title);
+            grid.appendChild(panel);
+
+            const rows = data.slice(facetOffsets[p], facetOffsets[p + 1]);
+            const setPanelSelected = (values: any[]) => {
+                selections[p] = values;
+                callUpdateSelected();
+            };
+            const height = panelHeight - FACET_TITLE_HEIGHT;
+
+            if (chart === 'bar') {
+                new BarPlot(panel).plot({
+                    data: rows,
+                    xValue: params.x,
+                    yValue: params.y,
+                    hue: params.hue,
+                    direction: params.direction,
+                    width: panelWidth,
+                    height,
+                    noSideBar: true,
+                    groupDomain,
+                    valueDomain,
+                    hueDomain,
+                    clickSelectButton,
+                    setSelectedValues: setPanelSelected,
+                });
+            } else {
+                new ScatterPlot(panel).plot({
+                    data: rows,
+                    x: params.x,
+                    y: params.y,
+                    hue: params.hue,
+                    size: params.size,
+                    pointSize: params.pointSize,
+                    opacity: params.opacity,
+                    width: panelWidth,
+                    height,
+                    noSideBar: true,
+                    xDomain,
+                    yDomain,
+                    sizeDomain,
+                    hueDomain,
+                    clickSelectButton,
+                    setSelectedValues: setPanelSelected,
+                });
+            }
+        });
+
+        const deselectAllButton = new DeselectAllButton(
+            d3.select(grid).selectAll(".scatter_dot, .bar"),
+            () => {
+                selections.forEach((_, p) => selections[p] = []);
+                callUpdateSelected();
+            }
+        );
+        const sideBar = new SideBar(this.element, clickSelectButton, deselectAllButton);
+        sideBar.inicializar();
+    }
+}
+
+/**
+ * Modelo para FacetGrid.
+ * Define propiedades reactivas: datos, facetas, mapeos y selección.
+ */
+export class FacetGridModel extends DataModel {
+    /**
+     * Valores por defecto del modelo.
+     */
+    defaults() {
+        return {
+            ...super.defaults(),
+            _model_name: FacetGridModel.model_name,
+            _view_name: FacetGridModel.view_name,
+            chart: "scatter",
+            facet: String,
+            facetLabels: [],
+            facetOffsets: [0],
+            columns: 4,
+            panelHeight: 200,
+            x: String,
+            y: String,
+            hue: String,
+            size: String,
+            pointSize: 5,
+            opacity: 0.7,
+            direction: "vertical",
+            elementId: String,
+            selectedValuesRecords: []
+        };
+    }
+
+    /**
+     * Nombre de la clase de modelo y vista.
+     */
+    static readonly model_name = "FacetGridModel";
+    static readonly view_name = "FacetGridView";
+}
+
+/**
+ * Vista para FacetGrid.
+ * Construye parámetros, renderiza y sincroniza selección con el modelo.
+ */
+export class FacetGridView extends BaseView<FacetGrid> {
+    /**
+     * Obtiene los parámetros desde el modelo y el layout calculado.
+     * @returns Parámetros de renderizado de la rejilla.
+     */
+    params(): FacetGridParams {
+        return {
+            data: (this.model as DataModel).table().records(),
+            chart: this.model.get("chart"),
+            facetLabels: this.model.get("facetLabels"),
+            facetOffsets: this.model.get("facetOffsets"),
+            columns: this.model.get("columns"),
+            panelHeight: this.model.get("panelHeight"),
+            x: this.model.get("x"),
+            y: this.model.get("y"),
+            hue: this.model.get("hue"),
+            size: this.model.get("size"),
+            pointSize: this.model.get("pointSize"),
+            opacity: this.model.get("opacity"),
+            direction: this.model.get("direction"),
+            domains: (this.model as DataModel).domains(),
+            width: this.width,
+            setSelectedValues: this.setSelectedValues.bind(this),
+        };
+    }
+
+    /**
+     * Inicializa el widget, conecta listeners de cambios y renderiza.
+     * @param element - Elemento contenedor del widget.
+     */
+    plot(element: HTMLElement) {
+        this.widget = new FacetGrid(element);
+
+        this.model.on("change:dataColumns", () => this.replot(), this);
+        this.model.on("change:domains", () => this.replot(), this);
+        for (const name of ["facetOffsets", "columns", "panelHeight", "x", "y", "hue", "size", "pointSize", "opacity", "direction"]) {
+            this.model.on(`change:${name}`, () => this.replot(), this);
+        }
+        window.addEventListener("resize", () => this.replot());
+
+        this.widget.plot(this.params());
+    }
+
+    /**
+     * Actualiza en el modelo los valores seleccionados y persiste cambios.
+     * @param values - Filas seleccionadas en todos los paneles.
+     */
+    setSelectedValues(values: any[]) {
+        this.model.set({ selectedValuesRecords: values });
+        this.model.save_changes();
+    }
+}
@@ -0,0 +1,245 @@
+import * as d3 from "d3";
+import { BasePlot } from "./baseplot";
+import { DataModel, BaseView } from "../base/base";
+
+import {
+    ClickSelectButton,
+    DeselectAllButton,
+    BoxSelectButton,
+    SideBar
+} from "./tools/tools";
+
+import { HexbinPlotParams } from "./interface";
+
+/**
+ * Diferencia relativa entre la forma del área y la usada al agrupar a
+ * partir de la cual se pide agrupar de nuevo.
+ */
+const ASPECT_TOLERANCE = 0.01;
+
+/**
+ * Arma el contorno de un hexágono con vértices arriba y abajo.
+ * Las coordenadas son absolutas para que la selección por caja pueda usar
+ * su `getBBox()`.
+ * @param cx - Centro X en píxeles.
+ * @param cy - Centro Y en píxeles.
+ * @param radius - Distancia del centro a cada vértice.
+ * @returns Atributo `d` del hexágono.
+ */
+function hexagon(cx: number, cy: number, radius: number): string {
+    const dx = radius * Math.sqrt(3) / 2;
+    const dy = radius / 2;
+    return `M${cx},${cy - radius}L${cx + dx},${cy - dy}L${cx + dx},${cy + dy}`
+        + `L${cx},${cy + radius}L${cx - dx},${cy + dy}L${cx - dx},${cy - dy}Z`;
+}
+
+/**
+ * Gráfico de densidad en hexágonos.
+ * Dibuja las celdas agrupadas en Python, coloreadas por cantidad de filas,
+ * con selección por clic/caja y barra lateral.
+ */
+export class HexbinPlot extends BasePlot {
+    /**
+     * Renderiza las celdas y conecta herramientas de selección.
+     * @param params - Celdas, dominios, grilla, dimensiones y callbacks.
+     */
+    plot(params: HexbinPlotParams): void {
+        const { x, y, centerX, centerY, counts, xDomain, yDomain, gridSize, aspect, selectedBins, height, noSideBar, setSelectedBins, requestAspect } = params;
+        let { width } = params;
+
+        if (!noSideBar) width = width ? width - SideBar.SIDE_BAR_WIDTH : 0;
+
+        let clickSelectButton: ClickSelectButton<SVGPathElement> | null = null;
+        let deselectAllButton: DeselectAllButton | null = null;
+        let boxSelectButton: BoxSelectButton<SVGPathElement> | null = null;
+
+        if (width == null || height == null) {
+            throw new Error("Width and height must be defined");// mensajes de error
+        }
+        this.init(width, height);
+        const GG = this.gGrid;
+
+        if (!xDomain || !yDomain || counts.length === 0) {
+            console.warn("No hay datos válidos para graficar");// mensajes de error
+            return;
+        }
+
+        const xScale = this.getXLinearScale({ domain: xDomain, width });
+        const yScale = this.getYLinearScale({ domain: yDomain, height });
+
+        this.plotAxes({
+            svg: GG,
+            xScale,
+            yScale,
+            xLabel: x,
+            yLabel: y
+        });
+
+        // Las celdas se agrupan con la forma del área: si cambió, se piden de nuevo
+        const [left, right] = xScale.range();
+        const areaAspect = yScale.range()[0] / (right - left);
+        if (requestAspect && Math.abs(areaAspect - aspect) > ASPECT_TOLERANCE * aspect) {
+            requestAspect(areaAspect);
+        }
+        const radius = (right - left) / (gridSize * Math.sqrt(3));
+
+        const maxCount = d3.max(counts) ?? 1;
+        const color = d3.scaleSequentialSqrt(d3.interpolateYlGnBu).domain([0, maxCount]);
+
+        /**
+         * Notifica al modelo las celdas seleccionadas.
+         */
+        function callUpdateSelected() {
+            if (setSelectedBins) {
+                setSelectedBins(GG.selectAll<SVGPathElement, number>(".hexbin.selected").data());
+            }
+        }
+
+        const mouseClick = (event: MouseEvent) => {
+            if (clickSelectButton) {
+                clickSelectButton.selectionClickEffect(d3.select(event.currentTarget as SVGPathElement));
+                callUpdateSelected();
+            }
+        };
+
+        // Cada hexágono guarda el índice de su celda
+        const selected = new Set(selectedBins);
+        const hexes = GG.selectAll<SVGPathElement, number>(".hexbin")
+            .data(d3.range(counts.length))
+            .enter()
+            .append("path");
+
+        hexes.attr("class", "hexbin")
+            .classed("selected", (d) => selected.has(d))
+            .attr("d", (d) => hexagon(xScale(centerX[d]), yScale(centerY[d]), radius))
+            .attr("fill", (d) => color(counts[d]))
+            .on("click", mouseClick);
+        hexes.append("title").text((d) => `${counts[d]}`);
+
+        if (!noSideBar) {
+            clickSelectButton = new ClickSelectButton(true);
+            deselectAllButton = new DeselectAllButton(hexes, callUpdateSelected);
+            boxSelectButton = new BoxSelectButton({
+                xScale: xScale,
+                yScale: yScale,
+                x_value: x,
+                y_value: y,
+                x_translate: 0,
+                y_translate: 0,
+                selectables: hexes,
+                callUpdateSelected: callUpdateSelected,
+                base: GG,
+                selected: false
+            });
+            const sideBar = new SideBar(
+                this.element,
+                clickSelectButton,
+                deselectAllButton,
+                boxSelectButton
+            );
+            sideBar.inicializar();
+        }
+    }
+}
+
+/**
+ * Modelo para HexbinPlot.
+ * Define propiedades reactivas: columnas, grilla, dominios y celdas seleccionadas.
+ */
+export class HexbinPlotModel extends DataModel {
+    /**
+     * Valores por defecto del modelo.
+     */
+    defaults() {
+        return {
+            ...super.defaults(),
+            _model_name: HexbinPlotModel.model_name,
+            _view_name: HexbinPlotModel.view_name,
+            x: String,
+            y: String,
+            gridSize: 40,
+            aspect: 0.5,
+            xDomain: [],
+            yDomain: [],
+            elementId: String,
+            selectedBins: []
+        };
+    }
+
+    /**
+     * Nombre de la clase de modelo y vista.
+     */
+    static readonly model_name = "HexbinPlotModel";
+    static readonly view_name = "HexbinPlotView";
+}
+
+/**
+ * Vista para HexbinPlot.
+ * Construye parámetros, renderiza y sincroniza la selección de celdas con el modelo.
+ */
+export class HexbinPlotView extends BaseView<HexbinPlot> {
+    /**
+     * Obtiene los parámetros desde el modelo y el layout calculado.
+     * @returns Parámetros de renderizado para el gráfico de densidad.
+     */
+    params(): HexbinPlotParams {
+        const table = (this.model as DataModel).table();
+        const centerX = table.column("x");
+        const centerY = table.column("y");
+        const counts = table.column("count");
+        const valid = Boolean(centerX && centerY && counts);
+        const xDomain: number[] = this.model.get("xDomain");
+        const yDomain: number[] = this.model.get("yDomain");
+        return {
+            data: [],
+            x: this.model.get("x"),
+            y: this.model.get("y"),
+            centerX: valid ? centerX!.numbers() : new Float64Array(0),
+            centerY: valid ? centerY!.numbers() : new Float64Array(0),
+            counts: valid ? counts!.numbers() : new Float64Array(0),
+            xDomain: xDomain.length === 2 ? [xDomain[0], xDomain[1]] : undefined,
+            yDomain: yDomain.length === 2 ? [yDomain[0], yDomain[1]] : undefined,
+            gridSize: this.model.get("gridSize"),
+            aspect: this.model.get("aspect"),
+            selectedBins: this.model.get("selectedBins"),
+            width: this.width,
+            height: this.height,
+            noSideBar: false,
+            setSelectedBins: this.setSelectedBins.bind(this),
+            requestAspect: this.requestAspect.bind(this),
+        };
+    }
+
+    /**
+     * Inicializa el widget, conecta listeners de cambios y renderiza.
+     * @param element - Elemento contenedor del widget.
+     */
+    plot(element: HTMLElement) {
+        this.widget = new HexbinPlot(element);
+
+        this.model.on("change:dataColumns", () => this.replot(), this);
+        this.model.on("change:xDomain", () => this.replot(), this);
+        this.model.on("change:yDomain", () => this.replot(), this);
+        window.addEventListener("resize", () => this.replot());
+
+        this.draw((params) => this.widget.plot(params));
+    }
+
+    /**
+     * Actualiza en el modelo las celdas seleccionadas y persiste cambios.
+     * @param bins - Índices de las celdas seleccionadas.
+     */
+    setSelectedBins(bins: number[]) {
+        this.model.set({ selectedBins: bins });
+        this.model.save_changes();
+    }
+
+    /**
+     * Pide al kernel agrupar de nuevo con la forma real del área.
+     * @param aspect - Alto del área del gráfico dividido por su ancho.
+     */
+    requestAspect(aspect: number) {
+        this.model.set({ aspect });
+        this.model.save_changes();
+    }
+}
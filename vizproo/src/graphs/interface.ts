@@ -1,4 +1,7 @@
 import type { Axis as D3Axis } from "d3-axis";
+import type { ClickSelectButton } from "./tools/button_click_select";
+import type { ColumnDomain } from "../base/data_table";
+import type { GroupMeans, Projection, ScatterPoints } from "../base/compute";
 
 /**
  * Selección D3 para grupos SVG.
@@ -227,6 +230,27 @@ export interface BarPlotParams extends BasePlotParams {
      * Desactiva barra lateral si es verdadero.
      */
     noSideBar?: boolean;
+    /**
+     * Categorías fijas del eje de grupos (escala compartida entre gráficos).
+     */
+    groupDomain?: string[];
+    /**
+     * Dominio fijo del eje de valores (escala compartida entre gráficos).
+     */
+    valueDomain?: [number, number];
+    /**
+     * Categorías fijas para el color (hue).
+     */
+    hueDomain?: string[];
+    /**
+     * Botón de selección por clic de una barra lateral externa.
+     */
+    clickSelectButton?: ClickSelectButton<SVGRectElement>;
+    /**
+     * Promedios por grupo ya calculados en un worker; si faltan se calculan
+     * a partir de `data`.
+     */
+    groups?: GroupMeans;
 }
 
 /**
@@ -257,10 +281,6 @@ export interface ProcessedDataRow {
      * Primer registro original del grupo.
      */
     originalData?: any;
-    /**
-     * Todos los registros que componen la barra.
-     */
-    allOriginalData?: any[];
     /**
      * Campos adicionales preservados del original.
      */
@@ -301,6 +321,15 @@ export interface RadVizParams extends BasePlotParams {
     width: number | null;
     height: number | null;
     noSideBar?: boolean;
+    /**
+     * Dominios de columnas calculados en Python para normalizar sin recorrer los datos.
+     */
+    domains?: Record<string, ColumnDomain>;
+    /**
+     * Proyección ya calculada en un worker con las anclas iniciales; si falta
+     * se calcula a partir de `data`.
+     */
+    projection?: Projection;
 }
 
 /**
@@ -368,18 +397,37 @@ export interface ScatterPlotParams extends BasePlotParams {
      * Deshabilita barra lateral.
      */
     noSideBar: boolean;
-}
-
-/**
- * Punto procesado para ScatterPlot con metadatos.
- */
-export interface ProcessedScatterData {
-    x_: number;
-    y_: number;
-    size_?: number;
-    id: number;
-    originalData?: any;
-    [key: string]: any;
+    /**
+     * Dominio fijo del eje X (escala compartida entre gráficos).
+     */
+    xDomain?: [number, number];
+    /**
+     * Dominio fijo del eje Y (escala compartida entre gráficos).
+     */
+    yDomain?: [number, number];
+    /**
+     * Dominio fijo de la variable de tamaño.
+     */
+    sizeDomain?: [number, number];
+    /**
+     * Categorías fijas para el color (hue).
+     */
+    hueDomain?: string[];
+    /**
+     * Botón de selección por clic de una barra lateral externa.
+     */
+    clickSelectButton?: ClickSelectButton<SVGCircleElement>;
+    /**
+     * Puntos válidos ya calculados en un worker; si faltan se calculan a
+     * partir de `data`.
+     */
+    points?: ScatterPoints;
+    /**
+     * Devuelve la fila original de un índice, para no materializar todos los
+     * registros; por defecto se lee de `data`.
+     * @param index - Índice de la fila.
+     */
+    row?: (index: number) => any;
 }
 
 /**
@@ -449,6 +497,15 @@ export interface StarCoordinatesParams extends BasePlotParams {
     width: number | null;
     height: number | null;
     noSideBar?: boolean;
+    /**
+     * Dominios de columnas calculados en Python para normalizar sin recorrer los datos.
+     */
+    domains?: Record<string, ColumnDomain>;
+    /**
+     * Proyección ya calculada en un worker con las anclas iniciales; si falta
+     * se calcula a partir de `data`.
+     */
+    projection?: Projection;
 }
 
 /**
@@ -469,3 +526,249 @@ export interface StarCoordinatesAnchor {
     x: number;
     y: number;
 }
+
+/**
+ * Parámetros para FacetGrid.
+ */
+export interface FacetGridParams extends BasePlotParams {
+    /**
+     * Tipo de gráfico de cada panel.
+     */
+    chart: 'scatter' | 'bar';
+    /**
+     * Etiqueta de cada panel.
+     */
+    facetLabels: string[];
+    /**
+     * Posición de inicio de cada panel en `data`, más la cantidad total de filas.
+     */
+    facetOffsets: number[];
+    /**
+     * Cantidad de paneles por fila.
+     */
+    columns: number;
+    /**
+     * Alto de cada panel.
+     */
+    panelHeight: number;
+    /**
+     * Columna para X.
+     */
+    x: string;
+    /**
+     * Columna para Y.
+     */
+    y: string;
+    /**
+     * Columna opcional para color.
+     */
+    hue?: string;
+    /**
+     * Columna opcional para tamaño del punto (scatter).
+     */
+    size?: string;
+    /**
+     * Tamaño base del punto (scatter).
+     */
+    pointSize: number;
+    /**
+     * Opacidad de puntos (scatter).
+     */
+    opacity: number;
+    /**
+     * Orientación de las barras (bar).
+     */
+    direction: 'vertical' | 'horizontal';
+    /**
+     * Dominios de columnas calculados en Python.
+     */
+    domains?: Record<string, ColumnDomain>;
+    /**
+     * Ancho del contenedor.
+     */
+    width: number | null;
+    /**
+     * Callback de selección con las filas seleccionadas en todos los paneles.
+     * @param values - Filas seleccionadas.
+     */
+    setSelectedValues?: (values: any[]) => void;
+}
+
+/**
+ * Parámetros para LineChart.
+ */
+export interface LineChartParams extends BasePlotParams {
+    /**
+     * Nombre de la columna para X.
+     */
+    x: string;
+    /**
+     * Nombre de la columna para Y.
+     */
+    y: string;
+    /**
+     * Valores X de la ventana reducida, ordenados.
+     */
+    xValues: Float64Array;
+    /**
+     * Valores Y de la ventana reducida.
+     */
+    yValues: Float64Array;
+    /**
+     * Si X es una fecha (milisegundos desde la época).
+     */
+    time: boolean;
+    /**
+     * Extensión de X en la serie completa.
+     */
+    xDomain?: [number, number];
+    /**
+     * Extensión de Y en la serie completa.
+     */
+    yDomain?: [number, number];
+    /**
+     * Ventana visible de X, o undefined para la serie completa.
+     */
+    xWindow?: [number, number];
+    /**
+     * Ancho en píxeles con el que se redujo la ventana.
+     */
+    pixels: number;
+    /**
+     * Grosor de la línea.
+     */
+    lineWidth: number;
+    /**
+     * Ancho del contenedor.
+     */
+    width: number | null;
+    /**
+     * Alto del contenedor.
+     */
+    height: number | null;
+    /**
+     * Pide al kernel la ventana reducida para un rango de X y un ancho.
+     * @param window - Rango visible, o null para la serie completa.
+     * @param pixels - Ancho del área del gráfico en píxeles.
+     */
+    requestWindow?: (window: [number, number] | null, pixels: number) => void;
+}
+
+/**
+ * Parámetros para HexbinPlot.
+ */
+export interface HexbinPlotParams extends BasePlotParams {
+    /**
+     * Nombre de la columna para X.
+     */
+    x: string;
+    /**
+     * Nombre de la columna para Y.
+     */
+    y: string;
+    /**
+     * Centro X de cada celda.
+     */
+    centerX: Float64Array;
+    /**
+     * Centro Y de cada celda.
+     */
+    centerY: Float64Array;
+    /**
+     * Cantidad de filas de cada celda.
+     */
+    counts: Float64Array;
+    /**
+     * Dominio de X usado al agrupar.
+     */
+    xDomain?: [number, number];
+    /**
+     * Dominio de Y usado al agrupar.
+     */
+    yDomain?: [number, number];
+    /**
+     * Cantidad de hexágonos a lo ancho.
+     */
+    gridSize: number;
+    /**
+     * Relación alto/ancho del área con la que se agrupó.
+     */
+    aspect: number;
+    /**
+     * Celdas seleccionadas.
+     */
+    selectedBins: number[];
+    /**
+     * Ancho del contenedor.
+     */
+    width: number | null;
+    /**
+     * Alto del contenedor.
+     */
+    height: number | null;
+    /**
+     * Deshabilita barra lateral.
+     */
+    noSideBar?: boolean;
+    /**
+     * Callback de selección con las celdas seleccionadas.
+     * @param bins - Índices de las celdas.
+     */
+    setSelectedBins?: (bins: number[]) => void;
+    /**
+     * Pide al kernel agrupar de nuevo con la forma real del área.
+     * @param aspect - Alto del área del gráfico dividido por su ancho.
+     */
+    requestAspect?: (aspect: number) => void;
+}
+
+/**
+ * Parámetros para la matriz de dispersión.
+ */
+export interface ScatterMatrixParams extends BasePlotParams {
+    /**
+     * Columnas de la matriz, en orden.
+     */
+    columns: string[];
+    /**
+     * Valores de cada columna (NaN si faltan), en el orden de `columns`.
+     */
+    values: Float64Array[];
+    /**
+     * Columna de color/categoría.
+     */
+    hue?: string;
+    /**
+     * Código de categoría de cada fila (NaN si falta).
+     */
+    hueKeys: Float64Array | null;
+    /**
+     * Dominio de cada columna; sin dominio se usa la extensión de los valores.
+     */
+    domains: ([number, number] | undefined)[];
+    /**
+     * Tamaño de los puntos en píxeles.
+     */
+    pointSize: number;
+    /**
+     * Opacidad de los puntos.
+     */
+    opacity: number;
+    /**
+     * Filas seleccionadas, un bit por fila; null si no hay selección.
+     */
+    selection: Uint8Array | null;
+    /**
+     * Ancho del contenedor.
+     */
+    width: number | null;
+    /**
+     * Alto del contenedor.
+     */
+    height: number | null;
+    /**
+     * Callback al terminar una selección por caja.
+     * @param bits - Filas seleccionadas (un bit por fila) o null si se limpió.
+     */
+    setSelection?: (bits: Uint8Array | null) => void;
+}
@@ -0,0 +1,238 @@
+import * as d3 from "d3";
+import { BasePlot } from "./baseplot";
+import { DataModel, BaseView } from "../base/base";
+
+import { LineChartParams } from "./interface";
+
+const DEFAULT_COLOR = "#4299e1";
+/**
+ * Espera (ms) desde el último movimiento de zoom antes de pedir al kernel
+ * la ventana reducida.
+ */
+const WINDOW_DELAY = 150;
+
+/**
+ * Gráfico de líneas para series largas.
+ * Dibuja la ventana reducida en Python (M4 o LTTB) y, al hacer zoom o
+ * desplazar, reescala la línea actual y pide al kernel la ventana nueva.
+ */
+export class LineChart extends BasePlot {
+    /**
+     * Pedido de ventana programado, cancelado si el zoom continúa.
+     */
+    private windowTimeout: number | null = null;
+
+    /**
+     * Renderiza la línea, sus ejes y el zoom sobre X.
+     * @param params - Ventana reducida, dominios de la serie, dimensiones y callback de ventana.
+     */
+    plot(params: LineChartParams): void {
+        const { x, y, xValues, yValues, time, xDomain, yDomain, xWindow, pixels, lineWidth, width, height, requestWindow } = params;
+
+        if (width == null || height == null) {
+            throw new Error("Width and height must be defined");// mensajes de error
+        }
+        this.init(width, height);
+        const GG = this.gGrid;
+
+        if (!xDomain || xValues.length === 0) {
+            console.warn("No hay datos válidos para graficar");// mensajes de error
+            return;
+        }
+
+        // Escala de la serie completa, base del zoom, y escala de la ventana
+        const innerWidth = width - this.margin.left - this.margin.right;
+        const full = (time ? d3.scaleTime() : d3.scaleLinear()) as unknown as d3.ScaleLinear<number, number>;
+        full.domain(xDomain).range([0, innerWidth]);
+        const xScale = full.copy().domain(xWindow ?? xDomain);
+        const yScale = this.getYLinearScale({
+            domain: yDomain ?? (d3.extent(yValues) as [number, number]),
+            height,
+        });
+
+        const { xAxis } = this.plotAxes({
+            svg: GG,
+            xScale,
+            yScale,
+            xLabel: x,
+            yLabel: y
+        });
+        const [left, right] = xScale.range();
+        const innerHeight = yScale.range()[0];
+        full.range([left, right]);
+
+        const randomString = Math.floor(
+            Math.random() * Date.now() * 10000
+        ).toString(36);
+        const clipId = "line_clip-" + randomString;
+        GG.append("clipPath")
+            .attr("id", clipId)
+            .append("rect")
+            .attr("x", left)
+            .attr("width", right - left)
+            .attr("height", innerHeight);
+
+        // La línea recorre los puntos por posición en los arreglos
+        const indices = d3.range(xValues.length);
+        const line = (scale: d3.ScaleLinear<number, number>) => d3.line<number>()
+            .x((i) => scale(xValues[i]))
+            .y((i) => yScale(yValues[i]))(indices);
+
+        const path = GG.append("path")
+            .attr("class", "line_path")
+            .attr("clip-path", `url(#${clipId})`)
+            .attr("fill", "none")
+            .attr("stroke", DEFAULT_COLOR)
+            .attr("stroke-width", lineWidth)
+            .attr("d", line(xScale));
+
+        // El kernel reduce la serie con el ancho real del área del gráfico
+        const plotPixels = Math.max(1, Math.round(right - left));
+        if (requestWindow && plotPixels !== pixels) requestWindow(xWindow ?? null, plotPixels);
+
+        const zoom = d3.zoom<SVGRectElement, unknown>()
+            .scaleExtent([1, Infinity])
+            .extent([[left, 0], [right, innerHeight]])
+            .translateExtent([[left, 0], [right, innerHeight]])
+            .on("zoom", (event: d3.D3ZoomEvent<SVGRectElement, unknown>) => {
+                // Los cambios programáticos solo restauran la ventana actual
+                if (!event.sourceEvent) return;
+                const zoomed = event.transform.rescaleX(full);
+                xAxis.call(d3.axisBottom(zoomed));
+                path.attr("d", line(zoomed));
+                const domain = zoomed.domain().map(Number) as [number, number];
+                this.scheduleWindow(() => requestWindow?.(domain, plotPixels));
+            });
+
+        const overlay = GG.append("rect")
+            .attr("class", "line_zoom")
+            .attr("x", left)
+            .attr("width", right - left)
+            .attr("height", innerHeight)
+            .attr("fill", "none")
+            .attr("pointer-events", "all")
+            .call(zoom)
+            .on("dblclick.zoom", null)
+            .on("dblclick", () => requestWindow?.(null, plotPixels));
+
+        // Transformación de zoom equivalente a la ventana dibujada
+        if (xWindow) {
+            const span = full(xWindow[1]) - full(xWindow[0]);
+            if (span > 0) {
+                const k = (right - left) / span;
+                overlay.call(zoom.transform, d3.zoomIdentity.translate(left - k * full(xWindow[0]), 0).scale(k));
+            }
+        }
+    }
+
+    /**
+     * Programa un pedido de ventana con "debounce", de modo que un gesto de
+     * zoom genera un solo pedido al terminar.
+     * @param request - Pedido a realizar.
+     */
+    private scheduleWindow(request: () => void): void {
+        if (this.windowTimeout) {
+            clearTimeout(this.windowTimeout);
+        }
+        this.windowTimeout = setTimeout(() => {
+            this.windowTimeout = null;
+            request();
+        }, WINDOW_DELAY);
+    }
+}
+
+/**
+ * Modelo para LineChart.
+ * Define propiedades reactivas: columnas, reducción, ventana visible y dominios.
+ */
+export class LineChartModel extends DataModel {
+    /**
+     * Valores por defecto del modelo.
+     */
+    defaults() {
+        return {
+            ...super.defaults(),
+            _model_name: LineChartModel.model_name,
+            _view_name: LineChartModel.view_name,
+            x: String,
+            y: String,
+            method: "m4",
+            pixels: 800,
+            xWindow: [],
+            xDomain: [],
+            yDomain: [],
+            lineWidth: 1.5,
+            elementId: String,
+        };
+    }
+
+    /**
+     * Nombre de la clase de modelo y vista.
+     */
+    static readonly model_name = "LineChartModel";
+    static readonly view_name = "LineChartView";
+}
+
+/**
+ * Vista para LineChart.
+ * Construye parámetros, renderiza y pide al kernel las ventanas de zoom.
+ */
+export class LineChartView extends BaseView<LineChart> {
+    /**
+     * Obtiene los parámetros desde el modelo y el layout calculado.
+     * @returns Parámetros de renderizado para el gráfico de líneas.
+     */
+    params(): LineChartParams {
+        const table = (this.model as DataModel).table();
+        const x: string = this.model.get("x");
+        const y: string = this.model.get("y");
+        const xColumn = table.column(x);
+        const yColumn = table.column(y);
+        const valid = Boolean(xColumn && yColumn);
+        const xWindow: number[] = this.model.get("xWindow");
+        const xDomain: number[] = this.model.get("xDomain");
+        const yDomain: number[] = this.model.get("yDomain");
+        return {
+            data: [],
+            x,
+            y,
+            xValues: valid ? xColumn!.numbers() : new Float64Array(0),
+            yValues: valid ? yColumn!.numbers() : new Float64Array(0),
+            time: xColumn?.kind === "datetime",
+            xDomain: xDomain.length === 2 ? [xDomain[0], xDomain[1]] : undefined,
+            yDomain: yDomain.length === 2 ? [yDomain[0], yDomain[1]] : undefined,
+            xWindow: xWindow.length === 2 ? [xWindow[0], xWindow[1]] : undefined,
+            pixels: this.model.get("pixels"),
+            lineWidth: this.model.get("lineWidth"),
+            width: this.width,
+            height: this.height,
+            requestWindow: this.requestWindow.bind(this),
+        };
+    }
+
+    /**
+     * Inicializa el widget, conecta listeners de cambios y renderiza.
+     * @param element - Elemento contenedor del widget.
+     */
+    plot(element: HTMLElement) {
+        this.widget = new LineChart(element);
+
+        this.model.on("change:dataColumns", () => this.replot(), this);
+        this.model.on("change:xDomain", () => this.replot(), this);
+        this.model.on("change:yDomain", () => this.replot(), this);
+        this.model.on("change:lineWidth", () => this.replot(), this);
+        window.addEventListener("resize", () => this.replot());
+
+        this.draw((params) => this.widget.plot(params));
+    }
+
+    /**
+     * Pide al kernel la ventana reducida de un rango de X.
+     * @param window - Rango visible, o null para la serie completa.
+     * @param pixels - Ancho del área del gráfico en píxeles.
+     */
+    requestWindow(window: [number, number] | null, pixels: number) {
+        this.model.set({ xWindow: window ?? [], pixels });
+        this.model.save_changes();
+    }
+}
@@ -1,6 +1,9 @@
 import * as d3 from "d3";
 import { BasePlot } from "./baseplot";
-import { BaseModel, BaseView } from "../base/base";
+import { DataModel, BaseView } from "../base/base";
+import { domainExtent } from "../base/data_table";
+import { Projection, project, projectPoints } from "../base/compute";
+import { anchorCoordinates, compute, recordNumbers } from "../base/compute_pool";
 import { 
     ClickSelectButton,   
     BoxSelectButton,
@@ -33,7 +36,7 @@ export class RadViz extends BasePlot {
      * @param dimensions - Lista de dimensiones a anclar.
      * @returns Arreglo de ejes con ángulo y coordenadas normalizadas.
      */
-    private createAxes(dimensions: string[]): RadVizAxis[] {
+    createAxes(dimensions: string[]): RadVizAxis[] {
         const n = dimensions.length;
         return dimensions.map((key, i) => ({
             label: key,
@@ -44,55 +47,18 @@ export class RadViz extends BasePlot {
     }
 
     /**
-     * Crea escalas de normalización [0,1] por dimensión.
+     * Crea los puntos a dibujar a partir de una proyección.
      * @param data - Datos originales.
-     * @param dimensions - Dimensiones a normalizar.
-     * @returns Map de dimensión -> escala lineal.
-     */
-    private createNormalizationScales(data: any[], dimensions: string[]): Record<string, d3.ScaleLinear<number, number>> {
-        const scales: Record<string, d3.ScaleLinear<number, number>> = {};
-        for (const key of dimensions) {
-            const extent = d3.extent(data, d => d[key]) as [number, number];
-            scales[key] = d3.scaleLinear().domain(extent).range([0, 1]);
-        }
-        return scales;
-    }
-
-    /**
-     * Calcula posiciones RadViz para cada fila.
-     * @param data - Datos originales.
-     * @param dimensions - Dimensiones usadas para ponderar.
-     * @param axes - Ejes con coordenadas unitarias.
-     * @param scales - Escalas de normalización por dimensión.
+     * @param projection - Coordenadas de cada fila en unidades del radio.
      * @returns Puntos posicionados con referencia al original.
      */
-    private calculateRadVizPositions(
-        data: any[], 
-        dimensions: string[], 
-        axes: RadVizAxis[], 
-        scales: Record<string, d3.ScaleLinear<number, number>>
-    ): RadVizPoint[] {
-        return data.map((d, index) => {
-            let sumW = 0, x = 0, y = 0;
-            
-            for (let i = 0; i < dimensions.length; i++) {
-                const key = dimensions[i];
-                const w = scales[key](d[key]);
-                sumW += w;
-                x += w * axes[i].x;
-                y += w * axes[i].y;
-            }
-            
-            x /= sumW;
-            y /= sumW;
-            
-            return {
-                x: x * this.chartRadius,
-                y: y * this.chartRadius,
-                originalData: d,
-                id: index
-            };
-        });
+    private createPoints(data: any[], projection: Projection): RadVizPoint[] {
+        return Array.from(projection.x, (x, index) => ({
+            x: x * this.chartRadius,
+            y: projection.y[index] * this.chartRadius,
+            originalData: data[index],
+            id: index
+        }));
     }
 
     /**
@@ -176,11 +142,17 @@ export class RadViz extends BasePlot {
         // Create axes
         const axes = this.createAxes(dimensions);
 
-        // Create normalization scales
-        const scales = this.createNormalizationScales(data, dimensions);
-
-        // Calculate RadViz positions
-        const points = this.calculateRadVizPositions(data, dimensions, axes, scales);
+        // Proyección: calculada en un worker por la vista o aquí a partir de los registros
+        const projection = params.projection ?? projectPoints({
+            columns: dimensions.map((key) => recordNumbers(data, key)),
+            extents: dimensions.map((key) => domainExtent(params.domains?.[key]) ?? null),
+            anchors: anchorCoordinates(axes),
+            radial: true,
+        });
+        const points = this.createPoints(data, projection);
+        // Coordenadas recalculadas al arrastrar un eje (la proyección puede estar compartida)
+        const draggedX = new Float64Array(points.length);
+        const draggedY = new Float64Array(points.length);
 
         // Create color scale
         let colorScale: d3.ScaleOrdinal<string, string>;
@@ -254,11 +226,14 @@ export class RadViz extends BasePlot {
                     .attr("y", d.y * (chartRadius + 15));
                 
                 // Recalcular y actualizar posiciones de todos los puntos
-                const updatedPoints = this.calculateRadVizPositions(data, dimensions, axes, scales);
+                project(projection.normalized, dimensions.length, anchorCoordinates(axes), true, draggedX, draggedY);
+                points.forEach((pt, i) => {
+                    pt.x = draggedX[i] * chartRadius;
+                    pt.y = draggedY[i] * chartRadius;
+                });
                 pointSelection
-                    .data(updatedPoints)
-                    .attr("cx", (pt: any) => pt.x)
-                    .attr("cy", (pt: any) => pt.y);
+                    .attr("cx", (pt: RadVizPoint) => pt.x)
+                    .attr("cy", (pt: RadVizPoint) => pt.y);
             })
             .on("end", function(event, d: RadVizAxis) {
                 d3.select(this).attr("r", 6);
@@ -341,7 +316,7 @@ export class RadViz extends BasePlot {
  * Modelo para RadViz.
  * Define propiedades reactivas: datos, dimensiones, hue y selección.
  */
-export class RadVizModel extends BaseModel {
+export class RadVizModel extends DataModel {
     /**
      * Valores por defecto del modelo.
      */
@@ -350,7 +325,6 @@ export class RadVizModel extends BaseModel {
             ...super.defaults(),
             _model_name: RadVizModel.model_name,
             _view_name: RadVizModel.view_name,
-            dataRecords: [],
             dimensions: [],
             hue: String,
             elementId: String,
@@ -376,16 +350,38 @@ export class RadVizView extends BaseView<RadViz> {
      */
     params(): RadVizParams {
         return {
-            data: this.model.get("dataRecords"),
+            data: (this.model as DataModel).table().records(),
             dimensions: this.model.get("dimensions"),
             hue: this.model.get("hue"),
             setSelectedValues: this.setSelectedValues.bind(this),
             width: this.width,
             height: this.height,
             noSideBar: false,
+            domains: (this.model as DataModel).domains(),
         };
     }
 
+    /**
+     * Calcula en un worker la normalización y la proyección con los ejes
+     * iniciales, reutilizándolas mientras la tabla y las dimensiones no cambien.
+     * @param params - Parámetros obtenidos con `params()`.
+     * @returns Parámetros con la proyección calculada.
+     */
+    async prepare(params: RadVizParams): Promise<RadVizParams> {
+        const { dimensions } = params;
+        const table = (this.model as DataModel).table();
+        const columns = (dimensions || []).map((name) => table.column(name));
+        if (columns.length < 2 || columns.some((column) => !column)) return params;
+        const domains = params.domains ?? {};
+        const projection = await this.reuse([table, domains, dimensions.join("\u0000")], () => compute("projectPoints", () => ({
+            columns: columns.map((column) => column!.numbers()),
+            extents: dimensions.map((name) => domainExtent(domains[name]) ?? null),
+            anchors: anchorCoordinates(this.widget.createAxes(dimensions)),
+            radial: true,
+        })));
+        return { ...params, projection };
+    }
+
     /**
      * Inicializa el widget, conecta listeners de cambios y renderiza.
      * @param element - Elemento contenedor del widget.
@@ -393,11 +389,12 @@ export class RadVizView extends BaseView<RadViz> {
     plot(element: HTMLElement) {
         this.widget = new RadViz(element);
 
-        this.model.on("change:dataRecords", () => this.replot(), this);
+        this.model.on("change:dataColumns", () => this.replot(), this);
+        this.model.on("change:domains", () => this.replot(), this);
         this.model.on("change:hue", () => this.replot(), this);
         window.addEventListener("resize", () => this.replot());
 
-        this.widget.plot(this.params());
+        this.draw((params) => this.widget.plot(params));
     }
 
     /**
@@ -0,0 +1,416 @@
+import * as d3 from "d3";
+import { BasePlot } from "./baseplot";
+import { DataModel, BaseView } from "../base/base";
+import { domainExtent } from "../base/data_table";
+
+import { ScatterMatrixParams } from "./interface";
+
+/**
+ * Color de los puntos sin categoría.
+ */
+const DEFAULT_COLOR = "#4299e1";
+/**
+ * Color de los puntos que quedan fuera de la selección.
+ */
+const UNSELECTED_COLOR = "#ccc";
+/**
+ * Espacio a la izquierda y abajo de la matriz para los ejes.
+ */
+const AXIS_SPACE = 30;
+/**
+ * Separación interna entre el borde de cada panel y sus puntos.
+ */
+const CELL_PADDING = 4;
+
+/**
+ * Matriz de gráficos de dispersión con selección enlazada.
+ * Los puntos de todos los paneles se dibujan en un único canvas y los ejes
+ * y las cajas de selección en un SVG superpuesto. La selección es un mapa
+ * de bits por fila compartido por todos los paneles: al mover la caja se
+ * vuelve a pintar el canvas sin pasar por el kernel.
+ */
+export class ScatterMatrix extends BasePlot {
+    /**
+     * Contexto 2D del canvas de puntos.
+     */
+    private context: CanvasRenderingContext2D | null = null;
+    /**
+     * Posición en píxeles de cada fila dentro de un panel, por columna.
+     */
+    private positions: Float32Array[] = [];
+    /**
+     * Color de cada fila según su categoría.
+     */
+    private colors: string[] = [];
+    /**
+     * Lado de cada panel en píxeles.
+     */
+    private cellSize = 0;
+    /**
+     * Parámetros del último dibujo.
+     */
+    private params: ScatterMatrixParams | null = null;
+    /**
+     * Selección actual, un bit por fila.
+     */
+    selection: Uint8Array | null = null;
+    /**
+     * Pedido de animación pendiente para repintar los puntos.
+     */
+    private frame: number | null = null;
+
+    /**
+     * Renderiza los paneles, los ejes y las cajas de selección.
+     * @param params - Columnas, valores, dominios, dimensiones y callbacks.
+     */
+    plot(params: ScatterMatrixParams): void {
+        const { columns, values, hueKeys, domains, width, height, setSelection } = params;
+
+        if (width == null || height == null) {
+            throw new Error("Width and height must be defined");// mensajes de error
+        }
+        this.init(width, height);
+        const GG = this.gGrid;
+        this.params = params;
+        this.selection = params.selection;
+
+        const k = columns.length;
+        if (k === 0 || values.length !== k || values[0].length === 0) {
+            console.warn("No hay datos válidos para graficar");// mensajes de error
+            return;
+        }
+
+        const innerWidth = width - this.margin.left - this.margin.right - AXIS_SPACE;
+        const innerHeight = height - this.margin.top - this.margin.bottom - AXIS_SPACE;
+        const size = Math.max(Math.floor(Math.min(innerWidth, innerHeight) / k), 2 * CELL_PADDING + 1);
+        this.cellSize = size;
+
+        // Una escala por columna, compartida por su fila y su columna de paneles
+        const scales = columns.map((_, c) => {
+            const extent = domains[c] ?? (d3.extent(values[c]) as [number, number]);
+            return d3.scaleLinear()
+                .domain(extent[0] === undefined ? [0, 1] : extent)
+                .range([CELL_PADDING, size - CELL_PADDING]);
+        });
+        this.positions = values.map((column, c) => Float32Array.from(column, (v) => scales[c](v)));
+        this.colors = this.rowColors(hueKeys, values[0].length);
+
+        const matrix = GG.append("g").attr("transform", `translate(${AXIS_SPACE},0)`);
+        this.plotMatrixAxes(matrix, columns, scales, size);
+        this.initCanvas(size * k);
+        this.paint();
+
+        // Una caja de selección por panel; al empezar una se borran las demás
+        const brush = d3.brush<[number, number]>()
+            .extent([[0, 0], [size, size]])
+            .on("start", (event, cell) => {
+                if (!event.sourceEvent) return;
+                cells.filter((other) => other !== cell).call(brush.move as any, null);
+            })
+            .on("brush", (event, cell) => {
+                if (!event.sourceEvent) return;
+                this.selection = this.brushSelection(cell, event.selection);
+                this.schedulePaint();
+            })
+            .on("end", (event, cell) => {
+                if (!event.sourceEvent) return;
+                this.selection = this.brushSelection(cell, event.selection);
+                this.schedulePaint();
+                if (setSelection) setSelection(this.selection);
+            });
+
+        const pairs = d3.cross(d3.range(k), d3.range(k)) as [number, number][];
+        const cells = matrix.selectAll<SVGGElement, [number, number]>(".matrix-cell")
+            .data(pairs)
+            .enter()
+            .append("g")
+            .attr("class", "matrix-cell")
+            .attr("transform", ([col, row]) => `translate(${col * size},${row * size})`);
+        cells.append("rect")
+            .attr("class", "matrix-frame")
+            .attr("width", size)
+            .attr("height", size);
+        cells.filter(([col, row]) => col === row)
+            .append("text")
+            .attr("class", "matrix-label")
+            .attr("x", CELL_PADDING + 2)
+            .attr("y", CELL_PADDING + 12)
+            .text(([col]) => columns[col]);
+        cells.call(brush);
+    }
+
+    /**
+     * Dibuja un eje X bajo cada columna y un eje Y a la izquierda de cada fila.
+     * @param matrix - Grupo de la matriz.
+     * @param columns - Nombres de las columnas.
+     * @param scales - Escala de cada columna dentro de un panel.
+     * @param size - Lado de cada panel.
+     */
+    private plotMatrixAxes(
+        matrix: d3.Selection<SVGGElement, unknown, null, undefined>,
+        columns: string[],
+        scales: d3.ScaleLinear<number, number>[],
+        size: number
+    ): void {
+        const k = columns.length;
+        scales.forEach((scale, c) => {
+            matrix.append("g")
+                .attr("class", "x-axis")
+                .attr("transform", `translate(${c * size},${k * size})`)
+                .call(d3.axisBottom(scale).ticks(4).tickSizeOuter(0));
+            const yScale = scale.copy().range([size - CELL_PADDING, CELL_PADDING]);
+            matrix.append("g")
+                .attr("class", "y-axis")
+                .attr("transform", `translate(0,${c * size})`)
+                .call(d3.axisLeft(yScale).ticks(4).tickSizeOuter(0));
+        });
+    }
+
+    /**
+     * Crea el canvas de puntos bajo el SVG, alineado con la matriz.
+     * @param side - Lado total de la matriz.
+     */
+    private initCanvas(side: number): void {
+        const ratio = window.devicePixelRatio || 1;
+        const svgNode = this.svg.node()!;
+        const canvas = document.createElement("canvas");
+        canvas.width = Math.ceil(side * ratio);
+        canvas.height = Math.ceil(side * ratio);
+        canvas.style.width = `${side}px`;
+        canvas.style.height = `${side}px`;
+        canvas.style.position = "absolute";
+        canvas.style.pointerEvents = "none";
+        this.element.style.position = "relative";
+        this.element.insertBefore(canvas, svgNode);
+        // El SVG posicionado se pinta encima del canvas
+        this.svg.style("position", "relative");
+        canvas.style.left = `${svgNode.offsetLeft + this.margin.left + AXIS_SPACE}px`;
+        canvas.style.top = `${svgNode.offsetTop + this.margin.top}px`;
+
+        this.context = canvas.getContext("2d");
+        if (this.context) this.context.setTransform(ratio, 0, 0, ratio, 0, 0);
+    }
+
+    /**
+     * Color de cada fila según su código de categoría.
+     * @param hueKeys - Código de categoría de cada fila, si hay `hue`.
+     * @param count - Cantidad de filas.
+     * @returns Color de cada fila.
+     */
+    private rowColors(hueKeys: Float64Array | null, count: number): string[] {
+        const colors = new Array<string>(count);
+        for (let i = 0; i < count; i++) {
+            const key = hueKeys ? hueKeys[i] : NaN;
+            colors[i] = Number.isNaN(key) ? DEFAULT_COLOR : d3.schemeCategory10[key % 10];
+        }
+        return colors;
+    }
+
+    /**
+     * Calcula las filas dentro de una caja de selección.
+     * @param cell - Columna y fila del panel de la caja.
+     * @param extent - Esquinas de la caja en píxeles del panel, o null.
+     * @returns Mapa de bits de las filas seleccionadas, o null si no hay caja.
+     */
+    private brushSelection(cell: [number, number], extent: [[number, number], [number, number]] | null): Uint8Array | null {
+        if (!extent) return null;
+        const [[x0, y0], [x1, y1]] = extent;
+        const xs = this.positions[cell[0]];
+        const ys = this.positions[cell[1]];
+        const size = this.cellSize;
+        const bits = new Uint8Array(Math.ceil(xs.length / 8));
+        for (let i = 0; i < xs.length; i++) {
+            const px = xs[i];
+            const py = size - ys[i];
+            if (px >= x0 && px <= x1 && py >= y0 && py <= y1) bits[i >> 3] |= 1 << (i & 7);
+        }
+        return bits;
+    }
+
+    /**
+     * Reemplaza la selección (por ejemplo, la fijada desde Python) y repinta.
+     * @param bits - Mapa de bits de las filas seleccionadas, o null.
+     */
+    setSelection(bits: Uint8Array | null): void {
+        this.selection = bits;
+        this.schedulePaint();
+    }
+
+    /**
+     * Programa un repintado para el próximo cuadro de animación.
+     */
+    private schedulePaint(): void {
+        if (this.frame !== null) return;
+        this.frame = requestAnimationFrame(() => {
+            this.frame = null;
+            this.paint();
+        });
+    }
+
+    /**
+     * Pinta los puntos de todos los paneles; con selección, las filas no
+     * seleccionadas van en gris y debajo de las seleccionadas.
+     */
+    private paint(): void {
+        const context = this.context;
+        const params = this.params;
+        if (!context || !params) return;
+        const k = this.positions.length;
+        const size = this.cellSize;
+        const pointSize = params.pointSize;
+        const half = pointSize / 2;
+        const bits = this.selection;
+        const count = k ? this.positions[0].length : 0;
+
+        context.clearRect(0, 0, size * k, size * k);
+        context.globalAlpha = params.opacity;
+        let fill = "";
+        const drawPass = (selected: boolean | null) => {
+            for (let col = 0; col < k; col++) {
+                const xs = this.positions[col];
+                for (let row = 0; row < k; row++) {
+                    if (col === row) continue;
+                    const ys = this.positions[row];
+                    const left = col * size;
+                    const bottom = (row + 1) * size;
+                    for (let i = 0; i < count; i++) {
+                        const px = xs[i];
+                        const py = ys[i];
+                        if (Number.isNaN(px) || Number.isNaN(py)) continue;
+                        if (selected !== null && ((bits![i >> 3] >> (i & 7)) & 1) !== Number(selected)) continue;
+                        const color = selected === false ? UNSELECTED_COLOR : this.colors[i];
+                        if (color !== fill) context.fillStyle = fill = color;
+                        context.fillRect(left + px - half, bottom - py - half, pointSize, pointSize);
+                    }
+                }
+            }
+        };
+        if (bits) {
+            drawPass(false);
+            drawPass(true);
+        } else {
+            drawPass(null);
+        }
+        context.globalAlpha = 1;
+    }
+}
+
+/**
+ * Convierte el valor del trait `selection` en un mapa de bits.
+ * @param value - Vista binaria recibida del kernel, o null.
+ * @returns Mapa de bits, o null si está vacío.
+ */
+function selectionBits(value: DataView | null): Uint8Array | null {
+    if (!value || value.byteLength === 0) return null;
+    return new Uint8Array(value.buffer, value.byteOffset, value.byteLength);
+}
+
+/**
+ * Modelo para ScatterMatrix.
+ * Define propiedades reactivas: columnas, color, estilo y selección.
+ */
+export class ScatterMatrixModel extends DataModel {
+    /**
+     * Valores por defecto del modelo.
+     */
+    defaults() {
+        return {
+            ...super.defaults(),
+            _model_name: ScatterMatrixModel.model_name,
+            _view_name: ScatterMatrixModel.view_name,
+            columns: [],
+            hue: String,
+            pointSize: 2,
+            opacity: 0.7,
+            selection: null,
+            elementId: String
+        };
+    }
+
+    /**
+     * Nombre de la clase de modelo y vista.
+     */
+    static readonly model_name = "ScatterMatrixModel";
+    static readonly view_name = "ScatterMatrixView";
+}
+
+/**
+ * Vista para ScatterMatrix.
+ * Construye parámetros, renderiza y sincroniza la selección con el modelo.
+ */
+export class ScatterMatrixView extends BaseView<ScatterMatrix> {
+    /**
+     * Obtiene los parámetros desde el modelo y el layout calculado.
+     * @returns Parámetros de renderizado para la matriz.
+     */
+    params(): ScatterMatrixParams {
+        const domains = (this.model as DataModel).domains();
+        const columns: string[] = this.model.get("columns");
+        return {
+            data: [],
+            columns,
+            values: [],
+            hue: this.model.get("hue") || undefined,
+            hueKeys: null,
+            domains: columns.map((name) => domains[name]?.nice ?? domainExtent(domains[name])),
+            pointSize: this.model.get("pointSize"),
+            opacity: this.model.get("opacity"),
+            selection: selectionBits(this.model.get("selection")),
+            width: this.width,
+            height: this.height,
+            setSelection: this.setSelection.bind(this),
+        };
+    }
+
+    /**
+     * Copia las columnas de la matriz, reutilizándolas mientras la tabla y
+     * las columnas no cambien.
+     * @param params - Parámetros obtenidos con `params()`.
+     * @returns Parámetros con los valores de cada columna.
+     */
+    async prepare(params: ScatterMatrixParams): Promise<ScatterMatrixParams> {
+        const table = (this.model as DataModel).table();
+        const columns = params.columns.map((name) => table.column(name));
+        if (columns.some((column) => !column)) return params;
+        const hue = params.hue ? table.column(params.hue) : undefined;
+        const { values, hueKeys } = await this.reuse([table, ...params.columns, params.hue], async () => ({
+            values: columns.map((column) => column!.numbers()),
+            hueKeys: hue ? hue.keys() : null,
+        }));
+        return { ...params, values, hueKeys };
+    }
+
+    /**
+     * Inicializa el widget, conecta listeners de cambios y renderiza.
+     * @param element - Elemento contenedor del widget.
+     */
+    plot(element: HTMLElement) {
+        this.widget = new ScatterMatrix(element);
+
+        this.model.on("change:dataColumns", () => this.replot(), this);
+        this.model.on("change:domains", () => this.replot(), this);
+        this.model.on("change:columns", () => this.replot(), this);
+        this.model.on("change:hue", () => this.replot(), this);
+        this.model.on("change:pointSize", () => this.replot(), this);
+        this.model.on("change:opacity", () => this.replot(), this);
+        // La selección solo repinta los puntos, sin rearmar la matriz
+        this.model.on("change:selection", () => {
+            const bits = selectionBits(this.model.get("selection"));
+            const current = this.widget.selection;
+            if (bits?.buffer !== current?.buffer) this.widget.setSelection(bits);
+        }, this);
+        window.addEventListener("resize", () => this.replot());
+
+        this.draw((params) => this.widget.plot(params));
+    }
+
+    /**
+     * Envía al kernel la selección como bytes y persiste cambios.
+     * @param bits - Mapa de bits de las filas seleccionadas, o null.
+     */
+    setSelection(bits: Uint8Array | null) {
+        const value = bits ? new DataView(bits.buffer, bits.byteOffset, bits.byteLength) : new DataView(new ArrayBuffer(0));
+        this.model.set({ selection: value });
+        this.model.save_changes();
+    }
+}
@@ -1,6 +1,9 @@
 import * as d3 from "d3";
 import { BasePlot } from "./baseplot";
-import { BaseModel, BaseView } from "../base/base";
+import { DataModel, BaseView } from "../base/base";
+import { domainExtent } from "../base/data_table";
+import { MISSING, scatterPoints } from "../base/compute";
+import { compute, recordKeys, recordNumbers } from "../base/compute_pool";
 
 import { 
     ClickSelectButton,   
@@ -9,10 +12,7 @@ import {
     SideBar
 } from "./tools/tools";
  
-import { 
-        ScatterPlotParams,
-        ProcessedScatterData
-    } from "./interface";
+import { ScatterPlotParams } from "./interface";
 
 const DEFAULT_COLOR = "#4299e1";
 
@@ -26,14 +26,14 @@ export class ScatterPlot extends BasePlot {
      * @param params - Datos, mapeos (x,y,hue,size), dimensiones, opacidad y callbacks.
      */
     plot(params: ScatterPlotParams): void {
-        const { data, x, y, size, height, hue,setSelectedValues, noSideBar } = params;
+        const { data, x, y, size, height, hue,setSelectedValues, noSideBar, xDomain, yDomain, sizeDomain, hueDomain } = params;
         let {width, opacity, pointSize} = params;
         opacity = opacity ?? 0.7;
         pointSize = pointSize ?? 5;
 
         if (!noSideBar) width = width ? width - SideBar.SIDE_BAR_WIDTH : 0;
 
-        let clickSelectButton: ClickSelectButton<SVGCircleElement> | null = null;
+        let clickSelectButton: ClickSelectButton<SVGCircleElement> | null = params.clickSelectButton ?? null;
         let deselectAllButton: DeselectAllButton | null = null;
         let boxSelectButton: BoxSelectButton<SVGCircleElement> | null = null;
 
@@ -44,58 +44,34 @@ export class ScatterPlot extends BasePlot {
         this.init(width, height);
 
         const GG = this.gGrid;
+        // Filas originales por índice: solo se leen al seleccionar
+        const row = params.row ?? ((index: number) => data[index]);
         /**
-         * Notifica al modelo los puntos seleccionados, filtrando metadatos internos.
+         * Notifica al modelo las filas originales de los puntos seleccionados.
          */
         function callUpdateSelected() {
             if (setSelectedValues) {
-                const selectedData = GG.selectAll(".scatter_dot.selected").data();
-                // Filtrar los atributos internos antes de guardar
-                const cleanedData = selectedData.map((d: any) => {
-                    const { x_, y_, id, originalData, size_, ...rest } = d;
-                    return originalData || rest; // Return original data if available, otherwise filtered data
-                });
-                setSelectedValues(cleanedData);
+                const selectedRows = GG.selectAll<SVGCircleElement, number>(".scatter_dot.selected").data();
+                setSelectedValues(selectedRows.map(row));
             }
         }
 
-        const mouseClick = (event: MouseEvent, d: ProcessedScatterData) => {
+        const mouseClick = (event: MouseEvent) => {
             if (clickSelectButton) {
                 clickSelectButton.selectionClickEffect(d3.select(event.currentTarget as SVGCircleElement));
                 callUpdateSelected();
             }
         };
-        // Procesar datos
-        const processedData: ProcessedScatterData[] = data
-            .map((row: any, index: number) => {
-                const xVal = Number.parseFloat(row[x]);
-                const yVal = Number.parseFloat(row[y]);
-
-                if (Number.isNaN(xVal) || Number.isNaN(yVal)) {
-                    return null;
-                }
-
-                const processed: ProcessedScatterData = {
-                    ...row,
-                    x_: xVal,
-                    y_: yVal,
-                    id: index,
-                    originalData: { ...row } // Store a copy of the original row
-                };
-
-
-                if (size && row[size] !== undefined) {
-                    const sizeVal = Number.parseFloat(row[size]);
-                    if (!Number.isNaN(sizeVal)) {
-                        processed.size_ = sizeVal;
-                    }
-                }
-
-                return processed;
-            })
-            .filter((d): d is ProcessedScatterData => d !== null);
+        // Puntos válidos en arreglos paralelos: calculados en un worker por la
+        // vista o aquí a partir de los registros
+        const points = params.points ?? scatterPoints({
+            x: recordNumbers(data, x),
+            y: recordNumbers(data, y),
+            size: size ? recordNumbers(data, size) : null,
+            hue: hue ? recordKeys(data, hue) : null,
+        });
 
-        if (processedData.length === 0) {
+        if (points.index.length === 0) {
             console.warn("No hay datos válidos para graficar");// mensajes de error
             return;
         }
@@ -103,24 +79,19 @@ export class ScatterPlot extends BasePlot {
             throw new Error("Width and height must be defined");// mensajes de error
         }
         // Crear escalas X e Y
-        const xExtent = d3.extent(processedData, d => d.x_) as [number, number];
-        const yExtent = d3.extent(processedData, d => d.y_) as [number, number];
+        const xExtent = xDomain ?? points.xExtent;
+        const yExtent = yDomain ?? points.yExtent;
 
         const xScale = this.getXLinearScale({ domain: xExtent, width });
         const yScale = this.getYLinearScale({ domain: yExtent, height });
 
-        // Escala de color categórica
+        // Escala de color categórica: un color por código de categoría
         let colorScale: d3.ScaleOrdinal<string, string>;
+        const labels = hue == null ? [] : Array.from(points.hueFirst, (index) => String(row(index)[hue]));
         if (hue == null) {
             colorScale = d3.scaleOrdinal<string, string>([DEFAULT_COLOR]);
         } else {
-            const categories = Array.from(
-                new Set(
-                    processedData
-                        .map(d => d[hue])
-                        .filter(v => v !== undefined && v !== null)
-                )
-            ).map(String);
+            const categories = hueDomain ?? labels;
 
             if (categories.length === 0) {
                 colorScale = d3.scaleOrdinal<string, string>([DEFAULT_COLOR]);
@@ -130,12 +101,14 @@ export class ScatterPlot extends BasePlot {
                     .range(d3.schemeCategory10);
             }
         }
+        const hueColors = labels.map((label) => colorScale(label));
+        const missingColor = hue == null ? DEFAULT_COLOR : colorScale("null");
 
         // Escala de tamaño
         let sizeScale: d3.ScaleLinear<number, number> | null = null;
 
-        if (size && processedData.some(d => d.size_ !== undefined)) {
-            const sizeExtent = d3.extent(processedData, d => d.size_) as [number, number];
+        if (size && points.sizeExtent) {
+            const sizeExtent = sizeDomain ?? points.sizeExtent;
             sizeScale = d3.scaleLinear()
                 .domain(sizeExtent)
                 .range([pointSize * 0.5, pointSize * 2]);
@@ -150,23 +123,26 @@ export class ScatterPlot extends BasePlot {
             yLabel: y
         });
 
-        const dots = GG.selectAll(".scatter_dot").data(processedData).enter().append("circle");
+        // Cada círculo guarda solo el índice de su fila; sus valores se leen
+        // de los arreglos por posición
+        const dots = GG.selectAll<SVGCircleElement, number>(".scatter_dot").data(points.index).enter().append("circle");
 
-        dots.attr("id", function (d, i) {
-                return "scatter_dot-" + randomString + "-" + d.id;
+        dots.attr("id", function (d) {
+                return "scatter_dot-" + randomString + "-" + d;
             })
             .attr('class','scatter_dot')
-            .attr("cx", d => xScale(d.x_))
-            .attr("cy", d => yScale(d.y_))
-            .attr("r", d => {
-                if (sizeScale && d.size_ !== undefined) {
-                    return sizeScale(d.size_);
+            .attr("cx", (d, i) => xScale(points.x[i]))
+            .attr("cy", (d, i) => yScale(points.y[i]))
+            .attr("r", (d, i) => {
+                if (sizeScale && points.size && !Number.isNaN(points.size[i])) {
+                    return sizeScale(points.size[i]);
                 }
                 return pointSize;
             })
-            .attr("fill", d => {
-                if (hue == null) return DEFAULT_COLOR;
-                return colorScale(String(d[hue]));
+            .attr("fill", (d, i) => {
+                if (!points.hue) return DEFAULT_COLOR;
+                const code = points.hue[i];
+                return code === MISSING ? missingColor : hueColors[code];
             })
             .attr("fill-opacity", opacity)
             .on("click", mouseClick);
@@ -201,7 +177,7 @@ export class ScatterPlot extends BasePlot {
  * Modelo para ScatterPlot.
  * Define propiedades reactivas: datos, mapeos, tamaño, opacidad y selección.
  */
-export class ScatterPlotModel extends BaseModel {
+export class ScatterPlotModel extends DataModel {
     /**
      * Valores por defecto del modelo.
      */
@@ -210,8 +186,6 @@ export class ScatterPlotModel extends BaseModel {
             ...super.defaults(),
             _model_name: ScatterPlotModel.model_name,
             _view_name: ScatterPlotModel.view_name,
-
-            dataRecords: [],
             x: String,
             y: String,
             hue: String,
@@ -240,8 +214,13 @@ export class ScatterPlotView extends BaseView<ScatterPlot> {
      * @returns Parámetros de renderizado para el scatter plot.
      */
     params(): ScatterPlotParams {
+        const domains = (this.model as DataModel).domains();
+        const table = (this.model as DataModel).table();
         return {
-            data: this.model.get("dataRecords"),
+            // Sin registros: los puntos se calculan en `prepare` y las filas
+            // se leen por índice solo al seleccionarlas
+            data: [],
+            row: (index: number) => table.row(index),
             x: this.model.get("x"),
             y: this.model.get("y"),
             hue: this.model.get("hue"),
@@ -252,9 +231,34 @@ export class ScatterPlotView extends BaseView<ScatterPlot> {
             width: this.width,
             height: this.height,
             noSideBar: false,
+            xDomain: domains[this.model.get("x")]?.nice,
+            yDomain: domains[this.model.get("y")]?.nice,
+            sizeDomain: domainExtent(domains[this.model.get("size")]),
         };
     }
 
+    /**
+     * Calcula en un worker los puntos válidos a partir de las columnas X, Y,
+     * tamaño y color, reutilizándolos mientras la tabla y las columnas no cambien.
+     * @param params - Parámetros obtenidos con `params()`.
+     * @returns Parámetros con los puntos calculados.
+     */
+    async prepare(params: ScatterPlotParams): Promise<ScatterPlotParams> {
+        const table = (this.model as DataModel).table();
+        const x = table.column(params.x);
+        const y = table.column(params.y);
+        if (!x || !y) return params;
+        const size = params.size ? table.column(params.size) : undefined;
+        const hue = params.hue ? table.column(params.hue) : undefined;
+        const points = await this.reuse([table, params.x, params.y, params.size, params.hue], () => compute("scatterPoints", () => ({
+            x: x.numbers(),
+            y: y.numbers(),
+            size: size ? size.numbers() : null,
+            hue: hue ? hue.keys() : null,
+        })));
+        return { ...params, points };
+    }
+
     /**
      * Inicializa el widget, conecta listeners de cambios y renderiza.
      * @param element - Elemento contenedor del widget.
@@ -262,7 +266,8 @@ export class ScatterPlotView extends BaseView<ScatterPlot> {
     plot(element: HTMLElement) {
         this.widget = new ScatterPlot(element);
 
-        this.model.on("change:dataRecords", () => this.replot(), this);
+        this.model.on("change:dataColumns", () => this.replot(), this);
+        this.model.on("change:domains", () => this.replot(), this);
         this.model.on("change:x", () => this.replot(), this);
         this.model.on("change:y", () => this.replot(), this);
         this.model.on("change:hue", () => this.replot(), this);
@@ -271,7 +276,7 @@ export class ScatterPlotView extends BaseView<ScatterPlot> {
         this.model.on("change:opacity", () => this.replot(), this);
         window.addEventListener("resize", () => this.replot());
 
-        this.widget.plot(this.params());
+        this.draw((params) => this.widget.plot(params));
     }
 
     /**
@@ -1,6 +1,9 @@
 import * as d3 from "d3";
 import { BasePlot } from "./baseplot";
-import { BaseModel, BaseView } from "../base/base";
+import { DataModel, BaseView } from "../base/base";
+import { domainExtent } from "../base/data_table";
+import { Projection, project, projectPoints } from "../base/compute";
+import { anchorCoordinates, compute, recordNumbers } from "../base/compute_pool";
 import { 
     ClickSelectButton, 
     BoxSelectButton,
@@ -33,7 +36,7 @@ export class StarCoordinates extends BasePlot {
      * @param dimensions - Lista de dimensiones a anclar.
      * @returns Arreglo de anclas con coordenadas normalizadas.
      */
-    private createAnchors(dimensions: string[]): StarCoordinatesAnchor[] {
+    createAnchors(dimensions: string[]): StarCoordinatesAnchor[] {
         const n = dimensions.length;
         return dimensions.map((feature, i) => {
             const angle = (2 * Math.PI * i) / n;
@@ -46,53 +49,18 @@ export class StarCoordinates extends BasePlot {
     }
 
     /**
-     * Crea escalas de normalización [0,1] por dimensión.
+     * Crea los puntos a dibujar a partir de una proyección.
      * @param data - Datos originales.
-     * @param dimensions - Dimensiones a normalizar.
-     * @returns Mapa dimensión -> escala lineal.
-     */
-    private createNormalizationScales(data: any[], dimensions: string[]): Record<string, d3.ScaleLinear<number, number>> {
-        const scales: Record<string, d3.ScaleLinear<number, number>> = {};
-        for (const key of dimensions) {
-            const extent = d3.extent(data, d => d[key]) as [number, number];
-            scales[key] = d3.scaleLinear()
-                .domain(extent)
-                .range([0, 1]);
-        }
-        return scales;
-    }
-
-    /**
-     * Calcula posiciones Star Coordinates para cada fila.
-     * @param data - Datos originales.
-     * @param dimensions - Dimensiones usadas para ponderar.
-     * @param anchors - Anclas con coordenadas unitarias.
-     * @param scales - Escalas de normalización por dimensión.
+     * @param projection - Coordenadas de cada fila en unidades del radio.
      * @returns Puntos posicionados con referencia al dato original.
      */
-    private calculateStarCoordinatesPositions(
-        data: any[], 
-        dimensions: string[], 
-        anchors: StarCoordinatesAnchor[], 
-        scales: Record<string, d3.ScaleLinear<number, number>>
-    ): StarCoordinatesPoint[] {
-        return data.map((d, index) => {
-            let x = 0, y = 0;
-            
-            for (let i = 0; i < dimensions.length; i++) {
-                const key = dimensions[i];
-                const normalizedValue = scales[key](d[key]);
-                x += normalizedValue * anchors[i].x;
-                y += normalizedValue * anchors[i].y;
-            }
-            
-            return {
-                x: x * this.chartRadius,
-                y: y * this.chartRadius,
-                originalData: d,
-                id: index
-            };
-        });
+    private createPoints(data: any[], projection: Projection): StarCoordinatesPoint[] {
+        return Array.from(projection.x, (x, index) => ({
+            x: x * this.chartRadius,
+            y: projection.y[index] * this.chartRadius,
+            originalData: data[index],
+            id: index
+        }));
     }
 
     /**
@@ -140,11 +108,17 @@ export class StarCoordinates extends BasePlot {
         // Create anchors
         const anchors = this.createAnchors(dimensions);
 
-        // Create normalization scales
-        const scales = this.createNormalizationScales(data, dimensions);
-
-        // Calculate Star Coordinates positions
-        const points = this.calculateStarCoordinatesPositions(data, dimensions, anchors, scales);
+        // Proyección: calculada en un worker por la vista o aquí a partir de los registros
+        const projection = params.projection ?? projectPoints({
+            columns: dimensions.map((key) => recordNumbers(data, key)),
+            extents: dimensions.map((key) => domainExtent(params.domains?.[key]) ?? null),
+            anchors: anchorCoordinates(anchors),
+            radial: false,
+        });
+        const points = this.createPoints(data, projection);
+        // Coordenadas recalculadas al arrastrar un ancla (la proyección puede estar compartida)
+        const draggedX = new Float64Array(points.length);
+        const draggedY = new Float64Array(points.length);
 
         // Create color scale
         let colorScale: d3.ScaleOrdinal<string, string>;
@@ -279,11 +253,14 @@ export class StarCoordinates extends BasePlot {
                     .attr('cy', mouseY);
                 
                 // Recalculate and update positions of all points
-                const updatedPoints = this.calculateStarCoordinatesPositions(data, dimensions, anchors, scales);
+                project(projection.normalized, dimensions.length, anchorCoordinates(anchors), false, draggedX, draggedY);
+                points.forEach((pt, i) => {
+                    pt.x = draggedX[i] * chartRadius;
+                    pt.y = draggedY[i] * chartRadius;
+                });
                 pointSelection
-                    .data(updatedPoints)
-                    .attr("cx", (pt: any) => pt.x)
-                    .attr("cy", (pt: any) => pt.y);
+                    .attr("cx", (pt: StarCoordinatesPoint) => pt.x)
+                    .attr("cy", (pt: StarCoordinatesPoint) => pt.y);
             })
             .on("end", function(event, d: StarCoordinatesAnchor) {
                 d3.select(this).attr("stroke-width", 2);
@@ -420,7 +397,7 @@ export class StarCoordinates extends BasePlot {
  * Modelo para StarCoordinates.
  * Define nombres de modelo/vista.
  */
-export class StarCoordinatesModel extends BaseModel {
+export class StarCoordinatesModel extends DataModel {
     /**
      * Valores por defecto del modelo.
      */
@@ -437,13 +414,13 @@ export class StarCoordinatesModel extends BaseModel {
  * Vista para StarCoordinates.
  * Construye parámetros, renderiza y sincroniza selección con el modelo.
  */
-export class StarCoordinatesView extends BaseView {
+export class StarCoordinatesView extends BaseView<StarCoordinates> {
     model: StarCoordinatesModel;
 
     /**
      * Datos del modelo.
      */
-    get dataRecords() { return this.model.get("dataRecords"); }
+    get dataRecords() { return (this.model as DataModel).table().records(); }
     /**
      * Dimensiones usadas como anclas.
      */
@@ -466,9 +443,31 @@ export class StarCoordinatesView extends BaseView {
             width: this.width,
             height: this.height,
             noSideBar: false,
+            domains: (this.model as DataModel).domains(),
         };
     }
 
+    /**
+     * Calcula en un worker la normalización y la proyección con las anclas
+     * iniciales, reutilizándolas mientras la tabla y las dimensiones no cambien.
+     * @param params - Parámetros obtenidos con `params()`.
+     * @returns Parámetros con la proyección calculada.
+     */
+    async prepare(params: StarCoordinatesParams): Promise<StarCoordinatesParams> {
+        const { dimensions } = params;
+        const table = (this.model as DataModel).table();
+        const columns = (dimensions || []).map((name) => table.column(name));
+        if (columns.length < 2 || columns.some((column) => !column)) return params;
+        const domains = params.domains ?? {};
+        const projection = await this.reuse([table, domains, dimensions.join("\u0000")], () => compute("projectPoints", () => ({
+            columns: columns.map((column) => column!.numbers()),
+            extents: dimensions.map((name) => domainExtent(domains[name]) ?? null),
+            anchors: anchorCoordinates(this.widget.createAnchors(dimensions)),
+            radial: false,
+        })));
+        return { ...params, projection };
+    }
+
     /**
      * Inicializa el widget, conecta listeners de cambios y renderiza.
      * @param element - Elemento contenedor del widget.
@@ -476,12 +475,13 @@ export class StarCoordinatesView extends BaseView {
     plot(element: HTMLElement) {
         this.widget = new StarCoordinates(element);
 
-        this.model.on("change:dataRecords", () => this.replot(), this);
+        this.model.on("change:dataColumns", () => this.replot(), this);
+        this.model.on("change:domains", () => this.replot(), this);
         this.model.on("change:dimensions", () => this.replot(), this);
         this.model.on("change:hue", () => this.replot(), this);
         window.addEventListener("resize", () => this.replot());
 
-        this.widget.plot(this.params());
+        this.draw((params) => this.widget.plot(params));
     }
 
     /**
@@ -130,7 +130,7 @@ export class BoxSelectButton<E extends SVGGraphicsElement = SVGGraphicsElement>
 			let overlap = false;
 
 			// Distintos tipos de elementos SVG
-			if (node.tagName === "rect") {
+			if (node.tagName === "rect" || node.tagName === "path") {
 				const bbox = node.getBBox();
 				overlap = !(bbox.x > x1 || bbox.x + bbox.width < x0 || bbox.y > y1 || bbox.y + bbox.height < y0);
 			} else if (node.tagName === "circle") {
@@ -7,4 +7,5 @@
 export * from './version';
 export * from './widgets';
 export * from './graphs';
-export * from './layouts';
\ No newline at end of file
+export * from './layouts';
+export * from './data';
\ No newline at end of file
@@ -13,6 +13,8 @@ import * as graphExports from './graphs';
 
 import * as layoutExports from './layouts';
 
+import * as dataExports from './data';
+
 import { MODULE_NAME, MODULE_VERSION } from './version';
 
 const EXTENSION_ID = 'vizproo-js:plugin';
@@ -43,6 +45,7 @@ function activateWidgetExtension(
     version: MODULE_VERSION,
     exports: { ...widgetExports, 
               ...graphExports, 
-              ...layoutExports }
+              ...layoutExports,
+              ...dataExports }
   });
 }
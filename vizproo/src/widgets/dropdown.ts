@@ -1,6 +1,6 @@
 import { BaseWidget } from "../base/base_widget";
 import { DropdownParams, DataRecord } from "./interface";
-import {BaseModel, BaseView} from '../base/base';
+import { DataModel, BaseView } from "../base/base";
 
 /**
  * Widget de selección (dropdown).
@@ -34,12 +34,17 @@ export class Dropdown extends BaseWidget {
 
     /**
      * Actualiza las opciones del dropdown.
-     * Si no hay opciones explícitas, se generan a partir de los datos y la variable.
+     * Si no hay opciones explícitas, se usan los valores distintos calculados
+     * en Python y, si no llegaron, se generan a partir de los datos.
      * @param data - Registros de datos para inferir opciones.
      * @param variable - Nombre de la columna usada para extraer opciones.
      * @param options - Lista explícita de opciones; si está vacía se infiere.
+     * @param dataOptions - Valores distintos de la variable calculados en Python.
      */
-    onOptionsChanged(data: DataRecord[], variable: string, options: string[]) {
+    onOptionsChanged(data: DataRecord[], variable: string, options: string[], dataOptions: any[] = []) {
+        if (options.length === 0 && dataOptions.length > 0) {
+            options = dataOptions;
+        }
         // If options is empty, populate it with unique values from data
         if(options.length === 0 && data.length > 0){
             options = [...new Set(data.map((d) => d[variable]))].sort((a, b) => {
@@ -72,7 +77,7 @@ export class Dropdown extends BaseWidget {
      * @param params - Datos, variable, descripción, opciones, valor, estado y callback.
      */
     plot(params: DropdownParams) {
-        const { data, variable, description, options, value, disabled, setValue } = params;
+        const { data, variable, description, options, dataOptions, value, disabled, setValue } = params;
         const randomString = Math.floor(
             Math.random() * Date.now() * 10000
         ).toString(36);
@@ -91,7 +96,7 @@ export class Dropdown extends BaseWidget {
         this.dropdown.appendChild(this.label);
         this.dropdown.appendChild(this.select);
 
-        this.onOptionsChanged(data, variable, options);
+        this.onOptionsChanged(data, variable, options, dataOptions);
 
         if (value) {
             this.select.value = value;
@@ -103,9 +108,9 @@ export class Dropdown extends BaseWidget {
 
 /**
  * Modelo del dropdown.
- * Define propiedades reactivas: dataRecords, variable, options, value y disabled.
+ * Define propiedades reactivas: dataColumns, variable, options, value y disabled.
  */
-export class DropdownModel extends BaseModel {
+export class DropdownModel extends DataModel {
   /**
    * Valores por defecto del modelo.
    */
@@ -114,11 +119,10 @@ export class DropdownModel extends BaseModel {
       ...super.defaults(),
       _model_name: DropdownModel.model_name,
       _view_name: DropdownModel.view_name,
-
-      dataRecords: [],
       variable: String,
       description: String,
       options: [],
+      dataOptions: [],
       value: String,
       disabled: false,
       elementId: String,
@@ -159,11 +163,15 @@ export class DropdownView extends BaseView {
    * Recalcula las opciones del dropdown desde el modelo.
    */
   setOptions(): void {
-    const data = this.model.get("dataRecords");
-    const variable = this.model.get("variable");
     const options = this.model.get("options");
+    const dataOptions = this.model.get("dataOptions");
+    // Solo se materializan los registros si Python no envió los valores distintos.
+    const data = options.length === 0 && dataOptions.length === 0
+      ? (this.model as DataModel).table().records()
+      : [];
+    const variable = this.model.get("variable");
 
-    this.widget.onOptionsChanged(data, variable, options);
+    this.widget.onOptionsChanged(data, variable, options, dataOptions);
   }
 
   /**
@@ -181,10 +189,11 @@ export class DropdownView extends BaseView {
    */
   params(): DropdownParams {
     return {
-      data: this.model.get("dataRecords"),
+      data: (this.model as DataModel).table().records(),
       variable: this.model.get("variable"),
       description: this.model.get("description"),
       options: this.model.get("options"),
+      dataOptions: this.model.get("dataOptions"),
       value: this.model.get("value"),
       disabled: this.model.get("disabled"),
       setValue: this.setValue.bind(this)
@@ -198,10 +207,11 @@ export class DropdownView extends BaseView {
   plot(element: HTMLElement): void {
     this.widget = new Dropdown(element);
 
-    this.model.on("change:dataRecords", () => this.setOptions(), this);
+    this.model.on("change:dataColumns", () => this.setOptions(), this);
     this.model.on("change:variable", () => this.setOptions(), this);
     this.model.on("change:description", () => this.setDescription(), this);
     this.model.on("change:options", () => this.setOptions(), this);
+    this.model.on("change:dataOptions", () => this.setOptions(), this);
     this.model.on("change:disabled", () => this.setDisabled(), this);
 
     this.widget.plot(this.params());
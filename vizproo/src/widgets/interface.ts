@@ -89,6 +89,10 @@ export interface DropdownParams extends BaseParams {
      * Lista explícita de opciones.
      */
     options: string[];
+    /**
+     * Valores distintos de la variable calculados en Python.
+     */
+    dataOptions?: any[];
     /**
      * Valor seleccionado actual.
      */
@@ -147,6 +151,10 @@ export interface RangeSliderParams extends BaseParams {
      * Límite superior del rango.
      */
     maxValue: number,
+    /**
+     * Mínimo y máximo de la variable calculados en Python.
+     */
+    extent?: [number, number],
     /**
      * Callback para actualizar los valores seleccionados.
      * @param from - Nuevo valor inicial.
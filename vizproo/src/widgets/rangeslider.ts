@@ -1,5 +1,6 @@
 import { BaseWidget } from "../base/base_widget";
-import { BaseModel, BaseView, WIDGET_MARGIN } from "../base/base";
+import { DataModel, BaseView, WIDGET_MARGIN } from "../base/base";
+import { domainExtent } from "../base/data_table";
 import { RangeSliderParams, MarginParams } from "./interface";
 import * as d3 from "d3";
 
@@ -30,12 +31,12 @@ export class RangeSlider extends BaseWidget {
      * @param params - Datos, variable, step, descripción, valores iniciales y callbacks.
      */
     plot(params: RangeSliderParams): void {
-        const { data, variable, step, description, fromValue, toValue, setValues, setMinMax, margin } = params;
+        const { data, variable, step, description, fromValue, toValue, extent, setValues, setMinMax, margin } = params;
         let { minValue, maxValue } = params;
         
         this.setValues = setValues;
         
-        const { min, max } = this.calculateMinMax(data, variable, minValue, maxValue);
+        const { min, max } = this.calculateMinMax(data, variable, minValue, maxValue, extent);
         minValue = min;
         maxValue = max;
 
@@ -59,12 +60,18 @@ export class RangeSlider extends BaseWidget {
      * @param variable - Nombre de la variable a evaluar.
      * @param minValue - Valor mínimo opcional.
      * @param maxValue - Valor máximo opcional.
+     * @param extent - Extensión calculada en Python; evita recorrer los datos.
      * @returns Objeto con propiedades min y max calculadas.
      */
-    private calculateMinMax(data: any[], variable: string, minValue?: number, maxValue?: number) {
+    private calculateMinMax(data: any[], variable: string, minValue?: number, maxValue?: number, extent?: [number, number]) {
         let min = minValue;
         let max = maxValue;
         
+        if (extent) {
+            if (!min) min = extent[0];
+            if (!max) max = extent[1];
+        }
+
         if (!min && data.length > 0) {
             min = d3.min(data, (d) => d[variable]);
         }
@@ -219,7 +226,7 @@ export class RangeSlider extends BaseWidget {
  * Modelo para RangeSlider.
  * Define propiedades reactivas para datos, variable, límites y metadatos.
  */
-export class RangeSliderModel extends BaseModel {
+export class RangeSliderModel extends DataModel {
   /**
    * Valores por defecto del modelo, incluyendo datos, variable y límites.
    */
@@ -228,8 +235,6 @@ export class RangeSliderModel extends BaseModel {
       ...super.defaults(),
       _model_name: RangeSliderModel.model_name,
       _view_name: RangeSliderModel.view_name,
-
-      dataRecords: [],
       variable: String,
       step: Number,
       description: String,
@@ -276,15 +281,19 @@ export class RangeSliderView extends BaseView {
    * @returns Parámetros actuales del modelo y callbacks.
    */
   params(): RangeSliderParams {
+    const variable = this.model.get("variable");
+    const extent = domainExtent((this.model as DataModel).domains()[variable]);
     return {
-      data: this.model.get("dataRecords"),
-      variable: this.model.get("variable"),
+      // Los registros solo se materializan si Python no envió la extensión.
+      data: extent ? [] : (this.model as DataModel).table().records(),
+      variable,
       step: this.model.get("step"),
       description: this.model.get("description"),
       fromValue: this.model.get("fromValue"),
       toValue: this.model.get("toValue"),
       minValue: this.model.get("minValue"),
       maxValue: this.model.get("maxValue"),
+      extent,
       setValues: this.setFromTo.bind(this),
       setMinMax: this.setMinMax.bind(this),
       margin: WIDGET_MARGIN
@@ -298,7 +307,8 @@ export class RangeSliderView extends BaseView {
   plot (element: HTMLElement): void {
     this.widget = new RangeSlider(element);
       
-    this.model.on("change:dataRecords", () => this.replot(), this);
+    this.model.on("change:dataColumns", () => this.replot(), this);
+    this.model.on("change:domains", () => this.replot(), this);
     this.model.on("change:variable", () => this.replot(), this);
     this.model.on("change:step", () => this.replot(), this);
     this.model.on("change:description", () => this.replot(), this);
@@ -3,12 +3,59 @@
 
 # Copyright (c) MATIUS.
 # Distributed under the terms of the Modified BSD License.
+import importlib
 import sys
 from ._version import __version__, version_info
-from .widgets import *
-from .graphs import *
-from .layouts import *
-from .custom import CustomWidget
+from .settings import settings
+
+# Los widgets se importan bajo demanda para que `import vizproo` no cargue
+# pandas, numpy, anywidget ni urllib3 hasta que se usen.
+_LAZY_ATTRIBUTES = {
+    "BaseWidget": ".base_widget",
+    "DataWidget": ".base_widget",
+    "TextBaseWidget": ".widgets",
+    "Button": ".widgets",
+    "Checkbox": ".widgets",
+    "Dropdown": ".widgets",
+    "Input": ".widgets",
+    "RangeSlider": ".widgets",
+    "TextArea": ".widgets",
+    "Text": ".widgets",
+    "BarPlot": ".graphs",
+    "ScatterPlot": ".graphs",
+    "RadViz": ".graphs",
+    "StarCoordinates": ".graphs",
+    "FacetGrid": ".graphs",
+    "facet": ".graphs",
+    "LineChart": ".graphs",
+    "HexbinPlot": ".graphs",
+    "ScatterMatrix": ".graphs",
+    "MatrixLayout": ".layouts",
+    "MatrixCreator": ".layouts",
+    "Dataset": ".dataset",
+    "DataSource": ".sources",
+    "ArrowFileSource": ".sources",
+    "SQLSource": ".sources",
+    "PolarsSource": ".sources",
+    "CustomWidget": ".custom",
+}
+
+__all__ = ["__version__", "version_info", "settings", *_LAZY_ATTRIBUTES]
+
+
+def __getattr__(name):
+    """Importa un atributo público la primera vez que se accede a él."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 if "google.colab.output" in sys.modules:
     sys.modules["google.colab.output"].enable_custom_widget_manager()
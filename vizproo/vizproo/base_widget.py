@@ -1,9 +1,22 @@
+import asyncio
+import inspect
+
 import ipywidgets as widgets
-from traitlets import Unicode
+from traitlets import Bool, Dict, Instance, List, Unicode, observe
 from ._frontend import module_name, module_version
+from .columns import (
+    ColumnTable,
+    live_sync,
+    send_background_columns,
+    sync_required_columns,
+    table_serialization,
+    update_table,
+)
+from .dataset import Dataset
+from .settings import settings
+from .sources import as_source
+
 
-import ipywidgets as widgets
-import pandas as pd
 class BaseWidget(widgets.DOMWidget):
     """
     Clase base para widgets personalizados en el frontend.
@@ -27,4 +40,434 @@ class BaseWidget(widgets.DOMWidget):
     _view_module_version = Unicode(module_version).tag(sync=True)
     _model_module_version = Unicode(module_version).tag(sync=True)
 
-    elementId = Unicode().tag(sync=True)
\ No newline at end of file
+    elementId = Unicode().tag(sync=True)
+
+    def _observe_callback(self, callback, names):
+        """Registra un callback de eventos, síncrono o `async def`.
+
+        Los callbacks síncronos se observan tal cual. Los asíncronos se
+        programan como tareas en el bucle asyncio del kernel, de modo que una
+        consulta lenta no bloquea los mensajes de los demás widgets. Si llega
+        un evento nuevo mientras la tarea anterior del mismo callback sigue
+        en curso, esa tarea se cancela. Sin un bucle en ejecución (por
+        ejemplo en un script) el callback se ejecuta hasta terminar. Las
+        excepciones de una tarea se registran en `self.log`.
+
+        Args:
+            callback (Callable): Función o corrutina que recibe el cambio.
+            names (List[str]): Traits observados.
+        """
+        if not inspect.iscoroutinefunction(callback):
+            self.observe(callback, names=names)
+            return
+
+        running = []
+
+        def report(task):
+            if task.cancelled():
+                return
+            error = task.exception()
+            if error is not None:
+                self.log.error(
+                    "Async callback %s failed", getattr(callback, "__qualname__", callback), exc_info=error
+                )
+
+        def schedule(change):
+            if running and not running[0].done():
+                running[0].cancel()
+            running.clear()
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                asyncio.run(callback(change))
+                return
+            task = loop.create_task(callback(change))
+            task.add_done_callback(report)
+            running.append(task)
+
+        self.observe(schedule, names=names)
+
+
+class DataWidget(BaseWidget):
+    """Base para widgets que sincronizan un conjunto de datos tabular.
+
+    Los datos se guardan como una `ColumnTable` compacta, que es la única copia
+    mantenida por el widget. La serialización hacia el frontend se realiza bajo
+    demanda, enviando las columnas numéricas como buffers binarios. Si los datos
+    son un `Dataset`, el widget solo sincroniza una referencia a él.
+
+    Solo se envían al frontend las columnas que el widget usa: las nombradas
+    por los traits listados en `_column_traits` más `tooltipColumns`. Al
+    cambiar esos traits se envían únicamente las columnas nuevas. Las
+    selecciones devuelven las columnas sincronizadas.
+
+    Reasignar los datos con el mismo contenido no envía nada; si solo cambian
+    algunas filas o columnas, se envía un parche con esos cambios (ver
+    `update_table`).
+
+    Los widgets que necesitan estadísticas de columnas (valores distintos,
+    agregados, etc.) las piden a la tabla en `_update_stats`, que se llama
+    al cambiar los datos o las columnas usadas. La tabla las guarda, por lo
+    que se calculan una sola vez aunque varios widgets las pidan.
+
+    Los datos también pueden ser una ruta a un archivo Parquet/Arrow, un
+    `LazyFrame` de Polars o una `DataSource`: el widget sincroniza solo la
+    reducción que le pide a la fuente en `_reduce_source` (por defecto una
+    muestra de las columnas usadas), calculada al abrirse y cada vez que
+    cambian esas columnas.
+
+    Attributes:
+        dataColumns (Instance): Tabla columnar sincronizada con el frontend.
+        dataset (Instance): Dataset compartido referenciado (opcional).
+        tooltipColumns (List): Columnas adicionales a sincronizar para
+            mostrarlas en tooltips y selecciones.
+        domains (Dict): Mínimo, máximo, dominio redondeado y cuantiles de
+            cada columna numérica sincronizada, calculados en Python una sola
+            vez por tabla.
+        compression (Bool): Comprime los datos enviados; None usa
+            `settings.compression`. No se sincroniza.
+    """
+
+    dataColumns = Instance(ColumnTable, args=()).tag(sync=True, **table_serialization)
+    dataset = Instance(Dataset, allow_none=True).tag(sync=True, **widgets.widget_serialization)
+    tooltipColumns = List(Unicode()).tag(sync=True)
+    domains = Dict().tag(sync=True)
+    compression = Bool(None, allow_none=True)
+
+    # Traits cuyos valores nombran columnas usadas; None sincroniza todas.
+    _column_traits = None
+    # Columnas presentes en el frontend; None antes de la primera sincronización.
+    _synced_columns = None
+    # Estadísticas del último envío de datos.
+    _payload_stats = {}
+    # Codificación en segundo plano en curso (ver `settings.parallel_encoding`).
+    _encoding = None
+    # True mientras el estado se serializa para enviarlo por el comm.
+    _live_sync = False
+    # True mientras se asigna una tabla cuyo cambio ya se envió como parche.
+    _table_patched = False
+    # Fuente de datos fuera de memoria (ver `vizproo.sources`).
+    _source = None
+    # Índice del DataFrame recibido en `data`; None con otros datos.
+    _index = None
+
+    def __init__(self, tooltip_columns=None, **kwargs):
+        """Inicializa el widget y observa los traits que nombran columnas.
+
+        Args:
+            tooltip_columns (List[str], optional): Columnas adicionales a
+                sincronizar.
+            **kwargs: Argumentos adicionales propagados a `BaseWidget`.
+        """
+        names = list(self._column_traits or ()) + ["tooltipColumns"]
+        self.observe(self._on_required_columns_change, names=names)
+        if tooltip_columns is not None:
+            self.tooltipColumns = list(tooltip_columns)
+        super().__init__(**kwargs)
+
+    def open(self):
+        """Abre el comm y envía las columnas codificadas en segundo plano."""
+        opening = self.comm is None
+        if opening and self._source is not None:
+            self._load_source()
+        with live_sync(self):
+            super().open()
+        if opening:
+            send_background_columns(self)
+
+    def send_state(self, key=None):
+        """Envía el estado por el comm.
+
+        Solo en este envío (y al abrir el comm) la tabla puede codificarse
+        en segundo plano; `get_state` y las exportaciones la codifican
+        completa.
+
+        Args:
+            key (str | List[str], optional): Traits a enviar; None envía todos.
+        """
+        with live_sync(self):
+            super().send_state(key)
+
+    def _should_send_property(self, key, value):
+        """Evita reenviar la tabla cuando su cambio ya viajó como parche."""
+        if key == "dataColumns" and self._table_patched:
+            return False
+        return super()._should_send_property(key, value)
+
+    def _reduce_source(self, source):
+        """Reduce una fuente de datos a la tabla que el widget dibuja.
+
+        Por defecto toma una muestra de `settings.sample_size` filas de las
+        columnas usadas. Los widgets que agregan o solo necesitan valores
+        distintos lo redefinen.
+
+        Args:
+            source (DataSource): Fuente de datos del widget.
+
+        Returns:
+            ColumnTable: Tabla a sincronizar.
+        """
+        required = self._required_columns()
+        names = [name for name in source.names if required is None or name in required]
+        return source.sample(names, settings.sample_size)
+
+    def _load_source(self):
+        """Reemplaza la tabla por la reducción actual de la fuente."""
+        self.dataColumns = self._reduce_source(self._source)
+
+    def _required_columns(self):
+        """Calcula las columnas que el frontend necesita.
+
+        Returns:
+            set[str] | None: Nombres de columnas requeridas, o None si el widget
+                usa todas las columnas.
+        """
+        if self._column_traits is None:
+            return None
+        names = set(self.tooltipColumns)
+        for trait in self._column_traits:
+            value = getattr(self, trait)
+            if isinstance(value, str):
+                names.add(value)
+            else:
+                names.update(value)
+        names.discard("")
+        return names
+
+    @property
+    def _table(self):
+        """Tabla completa del widget: la propia o la del dataset referenciado."""
+        if self.dataset is not None:
+            return self.dataset.dataColumns
+        return self.dataColumns
+
+    def _update_stats(self, table):
+        """Actualiza los traits derivados de estadísticas de columnas.
+
+        Por defecto no hace nada; los widgets que muestran valores distintos
+        o agregados lo redefinen consultando las estadísticas de `table`.
+
+        Args:
+            table (ColumnTable): Tabla completa del widget.
+        """
+
+    def _on_required_columns_change(self, change):
+        """Envía las columnas que pasan a ser necesarias tras un cambio."""
+        if self._source is not None:
+            if self.comm is not None:
+                self._load_source()
+            return
+        if self.dataset is not None:
+            sync_required_columns(self.dataset, self.dataset.dataColumns)
+        else:
+            sync_required_columns(self, self.dataColumns)
+        self._update_stats(self._table)
+
+    @observe("dataColumns")
+    def _on_data_columns_change(self, change):
+        """Recalcula los dominios y estadísticas al reemplazar los datos."""
+        sync_required_columns(self, change["new"])
+        self._update_stats(self._table)
+
+    @property
+    def stats(self):
+        """Estadísticas del último envío de datos al frontend.
+
+        Returns:
+            dict: `raw_bytes`, `sent_bytes`, `compression_ratio` y
+                `compression_time` (segundos). Si los datos son un `Dataset`,
+                se devuelven las del dataset.
+        """
+        if self.dataset is not None:
+            return self.dataset.stats
+        return dict(self._payload_stats)
+
+    @property
+    def data(self):
+        """Retorna los datos como DataFrame.
+
+        Returns:
+            pd.DataFrame: DataFrame construido desde `dataColumns` o desde el
+                dataset referenciado.
+        """
+        if self.dataset is not None:
+            return self.dataset.data
+        return self.dataColumns.to_frame()
+
+    @data.setter
+    def data(self, val):
+        """Establece los datos del widget.
+
+        Args:
+            val (pd.DataFrame | Dataset | DataSource | str): DataFrame a
+                convertir en columnas compactas, un `Dataset` compartido a
+                referenciar, o una fuente de datos (ruta a un archivo
+                Parquet/Arrow, `LazyFrame` de Polars o `DataSource`) a reducir.
+        """
+        if self.dataset is not None:
+            self.dataset._consumers.discard(self)
+        self._source = as_source(val)
+        self._index = None
+        if self._source is not None:
+            self.dataset = None
+            if self.comm is not None:
+                self._load_source()
+            else:
+                self.dataColumns = ColumnTable()
+        elif isinstance(val, Dataset):
+            self.dataColumns = ColumnTable()
+            val._consumers.add(self)
+            self.dataset = val
+            sync_required_columns(val, val.dataColumns)
+            self._update_stats(val.dataColumns)
+        else:
+            self.dataset = None
+            self._index = getattr(val, "index", None)
+            update_table(self, ColumnTable.from_frame(val))
+
+    def _rows_frame(self, table, rows):
+        """Arma un DataFrame con algunas filas de la tabla.
+
+        Args:
+            table (ColumnTable): Tabla de la que se toman las filas.
+            rows (np.ndarray): Posiciones de las filas.
+
+        Returns:
+            pd.DataFrame: Filas pedidas con el índice del DataFrame recibido
+                en `data`, o con sus posiciones si los datos no eran un
+                DataFrame.
+        """
+        import pandas as pd
+
+        index = rows if self._index is None else self._index[rows]
+        return pd.DataFrame({name: table.column(name)[rows] for name in table.names}, index=index)
+
+
+class StaticExportMixin:
+    """Exportación estática (SVG/PNG) para los gráficos que `static.py` sabe dibujar.
+
+    Se combina con `DataWidget` en ScatterPlot, BarPlot, RadViz y
+    StarCoordinates.
+    """
+
+    def to_svg(self, width=800, height=500):
+        """Exporta el gráfico como SVG sin navegador ni frontend.
+
+        El layout (escalas, ejes, proyecciones y colores) se calcula en
+        Python igual que en el frontend, por lo que sirve para generar
+        reportes estáticos en procesos por lotes.
+
+        Args:
+            width (int, optional): Ancho en píxeles. Por defecto 800.
+            height (int, optional): Alto en píxeles. Por defecto 500.
+
+        Returns:
+            str: Documento SVG.
+        """
+        from .static import render_svg
+
+        return render_svg(self, width, height)
+
+    def to_png(self, width=800, height=500, scale=1.0):
+        """Exporta el gráfico como PNG rasterizando su SVG.
+
+        Requiere el paquete opcional `cairosvg` (`pip install vizproo[png]`).
+
+        Args:
+            width (int, optional): Ancho en píxeles. Por defecto 800.
+            height (int, optional): Alto en píxeles. Por defecto 500.
+            scale (float, optional): Factor de escala del raster. Por defecto 1.0.
+
+        Returns:
+            bytes: Imagen PNG.
+        """
+        from .static import render_png
+
+        return render_png(self, width, height, scale)
+
+
+class ReducedDataWidget(DataWidget):
+    """Base para gráficos que reducen los datos en el kernel según la vista.
+
+    Los datos completos quedan en Python y al frontend solo se envía la
+    reducción que calcula `_reduce` (una ventana de la serie, los conteos
+    por celda, etc.), que se recalcula cuando cambian los datos, las
+    columnas usadas o los traits de la vista que la subclase observe
+    llamando a `_refresh`. De un `Dataset` se toma su tabla; de una fuente
+    de datos se leen completas solo las columnas que la reducción pide.
+    """
+
+    # Tabla completa en memoria; None si los datos son una fuente.
+    _full = None
+
+    @property
+    def data(self):
+        """Retorna los datos completos como DataFrame.
+
+        Returns:
+            pd.DataFrame: Datos completos, o la reducción sincronizada si los
+                datos son una fuente.
+        """
+        if self._full is None:
+            return self.dataColumns.to_frame()
+        return self._full.to_frame()
+
+    @data.setter
+    def data(self, val):
+        """Establece los datos del widget sin sincronizarlos completos.
+
+        Args:
+            val (pd.DataFrame | Dataset | DataSource | str): DataFrame, un
+                `Dataset` del que se toma su tabla, o una fuente de datos.
+        """
+        self._clear_reduction()
+        if as_source(val) is not None:
+            self._full = None
+            DataWidget.data.fset(self, val)
+            return
+        self._source = None
+        self.dataset = None
+        self._index = None if isinstance(val, Dataset) else getattr(val, "index", None)
+        self._full = val.dataColumns if isinstance(val, Dataset) else ColumnTable.from_frame(val)
+        self._refresh()
+
+    def _full_table(self, names):
+        """Devuelve la tabla completa, leyendo de la fuente las columnas pedidas.
+
+        Args:
+            names (List[str]): Columnas que necesita la reducción.
+
+        Returns:
+            ColumnTable: Tabla completa o columnas leídas de la fuente.
+        """
+        if self._full is not None:
+            return self._full
+        return self._source.read(list(dict.fromkeys(names)))
+
+    def _clear_reduction(self):
+        """Descarta los cálculos guardados sobre los datos anteriores."""
+
+    def _reduce(self):
+        """Calcula la tabla a sincronizar a partir de los datos completos.
+
+        Returns:
+            ColumnTable: Reducción de los datos.
+        """
+        raise NotImplementedError
+
+    def _reduce_source(self, source):
+        """Reduce la fuente leyendo solo las columnas que pide `_reduce`."""
+        return self._reduce()
+
+    def _refresh(self):
+        """Recalcula la reducción y la envía al frontend."""
+        if self._source is not None:
+            if self.comm is not None:
+                self._load_source()
+            return
+        if self._full is not None:
+            self.dataColumns = self._reduce()
+
+    def _on_required_columns_change(self, change):
+        """Recalcula la reducción al cambiar las columnas usadas."""
+        self._refresh()
@@ -0,0 +1,228 @@
+"""Caché en disco de columnas codificadas y estadísticas.
+
+Se activa con `settings.cache`. Cada entrada se identifica por la huella
+del contenido de las columnas (ver `ColumnTable.fingerprint`) más la
+versión de vizproo, de modo que volver a ejecutar un dashboard sobre los
+mismos datos no vuelve a codificarlos ni a recorrerlos: las columnas se
+leen mapeando en memoria su archivo y las estadísticas desde un JSON
+pequeño. El tamaño total se limita a `settings.cache_max_bytes`: al
+superarlo se borran primero las entradas usadas hace más tiempo hasta
+bajar a `_EVICT_TARGET` del límite, lo que deja margen a las escrituras
+siguientes. El tamaño se lleva sumando lo que escribe este proceso; el
+directorio solo se recorre la primera vez, al superar el límite o cada
+`_RESCAN_WRITES` escrituras (para contar lo que escriben otros procesos).
+
+Cada columna se guarda en dos archivos: `<clave>.json` con la descripción
+(tipo, dtype, diccionario y posición de cada buffer) y `<clave>.bin` con
+los buffers concatenados. Las estadísticas solo usan `<clave>.json`.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+
+from ._version import __version__
+from .settings import settings
+
+# Campos de una columna codificada que contienen buffers binarios.
+_BUFFER_FIELDS = ("data", "validity")
+# Fracción del tamaño máximo a la que se reduce la caché al superarlo.
+_EVICT_TARGET = 0.9
+# Escrituras tras las que se vuelve a recorrer el directorio.
+_RESCAN_WRITES = 1000
+
+# Directorio -> [bytes estimados, escrituras desde el último recorrido].
+_usage = {}
+_usage_lock = threading.Lock()
+
+
+def entry_key(*parts):
+    """Calcula la clave de una entrada a partir de sus componentes.
+
+    Args:
+        *parts: Valores con `repr` estable (huellas, nombres, parámetros).
+
+    Returns:
+        str: Clave hexadecimal.
+    """
+    digest = hashlib.blake2b(repr((__version__, parts)).encode(), digest_size=20)
+    return digest.hexdigest()
+
+
+def load_stat(key):
+    """Lee una estadística guardada.
+
+    Args:
+        key (str): Clave de la entrada.
+
+    Returns:
+        tuple[bool, Any]: Si se encontró y su valor.
+    """
+    path = _path(key, ".json")
+    try:
+        with open(path, encoding="utf-8") as file:
+            value = json.load(file)
+    except (OSError, ValueError):
+        return False, None
+    _touch(path)
+    return True, value
+
+
+def store_stat(key, value):
+    """Guarda una estadística si se puede representar como JSON.
+
+    Args:
+        key (str): Clave de la entrada.
+        value: Valor a guardar.
+    """
+    try:
+        text = json.dumps(value)
+    except (TypeError, ValueError):
+        return
+    _write(key, ".json", text.encode("utf-8"))
+    _evict()
+
+
+def load_column(key):
+    """Lee una columna codificada mapeando en memoria sus buffers.
+
+    Args:
+        key (str): Clave de la entrada.
+
+    Returns:
+        dict | None: Columna codificada sin `name`, o None si no existe.
+    """
+    meta_path = _path(key, ".json")
+    data_path = _path(key, ".bin")
+    try:
+        with open(meta_path, encoding="utf-8") as file:
+            meta = json.load(file)
+        with open(data_path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            view = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)) if size else memoryview(b"")
+    except (OSError, ValueError):
+        return None
+    buffers = meta.pop("buffers")
+    column = dict(meta)
+    for field, (offset, nbytes) in buffers.items():
+        column[field] = view[offset:offset + nbytes]
+    _touch(meta_path)
+    _touch(data_path)
+    return column
+
+
+def store_column(key, column):
+    """Guarda una columna codificada.
+
+    Args:
+        key (str): Clave de la entrada.
+        column (dict): Columna tal como la devuelve `_column_to_json`.
+    """
+    meta = {name: value for name, value in column.items() if name != "name" and name not in _BUFFER_FIELDS}
+    meta["buffers"] = {}
+    chunks = []
+    offset = 0
+    for field in _BUFFER_FIELDS:
+        value = column.get(field)
+        if isinstance(value, memoryview):
+            meta["buffers"][field] = [offset, value.nbytes]
+            chunks.append(value.cast("B"))
+            offset += value.nbytes
+        elif value is not None:
+            meta[field] = value
+    try:
+        text = json.dumps(meta)
+    except (TypeError, ValueError):
+        return
+    _write(key, ".bin", b"".join(chunks))
+    _write(key, ".json", text.encode("utf-8"))
+    _evict()
+
+
+def clear():
+    """Borra todas las entradas de la caché."""
+    for entry in _entries():
+        _remove(entry.path)
+    with _usage_lock:
+        _usage.pop(_directory(), None)
+
+
+def _directory():
+    """Directorio de la caché, creado si no existe."""
+    path = os.path.expanduser(settings.cache_dir)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _path(key, suffix):
+    return os.path.join(_directory(), key + suffix)
+
+
+def _write(key, suffix, payload):
+    """Escribe un archivo de forma atómica para no exponer entradas a medias."""
+    directory = _directory()
+    descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(payload)
+        os.replace(temporary, os.path.join(directory, key + suffix))
+    except OSError:
+        _remove(temporary)
+        return
+    with _usage_lock:
+        usage = _usage.get(directory)
+        if usage is not None:
+            usage[0] += len(payload)
+            usage[1] += 1
+
+
+def _touch(path):
+    """Marca una entrada como usada recién."""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _entries():
+    """Archivos de la caché (sin temporales en escritura)."""
+    with os.scandir(_directory()) as entries:
+        return [entry for entry in entries if entry.is_file() and not entry.name.endswith(".tmp")]
+
+
+def _evict():
+    """Borra las entradas menos usadas hasta respetar el tamaño máximo.
+
+    Mientras el tamaño estimado no supere el límite no recorre el directorio.
+    """
+    directory = _directory()
+    with _usage_lock:
+        usage = _usage.get(directory)
+        if usage is not None and usage[0] <= settings.cache_max_bytes and usage[1] < _RESCAN_WRITES:
+            return
+    files = []
+    for entry in _entries():
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+        files.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in files)
+    if total > settings.cache_max_bytes:
+        for _, size, path in sorted(files):
+            if total <= settings.cache_max_bytes * _EVICT_TARGET:
+                break
+            _remove(path)
+            total -= size
+    with _usage_lock:
+        _usage[directory] = [total, 0]
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
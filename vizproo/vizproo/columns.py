@@ -0,0 +1,1217 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import numpy as np
+from ipywidgets.widgets.widget import _remove_buffers
+
+from .settings import settings
+
+_log = logging.getLogger(__name__)
+
+# Enteros que el frontend puede leer como TypedArray, de menor a mayor tamaño.
+_INT_DTYPES = (np.int8, np.uint8, np.int16, np.uint16, np.int32, np.uint32)
+
+# Cuantiles incluidos en el dominio de cada columna numérica.
+_DOMAIN_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+# Cantidad de intervalos por defecto de los histogramas.
+_HISTOGRAM_BINS = 20
+
+# Cifras significativas que un float32 garantiza al convertirse de vuelta a
+# decimal (FLT_DIG); solo se reduce a float32 si ningún valor usa más.
+_FLOAT32_DIGITS = 6
+
+# Estadísticas que se guardan en la caché en disco cuando `settings.cache`
+# está activo.
+_PERSISTED_STATS = ("extent", "domain", "nulls", "value_counts", "histogram", "group_means")
+
+# Fracción máxima de filas cambiadas para enviar un parche por filas en lugar
+# de la columna completa.
+_PATCH_ROWS_FRACTION = 0.1
+
+# Codificaciones de ancho fijo que admiten parches por filas.
+_PATCHABLE_KINDS = ("number", "bool", "datetime")
+
+# Pool compartido para la codificación en paralelo; se crea al primer uso.
+_encoding_executor = None
+
+# Protege las estadísticas de las tablas, que también escriben los hilos de
+# codificación.
+_stats_lock = threading.Lock()
+
+class ColumnTable:
+    """Tabla columnar compacta usada como única copia de los datos de un widget.
+
+    Cada columna se guarda como un arreglo NumPy contiguo (o un
+    `pd.Categorical` para columnas categóricas). La tabla es
+    inmutable: reemplazar los datos de un widget implica crear una nueva
+    tabla, por lo que cualquier valor derivado puede asociarse a la instancia.
+
+    Las estadísticas por columna (extensión, dominio, valores distintos,
+    faltantes, histogramas y promedios por grupo) se calculan de forma
+    perezosa y vectorizada la primera vez que un widget las pide y quedan
+    guardadas en la tabla. Los widgets que comparten un `Dataset` comparten
+    su tabla, así que cada estadística se calcula una sola vez por dataset.
+
+    Attributes:
+        length (int): Cantidad de filas de la tabla.
+    """
+
+    def __init__(self, columns=None, length=0):
+        """Inicializa la tabla a partir de un diccionario de arreglos.
+
+        Args:
+            columns (dict[str, np.ndarray | pd.Categorical], optional): Columnas
+                por nombre.
+            length (int, optional): Cantidad de filas. Por defecto 0.
+        """
+        self._columns = dict(columns or {})
+        self.length = length
+        self._stats = {}
+
+    @classmethod
+    def from_frame(cls, frame):
+        """Construye la tabla copiando cada columna de un DataFrame.
+
+        Args:
+            frame (pd.DataFrame): Datos fuente.
+
+        Returns:
+            ColumnTable: Tabla con una copia compacta de cada columna.
+        """
+        columns = {}
+        for name in frame.columns:
+            columns[str(name)] = _compact_array(frame[name])
+        return cls(columns, len(frame))
+
+    @property
+    def names(self):
+        """Lista de nombres de columnas en orden."""
+        return list(self._columns)
+
+    @property
+    def nbytes(self):
+        """Bytes ocupados por los arreglos de la tabla."""
+        return sum(array.nbytes for array in self._columns.values())
+
+    def column(self, name):
+        """Devuelve el arreglo de una columna.
+
+        Args:
+            name (str): Nombre de la columna.
+
+        Returns:
+            np.ndarray: Arreglo de la columna.
+
+        Raises:
+            KeyError: Si la columna no existe.
+        """
+        return self._columns[name]
+
+    def _cached(self, key, compute, *args):
+        """Calcula una estadística una sola vez y la guarda en la tabla.
+
+        Args:
+            key (tuple): Clave de la estadística (nombre y argumentos).
+            compute (Callable): Función que calcula el valor.
+            *args: Argumentos para `compute`.
+
+        Returns:
+            Any: Valor de la estadística.
+        """
+        with _stats_lock:
+            if key in self._stats:
+                return self._stats[key]
+        # Se calcula fuera del lock; si otro hilo se adelantó, gana su valor.
+        if settings.cache and key[0] in _PERSISTED_STATS:
+            value = self._cached_on_disk(key, compute, *args)
+        else:
+            value = compute(*args)
+        return self._remember(key, value)
+
+    def _remember(self, key, value):
+        """Guarda una estadística si aún no está y devuelve la guardada.
+
+        Args:
+            key (tuple): Clave de la estadística.
+            value (Any): Valor calculado.
+
+        Returns:
+            Any: Valor guardado para la clave.
+        """
+        with _stats_lock:
+            return self._stats.setdefault(key, value)
+
+    def _cached_on_disk(self, key, compute, *args):
+        """Busca una estadística en la caché en disco o la calcula y la guarda.
+
+        La clave en disco reemplaza los nombres de columnas por la huella de
+        su contenido e incluye los argumentos que no son columnas (por
+        ejemplo la extensión de `domain`).
+
+        Args:
+            key (tuple): Clave de la estadística.
+            compute (Callable): Función que calcula el valor.
+            *args: Argumentos para `compute`.
+
+        Returns:
+            Any: Valor de la estadística.
+        """
+        from . import cache
+
+        parts = [self.fingerprint(part) if isinstance(part, str) and part in self else part for part in key]
+        parts += [arg for arg in args if not hasattr(arg, "dtype")]
+        disk_key = cache.entry_key("stat", *parts)
+        found, value = cache.load_stat(disk_key)
+        if found:
+            # JSON no distingue tuplas; las estadísticas que son tuplas lo son en el primer nivel.
+            return tuple(value) if isinstance(value, list) else value
+        value = compute(*args)
+        cache.store_stat(disk_key, value)
+        return value
+
+    def extent(self, name):
+        """Devuelve el mínimo y el máximo de una columna numérica.
+
+        Args:
+            name (str): Nombre de la columna.
+
+        Returns:
+            tuple[float, float] | None: Extensión de los valores finitos, o
+                None si la columna no es numérica o no tiene valores.
+        """
+        return self._cached(("extent", name), _column_extent, self._columns[name])
+
+    def domain(self, name):
+        """Devuelve los estadísticos de escala de una columna numérica.
+
+        Args:
+            name (str): Nombre de la columna.
+
+        Returns:
+            dict | None: `min`, `max`, `nice` (dominio redondeado como el
+                `scale.nice()` de d3) y `quantiles`, o None si la columna no
+                es numérica o no tiene valores.
+        """
+        return self._cached(("domain", name), _column_domain, self._columns[name], self.extent(name))
+
+    def null_count(self, name):
+        """Cuenta los valores faltantes de una columna.
+
+        Args:
+            name (str): Nombre de la columna.
+
+        Returns:
+            int: Cantidad de filas sin valor.
+        """
+        return self._cached(("nulls", name), _null_count, self._columns[name])
+
+    def value_counts(self, name):
+        """Devuelve los valores distintos de una columna y sus frecuencias.
+
+        Args:
+            name (str): Nombre de la columna.
+
+        Returns:
+            tuple[list, list[int]]: Valores distintos ordenados (sin
+                faltantes) y la cantidad de filas de cada uno.
+        """
+        return self._cached(("value_counts", name), _value_counts, self._columns[name])
+
+    def histogram(self, name, bins=_HISTOGRAM_BINS):
+        """Calcula el histograma de una columna numérica.
+
+        Args:
+            name (str): Nombre de la columna.
+            bins (int, optional): Cantidad de intervalos. Por defecto 20.
+
+        Returns:
+            dict | None: Bordes (`edges`) y frecuencias (`counts`) de los
+                intervalos, o None si la columna no es numérica.
+        """
+        return self._cached(
+            ("histogram", name, bins), _histogram, self._columns[name], self.extent(name), bins
+        )
+
+    def group_means(self, by, value):
+        """Promedia una columna numérica por cada grupo de otra columna.
+
+        Los grupos se identifican con el texto que el frontend usa para sus
+        categorías, de modo que el resultado sirve como dominio de las
+        barras.
+
+        Args:
+            by (str): Columna de los grupos.
+            value (str): Columna numérica a promediar.
+
+        Returns:
+            tuple[list[str], list[float]] | None: Grupos ordenados y el
+                promedio de cada uno, o None si las columnas no lo permiten.
+        """
+        return self._cached(
+            ("group_means", by, value), _group_means, self._columns[by], self._columns[value]
+        )
+
+    def fingerprint(self, name):
+        """Devuelve un hash del contenido de una columna.
+
+        Dos columnas con los mismos valores tienen la misma huella aunque
+        provengan de DataFrames distintos.
+
+        Args:
+            name (str): Nombre de la columna.
+
+        Returns:
+            str: Hash hexadecimal del contenido.
+        """
+        return self._cached(("fingerprint", name), _column_fingerprint, self._columns[name])
+
+    def save(self, directory):
+        """Guarda la tabla en un directorio para abrirla luego mapeada en memoria.
+
+        Cada columna se escribe como un archivo `.npy`; los textos y
+        categóricas se guardan como códigos enteros más la lista de valores
+        en `manifest.json`, junto con la huella de cada columna. Solo se
+        admiten columnas numéricas, de fechas o de valores que se puedan
+        factorizar en categorías JSON: los archivos nunca contienen objetos
+        de Python, así que abrirlos no ejecuta código.
+
+        Args:
+            directory (str | os.PathLike): Directorio de destino (se crea).
+
+        Raises:
+            TypeError: Si alguna columna no se puede guardar sin pickle.
+        """
+        import pandas as pd
+
+        # Se valida todo antes de escribir para no dejar tablas a medias.
+        entries = []
+        for i, name in enumerate(self.names):
+            array = self._columns[name]
+            entry = {"name": name, "file": f"{i}.npy", "fingerprint": self.fingerprint(name)}
+            if isinstance(array, pd.Categorical):
+                categories, values = array.categories.tolist(), array.codes
+            elif array.dtype.kind == "O":
+                categories, values = None, None
+                try:
+                    codes, uniques = pd.factorize(array)
+                    categories, values = uniques.tolist(), codes
+                except TypeError:
+                    pass
+            else:
+                categories, values = None, array
+            if categories is not None:
+                try:
+                    json.dumps(categories)
+                except (TypeError, ValueError):
+                    values = None
+                entry["categories"] = categories
+            if values is None or values.dtype.kind not in "biufM":
+                raise TypeError(
+                    f"Column {name!r} cannot be shared: only numeric, datetime and "
+                    "categorical columns with JSON-serializable values are supported"
+                )
+            entries.append((entry, values))
+
+        os.makedirs(directory, exist_ok=True)
+        for entry, values in entries:
+            np.save(os.path.join(directory, entry["file"]), values, allow_pickle=False)
+        manifest = {"length": self.length, "columns": [entry for entry, _ in entries]}
+        with open(os.path.join(directory, "manifest.json"), "w", encoding="utf-8") as file:
+            json.dump(manifest, file)
+
+    @classmethod
+    def load(cls, directory):
+        """Abre una tabla guardada con `save` sin copiar sus columnas.
+
+        Los arreglos se mapean en memoria en modo solo lectura, por lo que
+        varios procesos que abren la misma tabla comparten sus páginas. Las
+        huellas guardadas evitan recorrer los datos para calcularlas.
+
+        Args:
+            directory (str | os.PathLike): Directorio escrito por `save`.
+
+        Returns:
+            ColumnTable: Tabla respaldada por los archivos.
+        """
+        import pandas as pd
+
+        with open(os.path.join(directory, "manifest.json"), encoding="utf-8") as file:
+            manifest = json.load(file)
+        columns = {}
+        for entry in manifest["columns"]:
+            path = os.path.join(directory, entry["file"])
+            # Nunca se cargan objetos con pickle: el directorio puede ser compartido.
+            values = np.load(path, mmap_mode="r", allow_pickle=False)
+            if "categories" in entry:
+                values = pd.Categorical.from_codes(values, entry["categories"])
+            columns[entry["name"]] = values
+        table = cls(columns, manifest["length"])
+        for entry in manifest["columns"]:
+            table._stats[("fingerprint", entry["name"])] = entry["fingerprint"]
+        return table
+
+    def to_frame(self):
+        """Reconstruye un DataFrame con las columnas de la tabla.
+
+        Returns:
+            pd.DataFrame: DataFrame equivalente a la tabla.
+        """
+        import pandas as pd
+
+        return pd.DataFrame(self._columns, index=pd.RangeIndex(self.length))
+
+    def __contains__(self, name):
+        return name in self._columns
+
+    def __len__(self):
+        return self.length
+
+
+def _compact_array(series):
+    """Convierte una columna de pandas en un arreglo NumPy compacto y propio.
+
+    Args:
+        series (pd.Series): Columna fuente.
+
+    Returns:
+        np.ndarray | pd.Categorical: Copia contigua de la columna.
+    """
+    import pandas as pd
+
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return series.array.copy()
+    if isinstance(dtype, pd.api.extensions.ExtensionDtype):
+        if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+            return series.to_numpy(dtype="float64", na_value=np.nan)
+        if isinstance(dtype, pd.DatetimeTZDtype):
+            return series.dt.tz_convert(None).to_numpy(copy=True)
+        return series.to_numpy(dtype=object, na_value=None)
+    return np.ascontiguousarray(series.to_numpy(copy=True))
+
+
+def _numeric_values(array):
+    """Devuelve los valores finitos de una columna numérica, o None."""
+    if not isinstance(array, np.ndarray) or array.dtype.kind not in "iuf":
+        return None
+    return array[np.isfinite(array)] if array.dtype.kind == "f" else array
+
+
+def _column_extent(array):
+    """Calcula el mínimo y el máximo de una columna numérica.
+
+    Args:
+        array (np.ndarray | pd.Categorical): Arreglo de la columna.
+
+    Returns:
+        tuple[float, float] | None: Extensión, o None si no es numérica.
+    """
+    values = _numeric_values(array)
+    if values is None or not values.size:
+        return None
+    return float(values.min()), float(values.max())
+
+
+def _column_domain(array, extent):
+    """Calcula mínimo, máximo, dominio redondeado y cuantiles de una columna.
+
+    Args:
+        array (np.ndarray | pd.Categorical): Arreglo de la columna.
+        extent (tuple[float, float] | None): Extensión ya calculada.
+
+    Returns:
+        dict | None: Dominio de la columna, o None si no es numérica.
+    """
+    if extent is None:
+        return None
+    values = _numeric_values(array)
+    low, high = extent
+    return {
+        "min": low,
+        "max": high,
+        "nice": list(_nice_domain(low, high)),
+        "quantiles": np.quantile(values, _DOMAIN_QUANTILES).tolist(),
+    }
+
+
+def _column_fingerprint(array):
+    """Calcula un hash del dtype y los valores de una columna."""
+    import pandas as pd
+
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(array, pd.Categorical):
+        digest.update(b"category")
+        digest.update(np.ascontiguousarray(array.codes).tobytes())
+        digest.update(pd.util.hash_array(np.asarray(array.categories, dtype=object)).tobytes())
+    elif array.dtype.kind == "O":
+        digest.update(b"object")
+        try:
+            digest.update(pd.util.hash_array(array).tobytes())
+        except TypeError:
+            digest.update(repr(array.tolist()).encode())
+    else:
+        digest.update(array.dtype.str.encode())
+        digest.update(memoryview(np.ascontiguousarray(array).view(np.uint8)))
+    return digest.hexdigest()
+
+
+def _null_count(array):
+    """Cuenta los valores faltantes de una columna."""
+    import pandas as pd
+
+    if isinstance(array, pd.Categorical):
+        return int((array.codes < 0).sum())
+    if array.dtype.kind in "iub":
+        return 0
+    return int(pd.isna(array).sum())
+
+
+def _value_counts(array):
+    """Calcula los valores distintos ordenados y sus frecuencias.
+
+    Args:
+        array (np.ndarray | pd.Categorical): Arreglo de la columna.
+
+    Returns:
+        tuple[list, list[int]]: Valores distintos y frecuencias.
+    """
+    import pandas as pd
+
+    if isinstance(array, np.ndarray) and array.dtype.kind in "iufb":
+        values = array[~np.isnan(array)] if array.dtype.kind == "f" else array
+        uniques, counts = np.unique(values, return_counts=True)
+        return uniques.tolist(), counts.tolist()
+    counts = pd.Series(array).value_counts(sort=False, dropna=True)
+    try:
+        counts = counts.sort_index()
+    except TypeError:
+        counts = counts.iloc[np.argsort(counts.index.astype(str), kind="stable")]
+    counts = counts[counts > 0]
+    return counts.index.tolist(), counts.to_numpy().tolist()
+
+
+def _histogram(array, extent, bins):
+    """Calcula el histograma de una columna numérica.
+
+    Args:
+        array (np.ndarray | pd.Categorical): Arreglo de la columna.
+        extent (tuple[float, float] | None): Extensión ya calculada.
+        bins (int): Cantidad de intervalos.
+
+    Returns:
+        dict | None: Bordes y frecuencias, o None si no es numérica.
+    """
+    if extent is None:
+        return None
+    counts, edges = np.histogram(_numeric_values(array), bins=bins, range=extent)
+    return {"edges": edges.tolist(), "counts": counts.tolist()}
+
+
+def _category_label(value):
+    """Convierte un valor en el texto que produce `String(value)` en JavaScript."""
+    if value is None or _is_missing(value):
+        return "null"
+    if isinstance(value, (bool, np.bool_)):
+        return "true" if value else "false"
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _group_means(groups, values):
+    """Promedia `values` por cada grupo distinto de `groups`.
+
+    Args:
+        groups (np.ndarray | pd.Categorical): Columna de los grupos.
+        values (np.ndarray | pd.Categorical): Columna numérica.
+
+    Returns:
+        tuple[list[str], list[float]] | None: Grupos y promedios, o None si
+            los valores no son numéricos o los grupos son fechas.
+    """
+    import pandas as pd
+
+    if not isinstance(values, np.ndarray) or values.dtype.kind not in "iuf":
+        return None
+    if isinstance(groups, np.ndarray) and groups.dtype.kind == "M":
+        return None
+    codes, uniques = pd.factorize(groups, use_na_sentinel=False)
+    values = values.astype(np.float64, copy=False)
+    # Como `AVG` en SQL, los valores faltantes no cuentan en el promedio
+    present = np.isfinite(values)
+    counts = np.bincount(codes, weights=present, minlength=len(uniques))
+    sums = np.bincount(codes, weights=np.where(present, values, 0.0), minlength=len(uniques))
+    labels = [_category_label(value) for value in np.asarray(uniques, dtype=object).tolist()]
+    order = sorted(range(len(labels)), key=lambda i: (labels[i].casefold(), labels[i]))
+    means = np.divide(sums, counts, out=np.full(len(uniques), np.nan), where=counts > 0)
+    return [labels[i] for i in order], [float(means[i]) for i in order]
+
+
+def _tick_increment(start, stop, count):
+    """Paso entre ticks equivalente a `d3.tickIncrement`."""
+    step = (stop - start) / max(0, count)
+    power = np.floor(np.log10(step))
+    error = step / 10 ** power
+    factor = 10 if error >= 50 ** 0.5 else 5 if error >= 10 ** 0.5 else 2 if error >= 2 ** 0.5 else 1
+    if power >= 0:
+        return factor * 10 ** power
+    return -(10 ** -power) / factor
+
+
+def _nice_domain(start, stop, count=10):
+    """Extiende un dominio a valores redondos como `scale.nice()` de d3.
+
+    Args:
+        start (float): Mínimo del dominio.
+        stop (float): Máximo del dominio.
+        count (int, optional): Cantidad aproximada de ticks. Por defecto 10.
+
+    Returns:
+        tuple[float, float]: Dominio redondeado.
+    """
+    previous = None
+    for _ in range(10):
+        if stop <= start:
+            break
+        step = _tick_increment(start, stop, count)
+        if step == previous:
+            break
+        if step > 0:
+            start = np.floor(start / step) * step
+            stop = np.ceil(stop / step) * step
+        elif step < 0:
+            start = np.ceil(start * step) / step
+            stop = np.floor(stop * step) / step
+        else:
+            break
+        previous = step
+    return float(start), float(stop)
+
+
+def _column_to_json(name, array):
+    """Serializa una columna para el frontend con una codificación compacta.
+
+    La codificación se elige según el dtype:
+
+    - `number`: enteros con el tipo más pequeño que los contiene y flotantes
+      reducidos a float32 cuando no se pierden cifras significativas.
+    - `bool`: un byte por valor.
+    - `datetime`: milisegundos desde la época como int64.
+    - `dictionary`: textos y categóricas como códigos enteros más la lista
+      de valores distintos.
+
+    Los valores faltantes de columnas no flotantes se indican con un mapa de
+    bits de validez (`validity`, un bit por fila, 1 si el valor existe).
+
+    Args:
+        name (str): Nombre de la columna.
+        array (np.ndarray | pd.Categorical): Arreglo de la columna.
+
+    Returns:
+        dict: Descripción de la columna con su `kind`, `dtype` y `data`.
+    """
+    import pandas as pd
+
+    if isinstance(array, pd.Categorical):
+        codes = array.codes
+        return _dictionary_column(name, codes, codes >= 0, array.categories.tolist())
+    kind = array.dtype.kind
+    if kind == "b":
+        return {"name": name, "kind": "bool", "dtype": "uint8", "data": memoryview(array.view(np.uint8))}
+    if kind in "iu":
+        return {"name": name, "kind": "number", **_integer_payload(array, None)}
+    if kind == "f":
+        return _float_column(name, array)
+    if kind == "M":
+        return _datetime_column(name, array)
+    try:
+        codes, uniques = pd.factorize(array)
+    except TypeError:
+        values = [None if _is_missing(v) else v for v in array.tolist()]
+        return {"name": name, "kind": "list", "data": values}
+    return _dictionary_column(name, codes, codes >= 0, uniques.tolist())
+
+
+def _integer_payload(values, valid):
+    """Codifica enteros con el TypedArray más pequeño que los contiene.
+
+    Args:
+        values (np.ndarray): Valores enteros (o flotantes sin decimales).
+        valid (np.ndarray | None): Máscara de valores presentes.
+
+    Returns:
+        dict: Campos `dtype`, `data` y, si hay faltantes, `validity`.
+    """
+    if valid is not None and valid.all():
+        valid = None
+    present = values if valid is None else values[valid]
+    low, high = (present.min(), present.max()) if present.size else (0, 0)
+    payload = {}
+    for dtype in _INT_DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            data = values if valid is None else np.where(valid, values, 0)
+            payload = {"dtype": np.dtype(dtype).name, "data": memoryview(data.astype(dtype))}
+            break
+    else:
+        data = values.astype(np.float64)
+        if valid is not None:
+            data[~valid] = np.nan
+        return {"dtype": "float64", "data": memoryview(data)}
+    if valid is not None:
+        payload["validity"] = memoryview(np.packbits(valid, bitorder="little"))
+    return payload
+
+
+def _float_column(name, array):
+    """Codifica una columna flotante como enteros, float32 o float64.
+
+    Args:
+        name (str): Nombre de la columna.
+        array (np.ndarray): Arreglo flotante.
+
+    Returns:
+        dict: Descripción de la columna.
+    """
+    valid = ~np.isnan(array)
+    present = array[valid]
+    if (
+        present.size
+        and np.isfinite(present).all()
+        and np.abs(present).max() <= np.iinfo(np.uint32).max
+        and (present == np.round(present)).all()
+    ):
+        values = np.where(valid, array, 0).astype(np.int64)
+        return {"name": name, "kind": "number", **_integer_payload(values, valid)}
+    if array.dtype == np.float64 and _fits_float32(present):
+        array = array.astype(np.float32)
+    elif array.dtype != np.float32:
+        array = array.astype(np.float64)
+    return {"name": name, "kind": "number", "dtype": array.dtype.name, "data": memoryview(array)}
+
+
+def _fits_float32(values):
+    """Indica si los valores se recuperan exactamente tras pasar por float32.
+
+    Se exige que cada valor tenga a lo sumo `_FLOAT32_DIGITS` cifras
+    significativas, que esté en el rango normal de float32 y que su valor
+    float32 redondeado a esas cifras dé de vuelta el original, que es como
+    el frontend lo restaura.
+
+    Args:
+        values (np.ndarray): Valores float64 no faltantes.
+
+    Returns:
+        bool: True si la columna puede enviarse como float32.
+    """
+    values = values[values != 0]
+    if not values.size:
+        return True
+    if not np.isfinite(values).all():
+        return False
+    magnitude = np.abs(values)
+    info = np.finfo(np.float32)
+    if magnitude.max() > info.max or magnitude.min() < info.tiny:
+        return False
+    exponent = np.floor(np.log10(magnitude))
+    scale = 10.0 ** (_FLOAT32_DIGITS - 1 - exponent)
+    if not np.allclose(np.round(values * scale) / scale, values, rtol=1e-12, atol=0):
+        return False
+    restored = np.round(values.astype(np.float32).astype(np.float64) * scale) / scale
+    return bool(np.allclose(restored, values, rtol=1e-12, atol=0))
+
+
+def _datetime_column(name, array):
+    """Codifica fechas como milisegundos int64 desde la época.
+
+    Args:
+        name (str): Nombre de la columna.
+        array (np.ndarray): Arreglo `datetime64`.
+
+    Returns:
+        dict: Descripción de la columna.
+    """
+    valid = ~np.isnat(array)
+    millis = np.where(valid, array.astype("datetime64[ms]").view(np.int64), 0)
+    column = {"name": name, "kind": "datetime", "dtype": "int64", "data": memoryview(millis)}
+    if not valid.all():
+        column["validity"] = memoryview(np.packbits(valid, bitorder="little"))
+    return column
+
+
+def _dictionary_column(name, codes, valid, dictionary):
+    """Codifica una columna como códigos enteros sobre un diccionario.
+
+    Args:
+        name (str): Nombre de la columna.
+        codes (np.ndarray): Código de cada fila (negativo si falta).
+        valid (np.ndarray): Máscara de valores presentes.
+        dictionary (list): Valores distintos de la columna.
+
+    Returns:
+        dict: Descripción de la columna.
+    """
+    column = {"name": name, "kind": "dictionary", "dictionary": dictionary}
+    column.update(_integer_payload(codes, valid))
+    return column
+
+
+def _is_missing(value):
+    """Indica si un valor escalar representa un dato faltante."""
+    import pandas as pd
+
+    try:
+        return bool(pd.isna(value))
+    except (TypeError, ValueError):
+        return False
+
+
+def table_domains(table, names):
+    """Reúne los dominios de las columnas numéricas indicadas.
+
+    Args:
+        table (ColumnTable): Tabla de origen.
+        names (List[str]): Columnas a considerar.
+
+    Returns:
+        dict: Dominio por nombre de columna.
+    """
+    domains = {}
+    for name in names:
+        domain = table.domain(name)
+        if domain is not None:
+            domains[name] = domain
+    return domains
+
+
+def project_names(table, widget):
+    """Calcula las columnas de la tabla que el widget necesita en el frontend.
+
+    Args:
+        table (ColumnTable): Tabla completa.
+        widget: Widget propietario; si define `_required_columns()` y este
+            devuelve un conjunto, solo se conservan esas columnas.
+
+    Returns:
+        List[str]: Nombres de columnas a sincronizar, en el orden de la tabla.
+    """
+    required_columns = getattr(widget, "_required_columns", None)
+    required = required_columns() if required_columns else None
+    if required is None:
+        return table.names
+    return [name for name in table.names if name in required]
+
+
+def _encoded_column(table, name):
+    """Codifica una columna, reutilizando la caché en disco si está activa.
+
+    Args:
+        table (ColumnTable): Tabla de origen.
+        name (str): Columna a codificar.
+
+    Returns:
+        dict: Columna serializada.
+    """
+    if not settings.cache:
+        return _column_to_json(name, table.column(name))
+    from . import cache
+
+    key = cache.entry_key("column", table.fingerprint(name))
+    column = cache.load_column(key)
+    if column is None:
+        column = _column_to_json(name, table.column(name))
+        cache.store_column(key, column)
+    return {"name": name, **column}
+
+
+def encode_columns(table, names, widget, compress=None):
+    """Codifica columnas y, si corresponde, comprime sus buffers.
+
+    La compresión se aplica cuando está habilitada para el widget (trait
+    `compression`) o globalmente (`settings.compression`) y el envío supera
+    `settings.compression_threshold` bytes. Cada buffer comprimido se marca
+    con `"compression": "deflate"`; si comprimirlo no reduce su tamaño se
+    envía sin comprimir. Las estadísticas del envío quedan en
+    `widget.stats`.
+
+    Args:
+        table (ColumnTable): Tabla de origen.
+        names (List[str]): Columnas a codificar.
+        widget: Widget propietario de la tabla (opcional).
+        compress (bool, optional): Fuerza (True) o evita (False) la
+            compresión sin importar el umbral. Por defecto None, que aplica
+            la configuración del widget o global.
+
+    Returns:
+        List[dict]: Columnas serializadas.
+    """
+    columns, stats = _encode_payload(table, names, _compression_enabled(widget), compress)
+    if widget is not None:
+        widget._payload_stats = stats
+    return columns
+
+
+def _compression_enabled(widget):
+    """Indica si la compresión está habilitada para el widget o globalmente."""
+    enabled = getattr(widget, "compression", None)
+    return settings.compression if enabled is None else enabled
+
+
+def _encode_payload(table, names, enabled, compress=None):
+    """Codifica y comprime columnas sin modificar el widget.
+
+    Puede ejecutarse en un hilo del pool: solo escribe en la tabla a través
+    de `ColumnTable._remember`.
+
+    Args:
+        table (ColumnTable): Tabla de origen.
+        names (List[str]): Columnas a codificar.
+        enabled (bool): Si la compresión está habilitada.
+        compress (bool, optional): Fuerza o evita la compresión.
+
+    Returns:
+        tuple[List[dict], dict]: Columnas serializadas y estadísticas del envío.
+    """
+    columns = [_encoded_column(table, name) for name in names]
+    for column in columns:
+        # La codificación enviada permite decidir luego si admite parches.
+        table._remember(("encoding", column["name"]), (column["kind"], column.get("dtype")))
+    raw_bytes = sum(c["data"].nbytes for c in columns if isinstance(c["data"], memoryview))
+    sent_bytes = raw_bytes
+    elapsed = 0.0
+
+    if compress is None:
+        compress = enabled and raw_bytes >= settings.compression_threshold
+    if compress:
+        start = time.perf_counter()
+        sent_bytes = 0
+        for column in columns:
+            data = column["data"]
+            if not isinstance(data, memoryview):
+                continue
+            packed = zlib.compress(data, settings.compression_level)
+            if len(packed) < data.nbytes:
+                column["data"] = packed
+                column["compression"] = "deflate"
+                sent_bytes += len(packed)
+            else:
+                sent_bytes += data.nbytes
+        elapsed = time.perf_counter() - start
+
+    return columns, {
+        "raw_bytes": raw_bytes,
+        "sent_bytes": sent_bytes,
+        "compression_ratio": raw_bytes / sent_bytes if sent_bytes else 1.0,
+        "compression_time": elapsed,
+    }
+
+
+def table_to_json(table, widget):
+    """Serializa una `ColumnTable` bajo demanda al sincronizar el widget.
+
+    Solo se incluyen las columnas que el widget necesita (ver
+    `project_names`); el widget recuerda cuáles tiene el frontend para poder
+    enviar después únicamente las que falten. Con `settings.parallel_encoding`,
+    al enviar el estado por el comm se devuelve la tabla sin columnas y
+    estas se codifican en segundo plano (ver `encode_in_background`); el
+    resto de las lecturas del estado (`get_state`, exportaciones) reciben
+    siempre las columnas codificadas.
+
+    Args:
+        table (ColumnTable): Tabla a serializar.
+        widget: Widget propietario del trait.
+
+    Returns:
+        dict: Estado con la longitud y las columnas de la tabla.
+    """
+    if table is None:
+        table = ColumnTable()
+    names = project_names(table, widget)
+    if getattr(widget, "_live_sync", False):
+        widget._synced_columns = set(names)
+        widget._encoding = None
+        if settings.parallel_encoding and names:
+            encode_in_background(widget, table, names)
+            return {"length": table.length, "columns": []}
+    return {
+        "length": table.length,
+        "columns": encode_columns(table, names, widget),
+    }
+
+
+@contextmanager
+def live_sync(widget):
+    """Marca el widget mientras su estado se envía por el comm.
+
+    Solo dentro de este bloque `table_to_json` puede diferir la codificación
+    a un hilo (ver `settings.parallel_encoding`).
+
+    Args:
+        widget: Widget cuyo estado se envía.
+    """
+    widget._live_sync = True
+    try:
+        yield
+    finally:
+        widget._live_sync = False
+
+
+def _executor():
+    """Devuelve el pool de hilos de codificación, creándolo si no existe."""
+    global _encoding_executor
+    if _encoding_executor is None:
+        _encoding_executor = ThreadPoolExecutor(
+            max_workers=settings.encoding_workers,
+            thread_name_prefix="vizproo-encode",
+        )
+    return _encoding_executor
+
+
+def encode_in_background(widget, table, names):
+    """Codifica columnas en el pool de hilos y las envía al terminar.
+
+    La codificación (conversiones de NumPy y compresión con zlib) libera el
+    GIL, por lo que los widgets creados seguidos codifican sus datos en
+    paralelo sin bloquear el kernel. El envío espera a que el widget tenga
+    su comm abierto (ver `send_background_columns`); si los datos se
+    reemplazan antes de terminar, el resultado se descarta.
+
+    Args:
+        widget: Widget propietario de la tabla.
+        table (ColumnTable): Tabla completa del widget.
+        names (List[str]): Columnas a codificar.
+
+    Returns:
+        concurrent.futures.Future: Columnas codificadas y estadísticas del envío.
+    """
+    # El hilo solo codifica; el widget se actualiza en el hilo del kernel.
+    future = _executor().submit(_encode_payload, table, names, _compression_enabled(widget))
+    # Entradas de la codificación, para rehacerla si falla en el pool
+    future.columns_input = (table, names)
+    widget._encoding = future
+    if getattr(widget, "comm", None) is not None:
+        send_background_columns(widget)
+    return future
+
+
+def send_background_columns(widget):
+    """Programa el envío de la codificación pendiente del widget.
+
+    Se llama al crear la codificación si el comm ya existe, o al abrirlo.
+    El envío se devuelve al bucle de eventos del kernel, que es el único
+    que escribe en el comm; fuera de un bucle (scripts, tests) se envía
+    desde el hilo que terminó la codificación. Si la codificación falla se
+    registra el error y se codifica de nuevo en el hilo del kernel.
+
+    Args:
+        widget: Widget con una codificación en curso.
+    """
+    future = getattr(widget, "_encoding", None)
+    if future is None:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    def deliver(done):
+        if widget._encoding is not done:
+            return
+        try:
+            columns, widget._payload_stats = done.result()
+        except Exception:
+            _log.exception("Background encoding failed; encoding the columns synchronously")
+            table, names = done.columns_input
+            columns = encode_columns(table, names, widget)
+        _send_columns(widget, columns)
+
+    def send(done):
+        if loop is None:
+            deliver(done)
+            return
+        try:
+            loop.call_soon_threadsafe(deliver, done)
+        except RuntimeError:
+            # El bucle del kernel ya se cerró: no queda a quién enviar.
+            pass
+
+    future.add_done_callback(send)
+
+
+def _send_columns(widget, columns, event="add_columns"):
+    """Envía columnas codificadas para que el frontend las agregue a su tabla."""
+    state, buffer_paths, buffers = _remove_buffers({"columns": columns})
+    widget.send({
+        "event": event,
+        "columns": state["columns"],
+        "buffer_paths": buffer_paths,
+    }, buffers)
+
+
+def send_missing_columns(widget, table):
+    """Envía al frontend solo las columnas requeridas que aún no tiene.
+
+    Se usa cuando cambian los traits que nombran columnas (por ejemplo `x`),
+    evitando reenviar la tabla completa.
+
+    Args:
+        widget: Widget propietario de la tabla, ya sincronizado.
+        table (ColumnTable): Tabla completa del widget.
+    """
+    synced = getattr(widget, "_synced_columns", None)
+    if synced is None or getattr(widget, "comm", None) is None:
+        return
+    missing = [name for name in project_names(table, widget) if name not in synced]
+    if not missing:
+        return
+    _send_columns(widget, encode_columns(table, missing, widget))
+    synced.update(missing)
+
+
+def update_table(widget, table):
+    """Reemplaza la tabla de un widget enviando solo lo que cambió.
+
+    Si la tabla nueva tiene el mismo contenido que la actual (según la
+    huella de cada columna) no se hace nada. Si solo cambian algunas
+    columnas, se envían únicamente esas en un mensaje `patch_columns`: las
+    que cambian en pocas filas como un parche con los índices y los valores
+    nuevos, y el resto completas. Cualquier otro cambio (filas o columnas
+    distintas, o un widget aún no sincronizado) reemplaza la tabla entera.
+
+    Args:
+        widget: Widget dueño del trait `dataColumns`.
+        table (ColumnTable): Tabla nueva.
+    """
+    old = widget.dataColumns
+    if old.length != table.length or old.names != table.names:
+        widget.dataColumns = table
+        return
+    changed = [name for name in table.names if old.fingerprint(name) != table.fingerprint(name)]
+    if not changed:
+        return
+    synced = widget._synced_columns
+    encoding = widget._encoding
+    if synced is None or widget.comm is None or (encoding is not None and not encoding.done()):
+        widget.dataColumns = table
+        return
+
+    patches, replaced = [], []
+    for name in synced:
+        sent = old._stats.get(("encoding", name))
+        if name not in changed:
+            if sent is not None:
+                table._stats[("encoding", name)] = sent
+            continue
+        patch = _row_patch(name, old.column(name), table.column(name), sent)
+        if patch is None:
+            replaced.append(name)
+        else:
+            table._stats[("encoding", name)] = sent
+            patches.append(patch)
+    columns = patches + encode_columns(table, replaced, widget)
+    if columns:
+        _send_columns(widget, columns, event="patch_columns")
+    widget._table_patched = True
+    try:
+        widget.dataColumns = table
+    finally:
+        widget._table_patched = False
+
+
+def _changed_rows(old, new):
+    """Índices de las filas distintas entre dos versiones de una columna.
+
+    Args:
+        old (np.ndarray | pd.Categorical): Columna anterior.
+        new (np.ndarray | pd.Categorical): Columna nueva.
+
+    Returns:
+        np.ndarray | None: Índices de las filas cambiadas, o None si las
+            columnas no son arreglos numéricos del mismo dtype.
+    """
+    if not isinstance(old, np.ndarray) or not isinstance(new, np.ndarray):
+        return None
+    if old.dtype != new.dtype or old.dtype.kind not in "biufM":
+        return None
+    changed = old != new
+    if old.dtype.kind == "f":
+        changed &= ~(np.isnan(old) & np.isnan(new))
+    elif old.dtype.kind == "M":
+        changed &= ~(np.isnat(old) & np.isnat(new))
+    return np.flatnonzero(changed)
+
+
+def _row_patch(name, old, new, sent):
+    """Codifica solo las filas cambiadas de una columna, si es posible.
+
+    El parche lleva los índices (`rows`), los valores nuevos de esas filas
+    y el mapa de validez completo de la columna nueva. Solo se arma si la
+    columna nueva se codifica igual que la enviada antes y cambian pocas
+    filas.
+
+    Args:
+        name (str): Nombre de la columna.
+        old (np.ndarray | pd.Categorical): Columna anterior.
+        new (np.ndarray | pd.Categorical): Columna nueva.
+        sent (tuple[str, str] | None): Codificación con la que se envió la
+            columna anterior.
+
+    Returns:
+        dict | None: Columna parcial, o None si hay que enviarla completa.
+    """
+    rows = _changed_rows(old, new)
+    if rows is None or sent is None or sent[0] not in _PATCHABLE_KINDS:
+        return None
+    if len(rows) > len(new) * _PATCH_ROWS_FRACTION:
+        return None
+    column = _column_to_json(name, new)
+    if (column["kind"], column.get("dtype")) != sent:
+        return None
+    values = np.frombuffer(column["data"], dtype=column["dtype"])
+    column["data"] = memoryview(np.ascontiguousarray(values[rows]))
+    column["rows"] = memoryview(rows.astype(np.uint32))
+    return column
+
+
+def sync_required_columns(widget, table):
+    """Actualiza el frontend tras cambiar las columnas que usa el widget.
+
+    Envía las columnas que faltan y actualiza el trait `domains` con los
+    dominios de las columnas sincronizadas.
+
+    Args:
+        widget: Widget propietario de la tabla.
+        table (ColumnTable): Tabla completa del widget.
+    """
+    send_missing_columns(widget, table)
+    widget.domains = table_domains(table, project_names(table, widget))
+
+
+def table_from_json(value, widget):
+    """Deserializa el estado recibido desde el frontend.
+
+    El frontend no modifica los datos, por lo que se conserva la tabla actual.
+
+    Args:
+        value (dict): Estado enviado por el frontend.
+        widget: Widget propietario del trait.
+
+    Returns:
+        ColumnTable: Tabla vigente del widget.
+    """
+    return getattr(widget, "dataColumns", None) or ColumnTable()
+
+
+table_serialization = {
+    "to_json": table_to_json,
+    "from_json": table_from_json,
+}
@@ -1,5 +1,4 @@
 import anywidget
-import urllib3
 from traitlets import Unicode
 
 class CustomWidget(anywidget.AnyWidget):
@@ -28,6 +27,8 @@ class CustomWidget(anywidget.AnyWidget):
         Raises:
             urllib3.exceptions.HTTPError: Si ocurre un error de red al solicitar el recurso.
         """
+        import urllib3
+
         http = urllib3.PoolManager(cert_reqs="CERT_NONE")
         response = http.request("GET", url)
         text = response.data.decode("utf-8")
@@ -0,0 +1,251 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import weakref
+
+import ipywidgets as widgets
+from traitlets import Bool, Dict, Instance, Unicode, observe
+
+from ._frontend import module_name, module_version
+from .columns import (
+    ColumnTable,
+    live_sync,
+    send_background_columns,
+    sync_required_columns,
+    table_serialization,
+    update_table,
+)
+from .settings import settings
+
+
+@widgets.register
+class Dataset(widgets.Widget):
+    """Conjunto de datos compartido entre varios widgets.
+
+    Mantiene una única `ColumnTable` que se envía una sola vez al frontend.
+    Los gráficos y controles que reciben un `Dataset` en lugar de un
+    DataFrame lo referencian mediante un trait de widget, de modo que el
+    tráfico y la memoria del navegador escalan con la cantidad de datasets
+    y no con la cantidad de gráficos. Solo se sincroniza la unión de las
+    columnas que usan los widgets que lo referencian.
+
+    Un dataset también puede publicarse en disco (`publish`) para que otros
+    kernels lo abran mapeado en memoria (`attach`) y compartan una sola
+    copia de los datos.
+
+    Attributes:
+        _model_module (Unicode): Módulo npm donde reside el modelo.
+        _model_module_version (Unicode): Versión semver del módulo del modelo.
+        dataColumns (Instance): Tabla columnar sincronizada con el frontend.
+        domains (Dict): Dominios de las columnas numéricas sincronizadas,
+            compartidos por todos los widgets que usan el dataset.
+        compression (Bool): Comprime los datos enviados; None usa
+            `settings.compression`. No se sincroniza.
+    """
+    _model_name = Unicode("DatasetModel").tag(sync=True)
+    _model_module = Unicode(module_name).tag(sync=True)
+    _model_module_version = Unicode(module_version).tag(sync=True)
+
+    dataColumns = Instance(ColumnTable, args=()).tag(sync=True, **table_serialization)
+    domains = Dict().tag(sync=True)
+    compression = Bool(None, allow_none=True)
+
+    # Registro id(DataFrame) -> (referencia débil al DataFrame, Dataset).
+    _registry = {}
+    # Estadísticas del último envío de datos.
+    _payload_stats = {}
+    # Codificación en segundo plano en curso (ver `settings.parallel_encoding`).
+    _encoding = None
+    # True mientras el estado se serializa para enviarlo por el comm.
+    _live_sync = False
+    # True mientras se asigna una tabla cuyo cambio ya se envió como parche.
+    _table_patched = False
+
+    def __init__(self, data=None, **kwargs):
+        """Inicializa el dataset con un DataFrame opcional.
+
+        Args:
+            data (pd.DataFrame, optional): Datos a compartir.
+            **kwargs: Argumentos adicionales propagados a `ipywidgets.Widget`.
+        """
+        self._consumers = weakref.WeakSet()
+        super().__init__(**kwargs)
+        if data is not None:
+            self.data = data
+
+    @classmethod
+    def for_frame(cls, frame):
+        """Devuelve el dataset asociado a un DataFrame, creándolo si no existe.
+
+        Llamadas sucesivas con el mismo objeto DataFrame devuelven el mismo
+        dataset, por lo que los datos se codifican y envían una sola vez. El
+        dataset es una instantánea: si el DataFrame se modifica en sitio, se
+        debe reasignar `dataset.data`.
+
+        Args:
+            frame (pd.DataFrame): Datos fuente.
+
+        Returns:
+            Dataset: Dataset compartido para `frame`.
+        """
+        key = id(frame)
+        entry = cls._registry.get(key)
+        if entry is not None and entry[0]() is frame:
+            return entry[1]
+
+        dataset = cls(frame)
+        ref = weakref.ref(frame, lambda _: cls._registry.pop(key, None))
+        cls._registry[key] = (ref, dataset)
+        return dataset
+
+    @classmethod
+    def publish(cls, frame, name, directory=None):
+        """Publica un DataFrame para que otros kernels lo abran sin copiarlo.
+
+        Las columnas se escriben una sola vez en `directory` (por defecto
+        `settings.shared_dir`); cada kernel que luego llama a `attach` mapea
+        los mismos archivos en memoria, de modo que N sesiones comparten una
+        sola copia de los datos en la caché de páginas del sistema. Publicar
+        de nuevo con el mismo nombre reemplaza el dataset de forma atómica;
+        los kernels ya conectados conservan la versión anterior.
+
+        Args:
+            frame (pd.DataFrame): Datos a publicar.
+            name (str): Nombre con que otros kernels lo abren.
+            directory (str | os.PathLike, optional): Directorio compartido.
+
+        Returns:
+            str: Directorio con las columnas publicadas.
+
+        Raises:
+            TypeError: Si alguna columna no es numérica, de fechas o de
+                categorías (ver `ColumnTable.save`).
+        """
+        root = _shared_root(directory)
+        table = ColumnTable.from_frame(frame)
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(repr([(column, table.fingerprint(column)) for column in table.names]).encode())
+        target = os.path.join(root, f"{name}-{digest.hexdigest()}")
+        if not os.path.exists(os.path.join(target, "manifest.json")):
+            staging = tempfile.mkdtemp(dir=root, prefix=f".{name}-")
+            try:
+                table.save(staging)
+            except Exception:
+                shutil.rmtree(staging, ignore_errors=True)
+                raise
+            try:
+                os.rename(staging, target)
+            except OSError:
+                # Otro proceso publicó el mismo contenido a la vez.
+                shutil.rmtree(staging, ignore_errors=True)
+        descriptor, pointer = tempfile.mkstemp(dir=root, suffix=".tmp")
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            json.dump({"path": os.path.basename(target)}, file)
+        os.replace(pointer, os.path.join(root, f"{name}.json"))
+        return target
+
+    @classmethod
+    def attach(cls, name, directory=None):
+        """Abre un dataset publicado con `publish` sin copiar sus datos.
+
+        Args:
+            name (str): Nombre del dataset publicado.
+            directory (str | os.PathLike, optional): Directorio compartido;
+                por defecto `settings.shared_dir`.
+
+        Returns:
+            Dataset: Dataset respaldado por archivos mapeados en memoria.
+
+        Raises:
+            FileNotFoundError: Si no hay un dataset publicado con ese nombre.
+        """
+        root = _shared_root(directory)
+        with open(os.path.join(root, f"{name}.json"), encoding="utf-8") as file:
+            target = json.load(file)["path"]
+        dataset = cls()
+        dataset.dataColumns = ColumnTable.load(os.path.join(root, target))
+        return dataset
+
+    def open(self):
+        """Abre el comm y envía las columnas codificadas en segundo plano."""
+        opening = self.comm is None
+        with live_sync(self):
+            super().open()
+        if opening:
+            send_background_columns(self)
+
+    def send_state(self, key=None):
+        """Envía el estado por el comm, codificando la tabla en segundo plano.
+
+        Args:
+            key (str | List[str], optional): Traits a enviar; None envía todos.
+        """
+        with live_sync(self):
+            super().send_state(key)
+
+    def _should_send_property(self, key, value):
+        """Evita reenviar la tabla cuando su cambio ya viajó como parche."""
+        if key == "dataColumns" and self._table_patched:
+            return False
+        return super()._should_send_property(key, value)
+
+    def _required_columns(self):
+        """Calcula la unión de columnas requeridas por los widgets que lo usan.
+
+        Returns:
+            set[str] | None: Nombres de columnas requeridas, o None si algún
+                widget usa todas las columnas.
+        """
+        required = set()
+        for consumer in list(self._consumers):
+            names = consumer._required_columns()
+            if names is None:
+                return None
+            required.update(names)
+        return required
+
+    @observe("dataColumns")
+    def _on_data_columns_change(self, change):
+        """Recalcula los dominios y las estadísticas de los widgets al reemplazar los datos."""
+        sync_required_columns(self, change["new"])
+        for consumer in list(self._consumers):
+            consumer._update_stats(change["new"])
+
+    @property
+    def stats(self):
+        """Estadísticas del último envío de datos al frontend.
+
+        Returns:
+            dict: `raw_bytes`, `sent_bytes`, `compression_ratio` y
+                `compression_time` (segundos).
+        """
+        return dict(self._payload_stats)
+
+    @property
+    def data(self):
+        """Retorna los datos como DataFrame.
+
+        Returns:
+            pd.DataFrame: DataFrame construido desde `dataColumns`.
+        """
+        return self.dataColumns.to_frame()
+
+    @data.setter
+    def data(self, val):
+        """Establece los datos compartidos desde un DataFrame.
+
+        Args:
+            val (pd.DataFrame): DataFrame a convertir en columnas compactas.
+                Si el contenido no cambió no se envía nada; si cambian pocas
+                filas o columnas se envía solo un parche.
+        """
+        update_table(self, ColumnTable.from_frame(val))
+
+
+def _shared_root(directory):
+    """Directorio de datasets compartidos, creado si no existe."""
+    root = os.path.expanduser(os.fspath(directory if directory is not None else settings.shared_dir))
+    os.makedirs(root, exist_ok=True)
+    return root
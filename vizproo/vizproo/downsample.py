@@ -0,0 +1,144 @@
+"""Reducción de series largas para gráficos de líneas.
+
+Los algoritmos trabajan sobre una serie ordenada por X y sin valores
+faltantes, y devuelven índices de puntos en lugar de valores: quien los
+usa toma esas filas de las columnas originales, por lo que el resultado
+conserva su tipo (fechas, enteros, etc.).
+"""
+
+import numpy as np
+
+# Puntos por columna de píxeles que conservan las reducciones.
+POINTS_PER_PIXEL = 4
+
+
+def window_bounds(x, start, stop):
+    """Busca las posiciones de la serie dentro de una ventana de X.
+
+    Args:
+        x (np.ndarray): Valores X ordenados de menor a mayor.
+        start (float): Inicio de la ventana.
+        stop (float): Fin de la ventana.
+
+    Returns:
+        tuple[int, int]: Primera posición dentro de la ventana y la
+            siguiente a la última.
+    """
+    return int(np.searchsorted(x, start, side="left")), int(np.searchsorted(x, stop, side="right"))
+
+
+def _with_neighbors(inside, first, last, length):
+    """Agrega a los índices de la ventana el punto anterior y el siguiente.
+
+    Así la línea llega hasta los bordes del gráfico en lugar de cortarse en
+    el primer y último punto visibles.
+    """
+    before = np.arange(max(first - 1, 0), first)
+    after = np.arange(last, min(last + 1, length))
+    return np.concatenate([before, inside, after])
+
+
+def _first_match(values, targets, starts, counts):
+    """Posición del primer valor de cada tramo igual a su objetivo.
+
+    Args:
+        values (np.ndarray): Valores de todos los tramos, consecutivos.
+        targets (np.ndarray): Valor buscado en cada tramo.
+        starts (np.ndarray): Inicio de cada tramo.
+        counts (np.ndarray): Largo de cada tramo.
+
+    Returns:
+        np.ndarray: Posición encontrada en cada tramo.
+    """
+    hits = np.flatnonzero(values == np.repeat(targets, counts))
+    return hits[np.searchsorted(hits, starts)]
+
+
+def m4(x, y, start, stop, pixels):
+    """Reduce una ventana de la serie con M4.
+
+    Divide la ventana en `pixels` columnas y conserva de cada una el primer
+    y el último punto y los de menor y mayor Y. Con esos cuatro puntos por
+    píxel la línea dibujada es la misma que con la serie completa. Todo el
+    cálculo es vectorizado: como X está ordenado, cada columna de píxeles
+    es un tramo contiguo de la serie.
+
+    Args:
+        x (np.ndarray): Valores X (float64) ordenados de menor a mayor.
+        y (np.ndarray): Valores Y (float64).
+        start (float): Inicio de la ventana.
+        stop (float): Fin de la ventana.
+        pixels (int): Ancho del gráfico en píxeles.
+
+    Returns:
+        np.ndarray: Índices de los puntos conservados, en orden, incluidos
+            los vecinos inmediatos fuera de la ventana.
+    """
+    first, last = window_bounds(x, start, stop)
+    pixels = max(int(pixels), 1)
+    if last - first <= POINTS_PER_PIXEL * pixels:
+        return _with_neighbors(np.arange(first, last), first, last, len(x))
+
+    xs, ys = x[first:last], y[first:last]
+    span = stop - start
+    column = ((xs - start) * (pixels / span)).astype(np.int64) if span > 0 else np.zeros(len(xs), np.int64)
+    np.minimum(column, pixels - 1, out=column)
+    starts = np.flatnonzero(np.diff(column, prepend=-1))
+    counts = np.diff(np.append(starts, len(xs)))
+    ends = starts + counts - 1
+    lowest = _first_match(ys, np.minimum.reduceat(ys, starts), starts, counts)
+    highest = _first_match(ys, np.maximum.reduceat(ys, starts), starts, counts)
+    inside = first + np.unique(np.concatenate([starts, ends, lowest, highest]))
+    return _with_neighbors(inside, first, last, len(x))
+
+
+def lttb(x, y, start, stop, pixels):
+    """Reduce una ventana de la serie con Largest-Triangle-Three-Buckets.
+
+    Conserva `POINTS_PER_PIXEL` puntos por píxel: el primero, el último y,
+    de cada grupo intermedio de igual cantidad de puntos, el que forma el
+    triángulo de mayor área con el punto elegido en el grupo anterior y el
+    promedio del grupo siguiente. La elección depende del grupo anterior,
+    así que se recorre grupo por grupo; el cálculo dentro de cada grupo y
+    los promedios son vectorizados.
+
+    Args:
+        x (np.ndarray): Valores X (float64) ordenados de menor a mayor.
+        y (np.ndarray): Valores Y (float64).
+        start (float): Inicio de la ventana.
+        stop (float): Fin de la ventana.
+        pixels (int): Ancho del gráfico en píxeles.
+
+    Returns:
+        np.ndarray: Índices de los puntos conservados, en orden, incluidos
+            los vecinos inmediatos fuera de la ventana.
+    """
+    first, last = window_bounds(x, start, stop)
+    threshold = max(POINTS_PER_PIXEL * int(pixels), 3)
+    if last - first <= threshold:
+        return _with_neighbors(np.arange(first, last), first, last, len(x))
+
+    xs, ys = x[first:last], y[first:last]
+    buckets = threshold - 2
+    edges = 1 + (np.arange(buckets + 1) * (len(xs) - 2)) // buckets
+    counts = np.diff(edges)
+    mean_x = np.add.reduceat(xs[:-1], edges[:-1]) / counts
+    mean_y = np.add.reduceat(ys[:-1], edges[:-1]) / counts
+    # Promedio del grupo siguiente a cada uno; el último mira al punto final.
+    next_x = np.append(mean_x[1:], xs[-1])
+    next_y = np.append(mean_y[1:], ys[-1])
+
+    selected = np.empty(threshold, np.int64)
+    selected[0], selected[-1] = 0, len(xs) - 1
+    anchor = 0
+    for bucket in range(buckets):
+        low, high = edges[bucket], edges[bucket + 1]
+        ax, ay = xs[anchor], ys[anchor]
+        area = np.abs((ax - next_x[bucket]) * (ys[low:high] - ay) - (ax - xs[low:high]) * (next_y[bucket] - ay))
+        anchor = low + int(area.argmax())
+        selected[bucket + 1] = anchor
+    return _with_neighbors(first + selected, first, last, len(x))
+
+
+# Reducciones disponibles por nombre.
+METHODS = {"m4": m4, "lttb": lttb}
@@ -0,0 +1,220 @@
+"""Exportación de dashboards a un único archivo HTML autónomo.
+
+Cada conjunto de datos distinto se incrusta una sola vez como un modelo
+`Dataset` con sus columnas comprimidas (deflate) en base64; los widgets
+que usan esos datos solo lo referencian. El bundle de JavaScript se carga
+una vez y cada gráfico se hidrata cuando su área entra en pantalla.
+"""
+
+import base64
+import json
+import uuid
+from html import escape
+
+from ipywidgets.embed import DEFAULT_EMBED_REQUIREJS_URL, escape_script
+from ipywidgets.widgets.widget import _remove_buffers
+
+from ._frontend import module_name, module_version
+from .columns import encode_columns, project_names, table_domains
+from .dataset import Dataset
+
+_REQUIREJS_URL = "https://cdnjs.cloudflare.com/ajax/libs/require.js/2.3.6/require.min.js"
+
+_HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<title>{title}</title>
+<script src="{requirejs_url}" crossorigin="anonymous"></script>
+<script src="{embed_url}" crossorigin="anonymous"></script>
+<style>#vizproo-views {{ display: none; }}</style>
+</head>
+<body>
+<div id="vizproo-root"></div>
+<div id="vizproo-views"></div>
+<script type="application/json" id="vizproo-state">
+{state}
+</script>
+<script>
+{bundle_config}
+require(["@jupyter-widgets/html-manager/dist/libembed-amd", "@jupyter-widgets/html-manager"], function (embed, htmlmanager) {{
+  var manager = new htmlmanager.HTMLManager({{ loader: embed.requireLoader }});
+  var page = JSON.parse(document.getElementById("vizproo-state").textContent);
+  manager.set_state(page.state).then(function (models) {{
+    var byId = {{}};
+    models.forEach(function (model) {{ byId[model.model_id] = model; }});
+    var views = document.getElementById("vizproo-views");
+    function show(modelId, element) {{
+      manager.create_view(byId[modelId]).then(function (view) {{
+        return manager.display_view(view, element);
+      }});
+    }}
+    // Cada gráfico se crea solo cuando su área del layout es visible.
+    var observer = new IntersectionObserver(function (entries) {{
+      entries.forEach(function (entry) {{
+        if (!entry.isIntersecting) return;
+        observer.unobserve(entry.target);
+        show(page.areas[entry.target.id], views);
+      }});
+    }}, {{ rootMargin: "200px" }});
+    function observeAreas() {{
+      var pending = Object.keys(page.areas).filter(function (id) {{
+        var area = document.getElementById(id);
+        if (area) observer.observe(area);
+        return !area;
+      }});
+      if (pending.length) requestAnimationFrame(observeAreas);
+    }}
+    show(page.root, document.getElementById("vizproo-root"));
+    observeAreas();
+  }});
+}});
+</script>
+</body>
+</html>
+"""
+
+
+def _model_entry(model_name, model_module, model_version, state):
+    """Arma la entrada de un modelo en el formato de estado de ipywidgets.
+
+    Args:
+        model_name (str): Nombre del modelo del frontend.
+        model_module (str): Módulo npm del modelo.
+        model_version (str): Versión semver del módulo.
+        state (dict): Estado del modelo, con buffers binarios.
+
+    Returns:
+        dict: Entrada con el estado JSON y los buffers en base64.
+    """
+    state, buffer_paths, buffers = _remove_buffers(state)
+    return {
+        "model_name": model_name,
+        "model_module": model_module,
+        "model_module_version": model_version,
+        "state": state,
+        "buffers": [
+            {"path": path, "data": base64.b64encode(bytes(buffer)).decode("ascii"), "encoding": "base64"}
+            for path, buffer in zip(buffer_paths, buffers)
+        ],
+    }
+
+
+def _table_state(table, names):
+    """Serializa las columnas indicadas, siempre comprimidas."""
+    return {
+        "length": table.length,
+        "columns": encode_columns(table, names, None, compress=True),
+    }
+
+
+def _table_key(table):
+    """Identifica el contenido de una tabla para deduplicarla."""
+    return table.length, tuple((name, table.fingerprint(name)) for name in table.names)
+
+
+def _widget_entry(widget, dataset_id=None):
+    """Serializa un widget sin sus datos, que viajan en su dataset.
+
+    Args:
+        widget (ipywidgets.Widget): Widget a serializar.
+        dataset_id (str, optional): Modelo del dataset que reemplaza a los
+            datos propios del widget.
+
+    Returns:
+        dict: Entrada del modelo.
+    """
+    keys = [key for key in widget.keys if key != "dataColumns"]
+    state = widget.get_state(keys)
+    if "dataColumns" in widget.keys:
+        state["dataColumns"] = {"length": 0, "columns": []}
+    if dataset_id is not None:
+        state["dataset"] = "IPY_MODEL_" + dataset_id
+        state["domains"] = {}
+    return _model_entry(state["_model_name"], state["_model_module"], state["_model_module_version"], state)
+
+
+def _dataset_entry(table, names):
+    """Serializa un dataset con las columnas indicadas."""
+    state = {
+        "_model_name": "DatasetModel",
+        "_model_module": module_name,
+        "_model_module_version": module_version,
+        "dataColumns": _table_state(table, names),
+        "domains": table_domains(table, names),
+    }
+    return _model_entry("DatasetModel", module_name, module_version, state)
+
+
+def widget_state(root, children):
+    """Construye el estado de un dashboard con los datos deduplicados.
+
+    Los widgets con datos propios se agrupan por el contenido de su tabla;
+    cada grupo se incrusta como un único dataset con la unión de las
+    columnas que usan sus widgets. Los `Dataset` ya compartidos se
+    incrustan tal cual, una vez.
+
+    Args:
+        root (ipywidgets.Widget): Widget raíz (por ejemplo el layout).
+        children (List[ipywidgets.Widget]): Widgets mostrados en el layout.
+
+    Returns:
+        dict: Estado en el formato `application/vnd.jupyter.widget-state+json`.
+    """
+    state = {root.model_id: _widget_entry(root)}
+    groups = {}
+    datasets = {}
+    for child in children:
+        dataset = getattr(child, "dataset", None)
+        if isinstance(dataset, Dataset):
+            datasets[dataset.model_id] = dataset
+            state[child.model_id] = _widget_entry(child)
+        elif getattr(child, "dataColumns", None) is not None and len(child.dataColumns):
+            table = child.dataColumns
+            group = groups.setdefault(_table_key(table), {"id": uuid.uuid4().hex, "table": table, "names": set()})
+            group["names"].update(project_names(table, child))
+            state[child.model_id] = _widget_entry(child, group["id"])
+        else:
+            state[child.model_id] = _widget_entry(child)
+
+    for model_id, dataset in datasets.items():
+        names = project_names(dataset.dataColumns, dataset)
+        state[model_id] = _dataset_entry(dataset.dataColumns, names)
+    for group in groups.values():
+        table = group["table"]
+        names = [name for name in table.names if name in group["names"]]
+        state[group["id"]] = _dataset_entry(table, names)
+    return {"version_major": 2, "version_minor": 0, "state": state}
+
+
+def write_html(root, children, areas, path, title="vizproo", bundle_url=None):
+    """Escribe un dashboard como archivo HTML autónomo.
+
+    Args:
+        root (ipywidgets.Widget): Widget raíz que se muestra al cargar.
+        children (List[ipywidgets.Widget]): Widgets que se hidratan al
+            hacerse visibles.
+        areas (dict[str, str]): Id del elemento DOM de cada hijo -> model_id.
+        path (str | os.PathLike): Archivo de salida.
+        title (str, optional): Título de la página. Por defecto "vizproo".
+        bundle_url (str, optional): URL del bundle de vizproo (sin `.js`);
+            por defecto se carga desde el CDN de npm.
+
+    Returns:
+        str | os.PathLike: Ruta escrita.
+    """
+    page = {"root": root.model_id, "areas": areas, "state": widget_state(root, children)}
+    bundle_config = ""
+    if bundle_url is not None:
+        paths = json.dumps({module_name: bundle_url})
+        bundle_config = f"require.config({{ paths: {paths} }});"
+    html = _HTML_TEMPLATE.format(
+        title=escape(title),
+        requirejs_url=_REQUIREJS_URL,
+        embed_url=DEFAULT_EMBED_REQUIREJS_URL,
+        state=escape_script(json.dumps(page, separators=(",", ":"))),
+        bundle_config=bundle_config,
+    )
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(html)
+    return path
@@ -1,3 +1,3 @@
-from .graphs_ import BarPlot, ScatterPlot, RadViz, StarCoordinates
+from .graphs_ import BarPlot, ScatterPlot, RadViz, StarCoordinates, FacetGrid, facet, LineChart, HexbinPlot, ScatterMatrix
 
-__all__ = ["BarPlot", "ScatterPlot", "RadViz", "StarCoordinates"]
\ No newline at end of file
+__all__ = ["BarPlot", "ScatterPlot", "RadViz", "StarCoordinates", "FacetGrid", "facet", "LineChart", "HexbinPlot", "ScatterMatrix"]
\ No newline at end of file
@@ -2,5 +2,9 @@ from .barplot import BarPlot
 from .scatterplot import ScatterPlot
 from .radviz import RadViz
 from .starcoordinates import StarCoordinates
+from .facetgrid import FacetGrid, facet
+from .linechart import LineChart
+from .hexbinplot import HexbinPlot
+from .scattermatrix import ScatterMatrix
 
-__all__ = ["BarPlot", "ScatterPlot", "RadViz", "StarCoordinates"]
\ No newline at end of file
+__all__ = ["BarPlot", "ScatterPlot", "RadViz", "StarCoordinates", "FacetGrid", "facet", "LineChart", "HexbinPlot", "ScatterMatrix"]
\ No newline at end of file
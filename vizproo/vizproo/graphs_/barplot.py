@@ -1,63 +1,97 @@
-from traitlets import  List, Unicode
+import math
 
-from vizproo.base_widget import BaseWidget, widgets, pd
+from traitlets import  List, Unicode, observe
+
+from vizproo.base_widget import DataWidget, StaticExportMixin, widgets
 
 @widgets.register
-class BarPlot(BaseWidget):
+class BarPlot(StaticExportMixin, DataWidget):
     """Gráfico de barras interactivo con selección de valores.
 
     Permite renderizar barras en orientación vertical u horizontal. Sincroniza
     datos y selección con el frontend mediante traits.
 
     Attributes:
-        dataRecords (List): Registros de datos (lista de dicts), sincronizados con el frontend.
+        dataColumns (Instance): Tabla columnar compacta sincronizada con el frontend.
         direction (Unicode): Orientación del gráfico ("vertical" o "horizontal").
         x (Unicode): Variable para el eje X.
         y (Unicode): Variable para el eje Y.
         hue (Unicode): Variable para color/categoría.
+        groupDomain (List): Grupos de las barras, ordenados (sin `hue`).
+        valueDomain (List): Mínimo y máximo de los promedios por grupo (sin `hue`).
         selectedValuesRecords (List): Registros seleccionados por el usuario.
     """
     _view_name = Unicode("BarPlotView").tag(sync=True)
     _model_name = Unicode("BarPlotModel").tag(sync=True)
 
-    dataRecords = List([]).tag(sync=True)
     direction = Unicode().tag(sync=True)
     x = Unicode().tag(sync=True)
     y = Unicode().tag(sync=True)
     hue = Unicode().tag(sync=True)
+    groupDomain = List(Unicode()).tag(sync=True)
+    valueDomain = List().tag(sync=True)
     selectedValuesRecords = List([]).tag(sync=True)
 
+    _column_traits = ("x", "y", "hue")
+
     def __init__(self, data, direction="vertical", **kwargs):
         """Inicializa el gráfico con datos y orientación.
 
         Args:
-            data (pd.DataFrame): Datos fuente para el gráfico.
+            data (pd.DataFrame | Dataset | DataSource | str): Datos fuente
+                para el gráfico. Una fuente de datos o ruta a un archivo
+                Parquet/Arrow se agrega por grupo sin cargarla en memoria.
             direction (str, optional): Orientación del gráfico ("vertical" o "horizontal").
                 Por defecto "vertical".
             **kwargs: Argumentos adicionales propagados a BaseWidget.
         """
         self.data = data
         self.direction = direction
-        self.selectedValues = pd.DataFrame()
         super().__init__(**kwargs)
 
-    @property
-    def data(self):
-        """Retorna los datos como DataFrame.
+    def _group_columns(self):
+        """Columna de los grupos y columna promediada según la orientación."""
+        return (self.x, self.y) if self.direction == "vertical" else (self.y, self.x)
+
+    def _reduce_source(self, source):
+        """Promedia la fuente por grupo (y por `hue`) en lugar de muestrearla.
+
+        Args:
+            source (DataSource): Fuente de datos del widget.
 
         Returns:
-            pd.DataFrame: DataFrame construido desde `dataRecords`.
+            ColumnTable: Una fila por barra.
         """
-        return pd.DataFrame.from_records(self.dataRecords)
+        by, value = self._group_columns()
+        if not by or not value:
+            return super()._reduce_source(source)
+        keys = [by, self.hue] if self.hue else [by]
+        return source.group_means(keys, value)
 
-    @data.setter
-    def data(self, val):
-        """Establece los datos del gráfico desde un DataFrame.
+    def _update_stats(self, table):
+        """Toma los promedios por grupo de las estadísticas de la tabla.
 
         Args:
-            val (pd.DataFrame): DataFrame a convertir a lista de registros dict.
+            table (ColumnTable): Tabla completa del widget.
         """
-        self.dataRecords = val.to_dict(orient="records")
+        by, value = self._group_columns()
+        means = None
+        if not self.hue and by in table and value in table:
+            means = table.group_means(by, value)
+        finite = [mean for mean in means[1] if math.isfinite(mean)] if means else []
+        if not finite:
+            self.groupDomain, self.valueDomain = [], []
+        else:
+            self.groupDomain = means[0]
+            self.valueDomain = [min(finite), max(finite)]
+
+    @observe("direction")
+    def _on_direction_change(self, change):
+        """Recalcula los grupos al cambiar la orientación."""
+        if self._source is not None and self.comm is not None:
+            self._load_source()
+        else:
+            self._update_stats(self._table)
 
     @property
     def selectedValues(self):
@@ -66,6 +100,8 @@ class BarPlot(BaseWidget):
         Returns:
             pd.DataFrame: Selección del usuario como DataFrame.
         """
+        import pandas as pd
+
         return pd.DataFrame.from_records(self.selectedValuesRecords)
 
     @selectedValues.setter
@@ -81,6 +117,6 @@ class BarPlot(BaseWidget):
         """Registra un callback para cambios en la selección de valores.
 
         Args:
-            callback (Callable): Función que recibe el cambio del trait `selectedValuesRecords`.
+            callback (Callable): Función o corrutina que recibe el cambio del trait `selectedValuesRecords`.
         """
-        self.observe(callback, names=["selectedValuesRecords"])
+        self._observe_callback(callback, names=["selectedValuesRecords"])
@@ -0,0 +1,195 @@
+from traitlets import Float, Int, List, Unicode, observe
+
+from vizproo.base_widget import DataWidget, widgets
+from vizproo.columns import _category_label
+from vizproo.dataset import Dataset
+from .barplot import BarPlot
+from .scatterplot import ScatterPlot
+
+# Tipo de panel del frontend según la clase de gráfico.
+_CHART_KINDS = {ScatterPlot: "scatter", BarPlot: "bar"}
+
+
+@widgets.register
+class FacetGrid(DataWidget):
+    """Rejilla de gráficos pequeños, un panel por valor de una columna.
+
+    Los datos se agrupan una sola vez y se sincronizan ordenados por faceta
+    en una única tabla; cada panel es un rango contiguo de filas indicado
+    por `facetOffsets`. El frontend dibuja todos los paneles en una sola
+    vista con escalas y barra de herramientas compartidas.
+
+    Attributes:
+        dataColumns (Instance): Tabla columnar compacta sincronizada con el frontend.
+        chart (Unicode): Tipo de panel ("scatter" o "bar").
+        facet (Unicode): Columna usada para separar los paneles.
+        facetLabels (List): Etiqueta de cada panel.
+        facetOffsets (List): Fila inicial de cada panel más el total de filas.
+        columns (Int): Cantidad de paneles por fila.
+        panelHeight (Int): Alto de cada panel en píxeles.
+        x (Unicode): Variable para el eje X.
+        y (Unicode): Variable para el eje Y.
+        hue (Unicode): Variable para color/categoría.
+        size (Unicode): Variable para tamaño por punto (solo scatter).
+        pointSize (Float): Tamaño base de los puntos (solo scatter).
+        opacity (Float): Opacidad de los puntos (solo scatter).
+        direction (Unicode): Orientación de las barras (solo bar).
+        selectedValuesRecords (List): Registros seleccionados en todos los paneles.
+    """
+    _view_name = Unicode("FacetGridView").tag(sync=True)
+    _model_name = Unicode("FacetGridModel").tag(sync=True)
+
+    chart = Unicode("scatter").tag(sync=True)
+    facet = Unicode().tag(sync=True)
+    facetLabels = List(Unicode()).tag(sync=True)
+    facetOffsets = List(Int(), [0]).tag(sync=True)
+    columns = Int(4).tag(sync=True)
+    panelHeight = Int(200).tag(sync=True)
+    x = Unicode().tag(sync=True)
+    y = Unicode().tag(sync=True)
+    hue = Unicode().tag(sync=True)
+    size = Unicode().tag(sync=True)
+    pointSize = Float(5.0).tag(sync=True)
+    opacity = Float(0.7).tag(sync=True)
+    direction = Unicode("vertical").tag(sync=True)
+    selectedValuesRecords = List([]).tag(sync=True)
+
+    _column_traits = ("facet", "x", "y", "hue", "size")
+
+    # Posición en los datos recibidos de cada fila sincronizada.
+    _order = None
+
+    def __init__(self, data, by, chart=ScatterPlot, columns=4, panel_height=200,
+                 point_size=5.0, opacity=0.7, direction="vertical", **kwargs):
+        """Inicializa la rejilla agrupando los datos por `by`.
+
+        Args:
+            data (pd.DataFrame): Datos fuente.
+            by (str): Columna cuyos valores definen los paneles.
+            chart (type, optional): Clase de gráfico de cada panel
+                (`ScatterPlot` o `BarPlot`). Por defecto `ScatterPlot`.
+            columns (int, optional): Paneles por fila. Por defecto 4.
+            panel_height (int, optional): Alto de cada panel. Por defecto 200.
+            point_size (float, optional): Tamaño base de los puntos. Por defecto 5.0.
+            opacity (float, optional): Opacidad de los puntos. Por defecto 0.7.
+            direction (str, optional): Orientación de las barras. Por defecto "vertical".
+            **kwargs: Argumentos adicionales propagados a BaseWidget
+                (por ejemplo `x`, `y`, `hue`, `size`).
+
+        Raises:
+            ValueError: Si `chart` no es un tipo de gráfico soportado.
+            TypeError: Si `data` no es un DataFrame de pandas.
+        """
+        if chart not in _CHART_KINDS:
+            supported = ", ".join(cls.__name__ for cls in _CHART_KINDS)
+            raise ValueError(f"Unsupported chart {chart!r}. Supported charts: {supported}")
+        self.chart = _CHART_KINDS[chart]
+        self.facet = by
+        self.data = data
+        self.columns = columns
+        self.panelHeight = panel_height
+        self.pointSize = point_size
+        self.opacity = opacity
+        self.direction = direction
+        super().__init__(**kwargs)
+
+    @property
+    def data(self):
+        """Retorna los datos ordenados por faceta.
+
+        Returns:
+            pd.DataFrame: DataFrame construido desde `dataColumns`.
+        """
+        return DataWidget.data.fget(self)
+
+    @data.setter
+    def data(self, val):
+        """Agrupa los datos por `facet` y los establece ordenados por panel.
+
+        Las filas sin valor de faceta van en un último panel, "null". Como
+        las filas se reordenan, la rejilla guarda su propia copia: no acepta
+        un `Dataset` compartido ni fuentes de datos.
+
+        Args:
+            val (pd.DataFrame): Datos fuente.
+
+        Raises:
+            TypeError: Si `val` es un `Dataset` o una fuente de datos.
+        """
+        import numpy as np
+        import pandas as pd
+
+        if isinstance(val, Dataset):
+            raise TypeError("FacetGrid reorders rows and cannot share a Dataset; pass dataset.data instead")
+        if not isinstance(val, pd.DataFrame):
+            raise TypeError(
+                f"FacetGrid needs a pandas DataFrame, got {type(val).__name__}; "
+                "files and data sources are not supported"
+            )
+        frame = val
+        codes, keys = pd.factorize(frame[self.facet], sort=True, use_na_sentinel=False)
+        sizes = np.bincount(codes, minlength=len(keys))
+        order = np.argsort(codes, kind="stable")
+
+        self.facetLabels = [_category_label(key) for key in np.asarray(keys, dtype=object).tolist()]
+        self.facetOffsets = np.concatenate([[0], np.cumsum(sizes)]).astype(int).tolist()
+        self._order = order
+        DataWidget.data.fset(self, frame.take(order))
+
+    @observe("facet")
+    def _on_facet_change(self, change):
+        """Reagrupa los datos actuales, en su orden original, al cambiar la faceta."""
+        import numpy as np
+
+        if self._order is None:
+            return
+        frame = self.data
+        if self._index is not None:
+            frame.index = self._index
+        self.data = frame.take(np.argsort(self._order))
+
+    @property
+    def selectedValues(self):
+        """Retorna los valores actualmente seleccionados.
+
+        Returns:
+            pd.DataFrame: Selección del usuario como DataFrame.
+        """
+        import pandas as pd
+
+        return pd.DataFrame.from_records(self.selectedValuesRecords)
+
+    @selectedValues.setter
+    def selectedValues(self, val):
+        """Actualiza la selección de valores.
+
+        Args:
+            val (pd.DataFrame): Selección a convertir y sincronizar con el frontend.
+        """
+        self.selectedValuesRecords = val.to_dict(orient="records")
+
+    def on_select_values(self, callback):
+        """Registra un callback para cambios en la selección de valores.
+
+        Args:
+            callback (Callable): Función o corrutina que recibe el cambio del trait `selectedValuesRecords`.
+        """
+        self._observe_callback(callback, names=["selectedValuesRecords"])
+
+
+def facet(data, by, chart=ScatterPlot, **kwargs):
+    """Crea gráficos pequeños (small multiples), uno por valor de `by`.
+
+    Equivale a crear un gráfico por grupo en un bucle, pero agrupa una sola
+    vez, comparte una única tabla de datos y abre un solo widget.
+
+    Args:
+        data (pd.DataFrame): Datos fuente.
+        by (str): Columna cuyos valores definen los paneles.
+        chart (type, optional): `ScatterPlot` o `BarPlot`. Por defecto `ScatterPlot`.
+        **kwargs: Parámetros de `FacetGrid` y del gráfico (`x`, `y`, `hue`, ...).
+
+    Returns:
+        FacetGrid: Widget con todos los paneles.
+    """
+    return FacetGrid(data, by, chart=chart, **kwargs)
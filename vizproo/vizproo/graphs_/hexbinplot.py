@@ -0,0 +1,143 @@
+import numpy as np
+from traitlets import Float, Int, List, Unicode, observe
+
+from vizproo.base_widget import ReducedDataWidget, widgets
+from vizproo.binning import bin_members, hexbin
+from vizproo.columns import ColumnTable
+
+
+@widgets.register
+class HexbinPlot(ReducedDataWidget):
+    """Gráfico de densidad que agrupa los puntos en hexágonos.
+
+    Los puntos se agrupan en Python y al frontend solo se envían los
+    centros y conteos de las celdas no vacías (a lo sumo unos pocos miles),
+    sin importar cuántas filas tengan los datos. La celda de cada fila
+    queda guardada en el kernel, así que seleccionar hexágonos en el
+    gráfico recupera sus filas sin recorrer los datos.
+
+    Attributes:
+        dataColumns (Instance): Celdas sincronizadas con el frontend
+            (columnas `x`, `y` con el centro y `count`).
+        x (Unicode): Variable numérica para el eje X.
+        y (Unicode): Variable numérica para el eje Y.
+        gridSize (Int): Cantidad de hexágonos a lo ancho.
+        aspect (Float): Alto del área del gráfico dividido por su ancho,
+            informado por el frontend.
+        xDomain (List): Dominio redondeado de X usado para agrupar.
+        yDomain (List): Dominio redondeado de Y usado para agrupar.
+        selectedBins (List): Celdas seleccionadas por el usuario.
+    """
+    _view_name = Unicode("HexbinPlotView").tag(sync=True)
+    _model_name = Unicode("HexbinPlotModel").tag(sync=True)
+
+    x = Unicode().tag(sync=True)
+    y = Unicode().tag(sync=True)
+    gridSize = Int(40).tag(sync=True)
+    aspect = Float(0.5).tag(sync=True)
+    xDomain = List().tag(sync=True)
+    yDomain = List().tag(sync=True)
+    selectedBins = List(Int()).tag(sync=True)
+
+    _column_traits = ("x", "y")
+    # Celda de cada fila y filas agrupadas por celda de la última agrupación.
+    _bins = None
+    _members = None
+
+    def __init__(self, data, grid_size=40, **kwargs):
+        """Inicializa el gráfico con datos y tamaño de la grilla.
+
+        Args:
+            data (pd.DataFrame | Dataset | DataSource | str): Datos fuente.
+                De una fuente de datos o ruta a un archivo Parquet/Arrow
+                solo se leen las columnas X e Y.
+            grid_size (int, optional): Hexágonos a lo ancho. Por defecto 40.
+            **kwargs: Argumentos adicionales propagados a BaseWidget.
+        """
+        self.gridSize = grid_size
+        self.data = data
+        super().__init__(**kwargs)
+
+    def _clear_reduction(self):
+        """Descarta las celdas de los datos anteriores."""
+        self._bins = None
+        self._members = None
+
+    def _required_columns(self):
+        """Sincroniza todas las columnas de la tabla de celdas."""
+        return None
+
+    def _reduce(self):
+        """Agrupa las filas en hexágonos.
+
+        Returns:
+            ColumnTable: Centro y conteo de cada celda no vacía.
+        """
+        self._clear_reduction()
+        self.selectedBins = []
+        if not self.x or not self.y:
+            self.xDomain, self.yDomain = [], []
+            return ColumnTable()
+        table = self._full_table([self.x, self.y])
+        if self.x not in table or self.y not in table:
+            self.xDomain, self.yDomain = [], []
+            return ColumnTable()
+        x_domain, y_domain = table.domain(self.x), table.domain(self.y)
+        if x_domain is None or y_domain is None:
+            raise TypeError(f"HexbinPlot columns {self.x!r} and {self.y!r} must be numeric")
+        self.xDomain, self.yDomain = x_domain["nice"], y_domain["nice"]
+        bins, center_x, center_y, counts = hexbin(
+            table.column(self.x).astype(np.float64),
+            table.column(self.y).astype(np.float64),
+            self.xDomain,
+            self.yDomain,
+            self.gridSize,
+            self.aspect,
+        )
+        self._bins = bins
+        return ColumnTable({"x": center_x, "y": center_y, "count": counts}, len(counts))
+
+    @observe("gridSize", "aspect")
+    def _on_grid_change(self, change):
+        """Agrupa de nuevo al cambiar la grilla o la forma del gráfico."""
+        self._refresh()
+
+    @property
+    def selectedRows(self):
+        """Filas de los datos completos que caen en las celdas seleccionadas.
+
+        Returns:
+            np.ndarray: Índices de las filas, en orden.
+        """
+        if self._bins is None or not self.selectedBins:
+            return np.array([], dtype=np.int64)
+        if self._members is None:
+            self._members = bin_members(self._bins, len(self.dataColumns))
+        order, offsets = self._members
+        bins = np.asarray(self.selectedBins)
+        bins = bins[(bins >= 0) & (bins < len(offsets) - 1)]
+        rows = [order[offsets[b]:offsets[b + 1]] for b in bins]
+        return np.sort(np.concatenate(rows)) if rows else np.array([], dtype=np.int64)
+
+    @property
+    def selectedValues(self):
+        """Retorna las filas de las celdas seleccionadas.
+
+        Con una fuente de datos solo se leen las filas seleccionadas.
+
+        Returns:
+            pd.DataFrame: Filas seleccionadas, con el índice del DataFrame
+                recibido (o su posición si los datos no eran un DataFrame).
+        """
+        rows = self.selectedRows
+        if self._full is None:
+            return self._source.take(rows, self._source.names)
+        return self._rows_frame(self._full, rows)
+
+    def on_select_values(self, callback):
+        """Registra un callback para cambios en la selección de celdas.
+
+        Args:
+            callback (Callable): Función o corrutina que recibe el cambio del trait `selectedBins`.
+        """
+        self._observe_callback(callback, names=["selectedBins"])
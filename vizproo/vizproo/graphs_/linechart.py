@@ -0,0 +1,169 @@
+import numpy as np
+from traitlets import Float, Int, List, TraitError, Unicode, observe, validate
+
+from vizproo.base_widget import ReducedDataWidget, widgets
+from vizproo.columns import ColumnTable
+from vizproo.downsample import METHODS
+
+
+@widgets.register
+class LineChart(ReducedDataWidget):
+    """Gráfico de líneas para series largas, reducido por píxel en Python.
+
+    La serie completa queda en el kernel y al frontend solo se envía la
+    ventana visible reducida con M4 o LTTB a unos cuatro puntos por columna
+    de píxeles, sin importar cuántas filas tenga. Al hacer zoom o desplazar
+    el gráfico el frontend actualiza `xWindow` y el kernel responde con la
+    ventana nueva reducida.
+
+    Attributes:
+        dataColumns (Instance): Ventana reducida sincronizada con el frontend.
+        x (Unicode): Variable para el eje X (numérica o fecha).
+        y (Unicode): Variable para el eje Y (numérica).
+        method (Unicode): Reducción usada, "m4" o "lttb".
+        pixels (Int): Ancho del área del gráfico en píxeles, informado por
+            el frontend.
+        xWindow (List): Ventana visible [inicio, fin] de X (en milisegundos
+            si X es una fecha); vacía muestra la serie completa.
+        xDomain (List): Mínimo y máximo de X en la serie completa.
+        yDomain (List): Mínimo y máximo de Y en la serie completa.
+        lineWidth (Float): Grosor de la línea.
+    """
+    _view_name = Unicode("LineChartView").tag(sync=True)
+    _model_name = Unicode("LineChartModel").tag(sync=True)
+
+    x = Unicode().tag(sync=True)
+    y = Unicode().tag(sync=True)
+    method = Unicode("m4").tag(sync=True)
+    pixels = Int(800).tag(sync=True)
+    xWindow = List(Float()).tag(sync=True)
+    xDomain = List().tag(sync=True)
+    yDomain = List().tag(sync=True)
+    lineWidth = Float(1.5).tag(sync=True)
+
+    _column_traits = ("x", "y")
+    # Serie ordenada de las columnas actuales (ver `_series`).
+    _sorted = None
+
+    def __init__(self, data, method="m4", line_width=1.5, **kwargs):
+        """Inicializa el gráfico con la serie y la reducción a usar.
+
+        Args:
+            data (pd.DataFrame | Dataset | DataSource | str): Datos fuente.
+                De una fuente de datos o ruta a un archivo Parquet/Arrow
+                solo se leen las columnas X e Y.
+            method (str, optional): Reducción, "m4" o "lttb". Por defecto "m4".
+            line_width (float, optional): Grosor de la línea. Por defecto 1.5.
+            **kwargs: Argumentos adicionales propagados a BaseWidget.
+        """
+        self.method = method
+        self.lineWidth = line_width
+        self.data = data
+        super().__init__(**kwargs)
+
+    @validate("method")
+    def _valid_method(self, proposal):
+        """Acepta solo las reducciones disponibles."""
+        if proposal["value"] not in METHODS:
+            raise TraitError(f"Unknown downsampling method {proposal['value']!r}; expected 'm4' or 'lttb'")
+        return proposal["value"]
+
+    def _clear_reduction(self):
+        """Descarta la serie ordenada de los datos anteriores."""
+        self._sorted = None
+
+    def _series(self):
+        """Ordena por X las filas válidas de las columnas actuales.
+
+        El resultado se guarda hasta que cambien los datos o las columnas.
+
+        Returns:
+            tuple | None: Filas ordenadas, X e Y como float64 y la tabla de
+                origen, o None si faltan columnas.
+        """
+        key = (self.x, self.y)
+        if self._sorted is not None and self._sorted[0] == key:
+            return self._sorted[1]
+        if not self.x or not self.y:
+            return None
+        table = self._full_table(key)
+        if self.x not in table or self.y not in table:
+            return None
+        xs = _series_values(table.column(self.x), self.x)
+        ys = _series_values(table.column(self.y), self.y)
+        rows = np.flatnonzero(~(np.isnan(xs) | np.isnan(ys)))
+        if rows.size > 1 and (np.diff(xs[rows]) < 0).any():
+            rows = rows[np.argsort(xs[rows], kind="stable")]
+        series = (rows, xs[rows], ys[rows], table)
+        self._sorted = (key, series)
+        return series
+
+    def _reduce(self):
+        """Reduce la ventana visible de la serie.
+
+        Returns:
+            ColumnTable: Puntos de la ventana con las columnas X e Y originales.
+        """
+        series = self._series()
+        if series is None or not series[0].size:
+            return ColumnTable()
+        rows, xs, ys, full = series
+        start, stop = self.xWindow if len(self.xWindow) == 2 else (xs[0], xs[-1])
+        kept = rows[METHODS[self.method](xs, ys, start, stop, self.pixels)]
+        columns = {name: full.column(name)[kept] for name in dict.fromkeys((self.x, self.y))}
+        return ColumnTable(columns, len(kept))
+
+    def _update_stats(self, table):
+        """Toma los dominios de X e Y de la serie completa.
+
+        Args:
+            table (ColumnTable): Ventana sincronizada (no se usa).
+        """
+        current = self._sorted is not None and self._sorted[0] == (self.x, self.y)
+        series = self._sorted[1] if current else None
+        if series is None or not series[0].size:
+            self.xDomain, self.yDomain = [], []
+            return
+        _, xs, ys, _ = series
+        self.xDomain = [float(xs[0]), float(xs[-1])]
+        self.yDomain = [float(ys.min()), float(ys.max())]
+
+    def _on_required_columns_change(self, change):
+        """Vuelve a la serie completa al cambiar X y reduce la ventana."""
+        if change["name"] == "x" and self.xWindow:
+            self.xWindow = []
+        else:
+            self._refresh()
+
+    @observe("xWindow", "pixels", "method")
+    def _on_window_change(self, change):
+        """Reduce de nuevo la serie al hacer zoom, desplazar o redimensionar."""
+        self._refresh()
+
+    def on_window_change(self, callback):
+        """Registra un callback para cambios de la ventana visible.
+
+        Args:
+            callback (Callable): Función o corrutina que recibe el cambio del trait `xWindow`.
+        """
+        self._observe_callback(callback, names=["xWindow"])
+
+
+def _series_values(array, name):
+    """Convierte una columna numérica o de fechas en float64 con NaN.
+
+    Las fechas se expresan en milisegundos desde la época, igual que en el
+    frontend.
+
+    Raises:
+        TypeError: Si la columna no es numérica ni de fechas.
+    """
+    kind = getattr(getattr(array, "dtype", None), "kind", None)
+    if kind == "M":
+        values = array.astype("datetime64[ms]").view(np.int64).astype(np.float64)
+        values[np.isnat(array)] = np.nan
+        return values
+    if kind in ("i", "u", "f", "b"):
+        return array.astype(np.float64)
+    raise TypeError(f"LineChart column {name!r} must be numeric or datetime")
+
@@ -1,16 +1,16 @@
 from traitlets import  List, Unicode
 
-from vizproo.base_widget import BaseWidget, widgets, pd
+from vizproo.base_widget import DataWidget, StaticExportMixin, widgets
 
 @widgets.register
-class RadViz(BaseWidget):
+class RadViz(StaticExportMixin, DataWidget):
     """Gráfico RadViz interactivo para visualización multivariada.
 
     Distribuye dimensiones sobre un círculo y posiciona registros según sus
     valores. Sincroniza datos, dimensiones y selección con el frontend.
 
     Attributes:
-        dataRecords (List): Registros de datos (lista de dicts) sincronizados con el frontend.
+        dataColumns (Instance): Tabla columnar compacta sincronizada con el frontend.
         dimensions (List): Lista de nombres de columnas usadas como dimensiones.
         hue (Unicode): Variable categórica para colorear los puntos.
         selectedValuesRecords (List): Registros seleccionados por el usuario.
@@ -18,16 +18,19 @@ class RadViz(BaseWidget):
     _view_name = Unicode("RadVizView").tag(sync=True)
     _model_name = Unicode("RadVizModel").tag(sync=True)
 
-    dataRecords = List([]).tag(sync=True)
     dimensions = List([]).tag(sync=True)
     hue = Unicode().tag(sync=True)
     selectedValuesRecords = List([]).tag(sync=True)
 
+    _column_traits = ("dimensions", "hue")
+
     def __init__(self, data, dimensions, hue, **kwargs):
         """Inicializa el gráfico con datos, dimensiones y variable de color.
 
         Args:
-            data (pd.DataFrame): Datos fuente para el gráfico.
+            data (pd.DataFrame | Dataset | DataSource | str): Datos fuente
+                para el gráfico. Una fuente de datos o ruta a un archivo
+                Parquet/Arrow se muestrea sin cargarla en memoria.
             dimensions (List[str]): Columnas a usar como dimensiones en RadViz.
             hue (str): Columna categórica para colorear puntos.
             **kwargs: Argumentos adicionales propagados a BaseWidget.
@@ -35,27 +38,8 @@ class RadViz(BaseWidget):
         self.data = data
         self.dimensions = dimensions
         self.hue = hue
-        self.selectedValues = pd.DataFrame()
         super().__init__(**kwargs)
 
-    @property
-    def data(self):
-        """Retorna los datos como DataFrame.
-
-        Returns:
-            pd.DataFrame: DataFrame construido desde `dataRecords`.
-        """
-        return pd.DataFrame.from_records(self.dataRecords)
-
-    @data.setter
-    def data(self, val):
-        """Establece los datos del gráfico desde un DataFrame.
-
-        Args:
-            val (pd.DataFrame): DataFrame a convertir a lista de registros dict.
-        """
-        self.dataRecords = val.to_dict(orient="records")
-
     @property
     def selectedValues(self):
         """Retorna los valores actualmente seleccionados.
@@ -63,6 +47,8 @@ class RadViz(BaseWidget):
         Returns:
             pd.DataFrame: Selección del usuario como DataFrame.
         """
+        import pandas as pd
+
         return pd.DataFrame.from_records(self.selectedValuesRecords)
 
     @selectedValues.setter
@@ -78,7 +64,7 @@ class RadViz(BaseWidget):
         """Registra un callback para cambios en la selección de valores.
 
         Args:
-            callback (Callable): Función que recibe el cambio del trait `selectedValuesRecords`.
+            callback (Callable): Función o corrutina que recibe el cambio del trait `selectedValuesRecords`.
         """
-        self.observe(callback, names=["selectedValuesRecords"])
+        self._observe_callback(callback, names=["selectedValuesRecords"])
 
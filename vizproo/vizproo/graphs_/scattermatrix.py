@@ -0,0 +1,116 @@
+from ipywidgets.widgets.trait_types import bytes_serialization
+from traitlets import Bytes, Float, List, Unicode
+
+from vizproo.base_widget import DataWidget, widgets
+
+
+@widgets.register
+class ScatterMatrix(DataWidget):
+    """Matriz de gráficos de dispersión con selección enlazada.
+
+    Dibuja un panel por cada par de columnas en una sola vista. Cada
+    columna se envía una única vez y todos los paneles de una misma fila o
+    columna comparten su escala (los dominios calculados en Python). Al
+    seleccionar con una caja en un panel se resaltan las mismas filas en
+    todos los demás desde el frontend, sin pasar por el kernel; al soltar
+    la caja la selección se sincroniza como un mapa de bits.
+
+    Attributes:
+        dataColumns (Instance): Tabla columnar compacta sincronizada con el frontend.
+        columns (List): Columnas numéricas de la matriz, en orden.
+        hue (Unicode): Variable para color/categoría.
+        pointSize (Float): Tamaño de los puntos en píxeles.
+        opacity (Float): Opacidad de los puntos (0 a 1).
+        selection (Bytes): Filas seleccionadas, un bit por fila (orden de
+            bits little-endian); vacío si no hay selección.
+    """
+    _view_name = Unicode("ScatterMatrixView").tag(sync=True)
+    _model_name = Unicode("ScatterMatrixModel").tag(sync=True)
+
+    columns = List(Unicode()).tag(sync=True)
+    hue = Unicode().tag(sync=True)
+    pointSize = Float(2.0).tag(sync=True)
+    opacity = Float(0.7).tag(sync=True)
+    selection = Bytes(b"").tag(sync=True, **bytes_serialization)
+
+    _column_traits = ("columns", "hue")
+
+    def __init__(self, data, columns=None, point_size=2.0, opacity=0.7, **kwargs):
+        """Inicializa la matriz con datos, columnas y parámetros visuales.
+
+        Args:
+            data (pd.DataFrame | Dataset | DataSource | str): Datos fuente
+                para el gráfico. Una fuente de datos o ruta a un archivo
+                Parquet/Arrow se muestrea sin cargarla en memoria.
+            columns (List[str], optional): Columnas de la matriz. Por defecto
+                las columnas numéricas de los datos (sin `hue`); con una
+                fuente de datos hay que indicarlas.
+            point_size (float, optional): Tamaño de los puntos. Por defecto 2.0.
+            opacity (float, optional): Opacidad de los puntos (0-1). Por defecto 0.7.
+            **kwargs: Argumentos adicionales propagados a BaseWidget.
+        """
+        self.data = data
+        if columns is None:
+            table = self._table
+            hue = kwargs.get("hue", "")
+            columns = [name for name in table.names if name != hue and table.extent(name) is not None]
+        self.columns = list(columns)
+        self.pointSize = point_size
+        self.opacity = opacity
+        super().__init__(**kwargs)
+
+    @DataWidget.data.setter
+    def data(self, val):
+        """Establece los datos del widget y descarta la selección anterior.
+
+        Args:
+            val (pd.DataFrame | Dataset | DataSource | str): Datos fuente.
+        """
+        DataWidget.data.fset(self, val)
+        self.selection = b""
+
+    @property
+    def selectedRows(self):
+        """Filas seleccionadas en la matriz.
+
+        Returns:
+            np.ndarray: Índices de las filas seleccionadas, en orden.
+        """
+        import numpy as np
+
+        if not self.selection:
+            return np.array([], dtype=np.int64)
+        bits = np.frombuffer(self.selection, dtype=np.uint8)
+        count = min(len(self._table), bits.size * 8)
+        return np.flatnonzero(np.unpackbits(bits, count=count, bitorder="little"))
+
+    @selectedRows.setter
+    def selectedRows(self, rows):
+        """Selecciona filas desde Python y las resalta en el frontend.
+
+        Args:
+            rows (Sequence[int]): Índices de las filas a seleccionar.
+        """
+        import numpy as np
+
+        mask = np.zeros(len(self._table), dtype=bool)
+        mask[np.asarray(rows, dtype=np.int64)] = True
+        self.selection = np.packbits(mask, bitorder="little").tobytes()
+
+    @property
+    def selectedValues(self):
+        """Retorna las filas seleccionadas.
+
+        Returns:
+            pd.DataFrame: Filas seleccionadas, con el índice del DataFrame
+                recibido (o su posición si los datos no eran un DataFrame).
+        """
+        return self._rows_frame(self._table, self.selectedRows)
+
+    def on_select_values(self, callback):
+        """Registra un callback para cambios en la selección.
+
+        Args:
+            callback (Callable): Función o corrutina que recibe el cambio del trait `selection`.
+        """
+        self._observe_callback(callback, names=["selection"])
@@ -1,16 +1,16 @@
 from traitlets import  List, Unicode, Float
 
-from vizproo.base_widget import BaseWidget, widgets, pd
+from vizproo.base_widget import DataWidget, StaticExportMixin, widgets
 
 #Scatter
 @widgets.register
-class ScatterPlot(BaseWidget):
+class ScatterPlot(StaticExportMixin, DataWidget):
     """Gráfico de dispersión interactivo con tamaño y opacidad configurables.
 
     Sincroniza datos, selección y parámetros visuales con el frontend mediante traits.
 
     Attributes:
-        dataRecords (List): Registros de datos (lista de dicts), sincronizados con el frontend.
+        dataColumns (Instance): Tabla columnar compacta sincronizada con el frontend.
         x (Unicode): Variable para el eje X.
         y (Unicode): Variable para el eje Y.
         hue (Unicode): Variable para color/categoría.
@@ -22,7 +22,6 @@ class ScatterPlot(BaseWidget):
     _view_name = Unicode("ScatterPlotView").tag(sync=True)
     _model_name = Unicode("ScatterPlotModel").tag(sync=True)
 
-    dataRecords = List([]).tag(sync=True)
     x = Unicode().tag(sync=True)
     y = Unicode().tag(sync=True)
     hue = Unicode().tag(sync=True)
@@ -31,11 +30,15 @@ class ScatterPlot(BaseWidget):
     opacity = Float(0.7).tag(sync=True)
     selectedValuesRecords = List([]).tag(sync=True)
 
+    _column_traits = ("x", "y", "hue", "size")
+
     def __init__(self, data, point_size = 5.0, opacity = 0.7, **kwargs):
         """Inicializa el gráfico con datos y parámetros visuales.
 
         Args:
-            data (pd.DataFrame): Datos fuente para el gráfico.
+            data (pd.DataFrame | Dataset | DataSource | str): Datos fuente
+                para el gráfico. Una fuente de datos o ruta a un archivo
+                Parquet/Arrow se muestrea sin cargarla en memoria.
             point_size (float, optional): Tamaño base de los puntos. Por defecto 5.0.
             opacity (float, optional): Opacidad de los puntos (0-1). Por defecto 0.7.
             **kwargs: Argumentos adicionales propagados a BaseWidget.
@@ -43,27 +46,8 @@ class ScatterPlot(BaseWidget):
         self.data = data
         self.pointSize = point_size
         self.opacity = opacity
-        self.selectedValues = pd.DataFrame()
         super().__init__(**kwargs)
 
-    @property
-    def data(self):
-        """Retorna los datos como DataFrame.
-
-        Returns:
-            pd.DataFrame: DataFrame construido desde `dataRecords`.
-        """
-        return pd.DataFrame.from_records(self.dataRecords)
-    
-    @data.setter
-    def data(self, val):
-        """Establece los datos del gráfico desde un DataFrame.
-
-        Args:
-            val (pd.DataFrame): DataFrame a convertir a lista de registros dict.
-        """
-        self.dataRecords = val.to_dict(orient="records")
-
     @property
     def selectedValues(self):
         """Retorna los valores actualmente seleccionados.
@@ -71,6 +55,8 @@ class ScatterPlot(BaseWidget):
         Returns:
             pd.DataFrame: Selección del usuario como DataFrame.
         """
+        import pandas as pd
+
         return pd.DataFrame.from_records(self.selectedValuesRecords)
     
     @selectedValues.setter
@@ -86,6 +72,6 @@ class ScatterPlot(BaseWidget):
         """Registra un callback para cambios en la selección de valores.
 
         Args:
-            callback (Callable): Función que recibe el cambio del trait `selectedValuesRecords`.
+            callback (Callable): Función o corrutina que recibe el cambio del trait `selectedValuesRecords`.
         """
-        self.observe(callback, names=["selectedValuesRecords"])
+        self._observe_callback(callback, names=["selectedValuesRecords"])
@@ -2,7 +2,6 @@ import random
 import string
 
 import ipywidgets as widgets
-from IPython.display import display
 from traitlets import List, Unicode
 
 from vizproo.base_widget import BaseWidget
@@ -253,6 +252,8 @@ class MatrixLayout(BaseWidget):
         Raises:
             ValueError: Si `position` no existe en la matriz.
         """
+        from IPython.display import display
+
         # NUEVO: Validar que la posición existe en la matriz
         if position not in self.positions_hashs:
             available = sorted(self.positions_hashs.keys())
@@ -269,6 +270,27 @@ class MatrixLayout(BaseWidget):
         else:
             self._widgets_to_display[position] = widget
 
+    def to_html(self, path, title="vizproo", bundle_url=None):
+        """Guarda el dashboard como un único archivo HTML autónomo.
+
+        Los datos de los widgets que comparten el mismo contenido se
+        incrustan una sola vez, comprimidos, y cada gráfico se dibuja
+        cuando su área entra en pantalla.
+
+        Args:
+            path (str | os.PathLike): Archivo de salida.
+            title (str, optional): Título de la página. Por defecto "vizproo".
+            bundle_url (str, optional): URL del bundle de vizproo (sin `.js`);
+                por defecto se usa el CDN de npm.
+
+        Returns:
+            str | os.PathLike: Ruta escrita.
+        """
+        from .embed import write_html
+
+        areas = {w.elementId: w.model_id for w in self._all_widgets}
+        return write_html(self, self._all_widgets, areas, path, title, bundle_url)
+
 @widgets.register
 class MatrixCreator(BaseWidget):
     """Widget para crear matrices de layout desde el frontend.
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) MATIUS.
+# Distributed under the terms of the Modified BSD License.
+
+"""
+Configuración global de vizproo.
+"""
+
+
+class Settings:
+    """Opciones globales que afectan a todos los widgets.
+
+    Attributes:
+        compression (bool): Si es True, los datos enviados al frontend se
+            comprimen con zlib cuando superan `compression_threshold`. Cada
+            widget puede sobrescribirlo con su trait `compression`.
+        compression_threshold (int): Tamaño mínimo en bytes del envío para
+            comprimirlo.
+        compression_level (int): Nivel de compresión de zlib (1 a 9).
+        parallel_encoding (bool): Si es True, las columnas de cada widget se
+            codifican en un pool de hilos: el widget se crea de inmediato con
+            la tabla vacía y sus columnas se envían al frontend apenas están
+            listas. Útil al crear muchos gráficos a la vez.
+        encoding_workers (int): Hilos del pool de codificación; None usa el
+            valor por defecto de `ThreadPoolExecutor`. Se lee al crear el pool.
+        sample_size (int): Filas que se muestrean de una fuente de datos
+            (archivo, base de datos) para los gráficos que dibujan cada fila.
+        cache (bool): Si es True, las columnas codificadas y sus estadísticas
+            se guardan en disco (ver `vizproo.cache`) y se reutilizan cuando
+            los mismos datos se vuelven a graficar, incluso en otra sesión.
+        cache_dir (str): Directorio de la caché en disco.
+        cache_max_bytes (int): Tamaño máximo de la caché; al superarlo se
+            borran las entradas usadas hace más tiempo.
+        shared_dir (str): Directorio donde `Dataset.publish` guarda los
+            datasets compartidos entre kernels.
+    """
+
+    def __init__(self):
+        self.compression = False
+        self.compression_threshold = 1 << 20
+        self.compression_level = 6
+        self.parallel_encoding = False
+        self.encoding_workers = None
+        self.sample_size = 200_000
+        self.cache = False
+        self.cache_dir = "~/.cache/vizproo"
+        self.cache_max_bytes = 1 << 30
+        self.shared_dir = "~/.cache/vizproo/datasets"
+
+
+settings = Settings()
@@ -0,0 +1,780 @@
+"""Fuentes de datos que no se cargan completas en memoria.
+
+Un gráfico que recibe una fuente en lugar de un DataFrame no materializa
+los datos: al abrirse le pide a la fuente solo la reducción que necesita
+(una muestra de filas, promedios por grupo, valores distintos o la
+extensión de una columna) y sincroniza ese resultado como su tabla. Las
+reducciones se calculan recorriendo los datos por lotes, por lo que la
+memoria usada depende del tamaño del lote y del resultado, no de la fuente.
+Las fuentes respaldadas por un motor de consultas (`SQLSource`,
+`PolarsSource`) delegan cada reducción al motor y solo reciben el resultado.
+"""
+
+import os
+import queue
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+
+from .columns import ColumnTable, _column_extent, _compact_array
+
+# Sufijos de archivo reconocidos por `ArrowFileSource`.
+_PARQUET_SUFFIXES = (".parquet", ".pq")
+_IPC_SUFFIXES = (".arrow", ".feather", ".ipc")
+
+# Sufijos de bases de datos que se abren con DuckDB; el resto usa SQLite.
+_DUCKDB_SUFFIXES = (".duckdb", ".ddb")
+
+# Cantidad máxima de resultados y de fuentes filtradas que guarda cada
+# `PolarsSource`; al superarla se descartan los menos usados.
+_POLARS_CACHE_SIZE = 32
+
+# Pools de conexiones por ruta de base de datos, compartidos por las fuentes.
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+class DataSource:
+    """Base de las fuentes de datos leídas por lotes.
+
+    Las subclases implementan `names` y `_batches`; las reducciones se
+    calculan aquí combinando los resultados de cada lote. Una subclase puede
+    redefinir cualquier reducción para delegarla al motor que guarda los
+    datos.
+
+    Attributes:
+        batch_size (int): Filas por lote al recorrer la fuente.
+    """
+
+    batch_size = 65_536
+
+    @property
+    def names(self):
+        """Lista de nombres de columnas de la fuente."""
+        raise NotImplementedError
+
+    def _batches(self, columns):
+        """Recorre la fuente por lotes.
+
+        Args:
+            columns (List[str]): Columnas a leer.
+
+        Yields:
+            pd.DataFrame: Lote con las columnas pedidas.
+        """
+        raise NotImplementedError
+
+    def read(self, columns):
+        """Lee completas solo las columnas indicadas.
+
+        La usan los gráficos que reducen los datos en el kernel según la
+        vista (por ejemplo `LineChart` y `HexbinPlot`) y necesitan todas las
+        filas de pocas columnas.
+
+        Args:
+            columns (List[str]): Columnas a leer.
+
+        Returns:
+            ColumnTable: Tabla con las columnas pedidas.
+        """
+        import pandas as pd
+
+        frames = list(self._batches(columns))
+        frame = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
+        return ColumnTable.from_frame(frame)
+
+    def take(self, rows, columns):
+        """Lee solo algunas filas, recorriendo la fuente por lotes.
+
+        Args:
+            rows (np.ndarray): Posiciones de las filas, en orden.
+            columns (List[str]): Columnas a leer.
+
+        Returns:
+            pd.DataFrame: Filas pedidas, indexadas por su posición.
+        """
+        import pandas as pd
+
+        rows = np.asarray(rows, dtype=np.int64)
+        parts, start = [], 0
+        if rows.size:
+            for frame in self._batches(columns):
+                stop = start + len(frame)
+                first, last = np.searchsorted(rows, [start, stop])
+                if last > first:
+                    parts.append(frame.iloc[rows[first:last] - start])
+                start = stop
+                if last == rows.size:
+                    break
+        if not parts:
+            return pd.DataFrame({name: [] for name in columns}, index=pd.Index([], dtype=np.int64))
+        frame = pd.concat(parts)
+        frame.index = rows[:len(frame)]
+        return frame
+
+    def sample(self, columns, size):
+        """Toma una muestra uniforme de filas en una sola pasada.
+
+        Cada fila recibe una clave aleatoria y se conservan las `size` de
+        menor clave, en el orden original. La extensión de cada columna
+        numérica se calcula sobre todas las filas y queda guardada en la
+        tabla, así que los dominios de las escalas cubren los datos
+        completos aunque solo se envíe la muestra.
+
+        Args:
+            columns (List[str]): Columnas a incluir.
+            size (int): Cantidad máxima de filas.
+
+        Returns:
+            ColumnTable: Muestra de la fuente.
+        """
+        import pandas as pd
+
+        rng = np.random.default_rng(0)
+        extents = {}
+        kept, keys = None, None
+        offset = 0
+        for frame in self._batches(columns):
+            _update_extents(extents, frame)
+            frame = frame.set_axis(pd.RangeIndex(offset, offset + len(frame)))
+            offset += len(frame)
+            batch_keys = rng.random(len(frame))
+            if kept is not None:
+                frame = pd.concat([kept, frame])
+                batch_keys = np.concatenate([keys, batch_keys])
+            if len(frame) > size:
+                chosen = np.argpartition(batch_keys, size)[:size]
+                frame, batch_keys = frame.iloc[chosen], batch_keys[chosen]
+            kept, keys = frame, batch_keys
+
+        if kept is None:
+            kept = pd.DataFrame(columns=columns)
+        return _sample_table(kept.sort_index().reset_index(drop=True), extents)
+
+    def group_means(self, keys, value):
+        """Promedia una columna por cada combinación de valores de `keys`.
+
+        Args:
+            keys (List[str]): Columnas de los grupos.
+            value (str): Columna numérica a promediar.
+
+        Returns:
+            ColumnTable: Una fila por grupo con las claves y el promedio.
+        """
+        total = None
+        for frame in self._batches(list(dict.fromkeys([*keys, value]))):
+            part = frame.groupby(keys, dropna=False, observed=True, sort=False)[value].agg(["sum", "count"])
+            total = part if total is None else total.add(part, fill_value=0)
+        return _means_table(total, keys, value)
+
+    def distinct(self, name):
+        """Devuelve los valores distintos de una columna.
+
+        Args:
+            name (str): Nombre de la columna.
+
+        Returns:
+            ColumnTable: Una fila por valor distinto.
+        """
+        import pandas as pd
+
+        values = pd.Series([], dtype=object)
+        for frame in self._batches([name]):
+            values = pd.Series(pd.unique(pd.concat([values, frame[name]], ignore_index=True)))
+        return ColumnTable.from_frame(pd.DataFrame({name: values}))
+
+    def bounds(self, name):
+        """Devuelve el mínimo y el máximo de una columna numérica.
+
+        Args:
+            name (str): Nombre de la columna.
+
+        Returns:
+            ColumnTable: Dos filas con el mínimo y el máximo, o ninguna si
+                la columna no es numérica.
+        """
+        import pandas as pd
+
+        extents = {}
+        for frame in self._batches([name]):
+            _update_extents(extents, frame)
+        values = list(extents[name]) if name in extents else []
+        return ColumnTable.from_frame(pd.DataFrame({name: values}))
+
+
+class ArrowFileSource(DataSource):
+    """Archivo Parquet o Arrow IPC (Feather v2) mapeado en memoria.
+
+    Solo se leen las columnas que pide cada reducción y de a un lote por
+    vez; las páginas del archivo las carga el sistema operativo bajo
+    demanda. Requiere el paquete opcional `pyarrow`
+    (`pip install vizproo[arrow]`).
+
+    Attributes:
+        path (str): Ruta del archivo.
+    """
+
+    def __init__(self, path):
+        """Abre el archivo según su extensión.
+
+        Args:
+            path (str | os.PathLike): Archivo `.parquet`/`.pq` o
+                `.arrow`/`.feather`/`.ipc`.
+
+        Raises:
+            ValueError: Si la extensión no corresponde a un formato soportado.
+            ImportError: Si `pyarrow` no está instalado.
+        """
+        self.path = os.fspath(path)
+        suffix = os.path.splitext(self.path)[1].lower()
+        if suffix not in _PARQUET_SUFFIXES + _IPC_SUFFIXES:
+            raise ValueError(f"Unsupported file type {suffix!r}; expected Parquet or Arrow IPC")
+        pa = _import_pyarrow()
+        if suffix in _PARQUET_SUFFIXES:
+            import pyarrow.parquet as pq
+
+            self._parquet = pq.ParquetFile(self.path, memory_map=True)
+            self._ipc = None
+            self._schema = self._parquet.schema_arrow
+        else:
+            self._parquet = None
+            self._ipc = pa.ipc.open_file(pa.memory_map(self.path, "r"))
+            self._schema = self._ipc.schema
+
+    @property
+    def names(self):
+        """Lista de nombres de columnas del archivo."""
+        return list(self._schema.names)
+
+    def _batches(self, columns):
+        """Lee el archivo por lotes con solo las columnas pedidas."""
+        if self._parquet is not None:
+            for batch in self._parquet.iter_batches(batch_size=self.batch_size, columns=columns):
+                yield batch.to_pandas()
+            return
+        import pyarrow as pa
+
+        for i in range(self._ipc.num_record_batches):
+            table = pa.Table.from_batches([self._ipc.get_batch(i)]).select(columns)
+            for batch in table.to_batches(max_chunksize=self.batch_size):
+                yield batch.to_pandas()
+
+
+class ConnectionPool:
+    """Conexiones reutilizables a una base de datos local.
+
+    Las fuentes que apuntan a la misma base comparten el pool, así que
+    muchos widgets usan unas pocas conexiones en lugar de abrir una cada
+    uno.
+
+    Attributes:
+        size (int): Conexiones inactivas que se conservan abiertas.
+    """
+
+    def __init__(self, connect, size=4):
+        """Crea el pool.
+
+        Args:
+            connect (Callable[[], Connection]): Abre una conexión DB-API nueva.
+            size (int, optional): Conexiones inactivas a conservar. Por defecto 4.
+        """
+        self._connect = connect
+        self._idle = queue.LifoQueue()
+        self.size = size
+
+    @contextmanager
+    def connection(self):
+        """Presta una conexión del pool y la devuelve al terminar.
+
+        Yields:
+            Connection: Conexión DB-API.
+        """
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            connection = self._connect()
+        try:
+            yield connection
+        finally:
+            if self._idle.qsize() < self.size:
+                self._idle.put(connection)
+            else:
+                connection.close()
+
+
+class _SingleConnection:
+    """Pool de una conexión provista por el usuario, que nunca se cierra."""
+
+    def __init__(self, connection):
+        self._connection = connection
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self):
+        with self._lock:
+            yield self._connection
+
+
+def connection_pool(database):
+    """Devuelve el pool compartido de una base de datos local.
+
+    Los archivos `.duckdb`/`.ddb` se abren con DuckDB (paquete opcional
+    `duckdb`) y el resto con `sqlite3`, ambos en modo solo lectura.
+
+    Args:
+        database (str | os.PathLike): Ruta de la base de datos.
+
+    Returns:
+        ConnectionPool: Pool de la base de datos.
+    """
+    path = os.path.abspath(os.fspath(database))
+    with _pools_lock:
+        pool = _pools.get(path)
+        if pool is None:
+            pool = _pools[path] = ConnectionPool(_connector(path))
+        return pool
+
+
+class SQLSource(DataSource):
+    """Tabla de una base de datos SQL local (SQLite o DuckDB).
+
+    Cada reducción se traduce a una consulta: promedios con `GROUP BY`,
+    muestras con `ORDER BY RANDOM() LIMIT` (o `USING SAMPLE` en DuckDB),
+    valores distintos con `SELECT DISTINCT` y extensiones con `MIN`/`MAX`.
+    Solo el resultado llega a Python y al navegador. `where` crea una
+    fuente filtrada que se resuelve en el motor; la condición se escribe en
+    SQL, ya que las selecciones de los widgets no se traducen solas a
+    predicados.
+
+    Attributes:
+        table (str): Tabla o vista consultada.
+    """
+
+    def __init__(self, database, table, where=None, params=()):
+        """Crea la fuente.
+
+        Args:
+            database (str | os.PathLike | Connection | ConnectionPool): Ruta
+                de la base (usa el pool compartido de `connection_pool`),
+                una conexión DB-API abierta o un pool.
+            table (str): Tabla o vista a consultar (admite `esquema.tabla`).
+            where (str, optional): Condición SQL para filtrar las filas.
+            params (Sequence, optional): Parámetros `?` de `where`.
+        """
+        if isinstance(database, (str, os.PathLike)):
+            self._pool = connection_pool(database)
+        elif isinstance(database, (ConnectionPool, _SingleConnection)):
+            self._pool = database
+        else:
+            self._pool = _SingleConnection(database)
+        self.table = table
+        self._where = where
+        self._params = tuple(params)
+        self._names = None
+
+    def where(self, condition, params=()):
+        """Devuelve una fuente con un filtro adicional.
+
+        Args:
+            condition (str): Condición SQL, con parámetros `?`.
+            params (Sequence, optional): Valores de los parámetros.
+
+        Returns:
+            SQLSource: Fuente filtrada que comparte las conexiones.
+        """
+        source = SQLSource(self._pool, self.table)
+        if self._where:
+            source._where = f"({self._where}) AND ({condition})"
+            source._params = self._params + tuple(params)
+        else:
+            source._where, source._params = condition, tuple(params)
+        return source
+
+    @property
+    def names(self):
+        """Lista de nombres de columnas de la tabla."""
+        if self._names is None:
+            self._names = list(self._query(f"SELECT * FROM {self._from()} LIMIT 0").columns)
+        return list(self._names)
+
+    def _from(self):
+        """Tabla citada más el filtro, listos para `FROM`."""
+        table = ".".join(_quote(part) for part in self.table.split("."))
+        return f"{table} WHERE {self._where}" if self._where else table
+
+    def _query(self, sql, params=None):
+        """Ejecuta una consulta y devuelve el resultado como DataFrame."""
+        import pandas as pd
+
+        with self._pool.connection() as connection:
+            cursor = connection.execute(sql, list(self._params if params is None else params))
+            names = [column[0] for column in cursor.description]
+            return pd.DataFrame.from_records(cursor.fetchall(), columns=names)
+
+    def _is_duckdb(self):
+        with self._pool.connection() as connection:
+            return type(connection).__module__.startswith("duckdb")
+
+    def _batches(self, columns):
+        """Recorre la tabla con `LIMIT`/`OFFSET`, de a un lote por vez.
+
+        Cada lote pide y devuelve su propia conexión, así que un recorrido a
+        medio consumir no retiene conexiones del pool entre lotes.
+        """
+        select = ", ".join(_quote(name) for name in columns)
+        offset = 0
+        while True:
+            frame = self._query(
+                f"SELECT {select} FROM {self._from()} LIMIT {int(self.batch_size)} OFFSET {offset}"
+            )
+            if frame.empty:
+                return
+            yield frame
+            if len(frame) < self.batch_size:
+                return
+            offset += len(frame)
+
+    def sample(self, columns, size):
+        """Toma una muestra en el motor y la extensión de todas las filas.
+
+        Args:
+            columns (List[str]): Columnas a incluir.
+            size (int): Cantidad máxima de filas.
+
+        Returns:
+            ColumnTable: Muestra de la tabla.
+        """
+        select = ", ".join(_quote(name) for name in columns)
+        if self._is_duckdb():
+            sql = (
+                f"SELECT * FROM (SELECT {select} FROM {self._from()}) "
+                f"USING SAMPLE reservoir({int(size)} ROWS) REPEATABLE (0)"
+            )
+        else:
+            sql = f"SELECT {select} FROM {self._from()} ORDER BY RANDOM() LIMIT {int(size)}"
+        frame = self._query(sql)
+        numeric = [name for name in columns if frame[name].dtype.kind in "iuf"]
+        extents = {}
+        if numeric:
+            aggregates = ", ".join(f"MIN({_quote(name)}), MAX({_quote(name)})" for name in numeric)
+            row = self._query(f"SELECT {aggregates} FROM {self._from()}").iloc[0].tolist()
+            for i, name in enumerate(numeric):
+                low, high = row[2 * i], row[2 * i + 1]
+                if low is not None and high is not None:
+                    extents[name] = (float(low), float(high))
+        return _sample_table(frame, extents)
+
+    def group_means(self, keys, value):
+        """Promedia una columna por grupo con `GROUP BY`.
+
+        Args:
+            keys (List[str]): Columnas de los grupos.
+            value (str): Columna numérica a promediar.
+
+        Returns:
+            ColumnTable: Una fila por grupo con las claves y el promedio.
+        """
+        groups = ", ".join(_quote(name) for name in keys)
+        frame = self._query(
+            f"SELECT {groups}, AVG({_quote(value)}) AS {_quote(value)} FROM {self._from()} GROUP BY {groups}"
+        )
+        return ColumnTable.from_frame(frame)
+
+    def distinct(self, name):
+        """Devuelve los valores distintos de una columna con `SELECT DISTINCT`.
+
+        Args:
+            name (str): Nombre de la columna.
+
+        Returns:
+            ColumnTable: Una fila por valor distinto.
+        """
+        return ColumnTable.from_frame(self._query(f"SELECT DISTINCT {_quote(name)} FROM {self._from()}"))
+
+    def bounds(self, name):
+        """Devuelve el mínimo y el máximo de una columna con `MIN`/`MAX`.
+
+        Args:
+            name (str): Nombre de la columna.
+
+        Returns:
+            ColumnTable: Dos filas con el mínimo y el máximo.
+        """
+        import pandas as pd
+
+        column = _quote(name)
+        row = self._query(f"SELECT MIN({column}), MAX({column}) FROM {self._from()}").iloc[0].tolist()
+        values = [] if row[0] is None else row
+        return ColumnTable.from_frame(pd.DataFrame({name: values}))
+
+
+class PolarsSource(DataSource):
+    """Consulta perezosa de Polars (`pl.LazyFrame`).
+
+    Cada reducción se agrega al plan perezoso (solo las columnas usadas,
+    filtros, `group_by`, `unique`, `min`/`max`) y se ejecuta con el motor
+    multihilo de Polars, que aplica las optimizaciones de proyección y de
+    predicados antes de leer los datos. Los resultados se guardan por
+    fuente, y `where` reutiliza la misma fuente filtrada para un mismo
+    predicado, de modo que los controles enlazados que vuelven a pedir una
+    reducción no vuelven a ejecutar la consulta.
+
+    Attributes:
+        frame (pl.LazyFrame): Plan perezoso de la fuente.
+    """
+
+    def __init__(self, frame):
+        """Crea la fuente.
+
+        Args:
+            frame (pl.LazyFrame | pl.DataFrame): Datos o plan de Polars.
+        """
+        self.frame = frame.lazy()
+        self._results = {}
+        # Pares (predicado, fuente filtrada), del menos al más usado.
+        self._filtered = []
+
+    def where(self, predicate):
+        """Devuelve la fuente filtrada por un predicado de Polars.
+
+        Args:
+            predicate (pl.Expr): Condición sobre las filas.
+
+        Returns:
+            PolarsSource: Fuente filtrada, la misma para predicados iguales.
+        """
+        # `str(predicate)` abrevia los literales largos, así que dos
+        # predicados distintos pueden verse iguales: se comparan con `meta.eq`.
+        for index, (cached, source) in enumerate(self._filtered):
+            if cached.meta.eq(predicate):
+                self._filtered.append(self._filtered.pop(index))
+                return source
+        source = PolarsSource(self.frame.filter(predicate))
+        self._filtered.append((predicate, source))
+        if len(self._filtered) > _POLARS_CACHE_SIZE:
+            self._filtered.pop(0)
+        return source
+
+    @property
+    def names(self):
+        """Lista de nombres de columnas del plan."""
+        return list(self._schema())
+
+    def _schema(self):
+        if hasattr(self.frame, "collect_schema"):
+            return self.frame.collect_schema()
+        return self.frame.schema
+
+    def _memoized(self, key, compute):
+        """Ejecuta una reducción una sola vez por fuente."""
+        if key in self._results:
+            self._results[key] = self._results.pop(key)
+        else:
+            self._results[key] = compute()
+            if len(self._results) > _POLARS_CACHE_SIZE:
+                del self._results[next(iter(self._results))]
+        return self._results[key]
+
+    def _batches(self, columns):
+        """Ejecuta el plan con las columnas pedidas y lo recorre por lotes."""
+        frame = self.frame.select(columns).collect()
+        for batch in frame.iter_slices(self.batch_size):
+            yield _polars_to_pandas(batch)
+
+    def sample(self, columns, size):
+        """Toma una muestra y la extensión de las columnas en una sola ejecución.
+
+        Args:
+            columns (List[str]): Columnas a incluir.
+            size (int): Cantidad máxima de filas.
+
+        Returns:
+            ColumnTable: Muestra de la fuente.
+        """
+        return self._memoized(("sample", tuple(columns), size), lambda: self._sample(columns, size))
+
+    def _sample(self, columns, size):
+        import polars as pl
+
+        schema = self._schema()
+        numeric = [name for name in columns if schema[name].is_numeric()]
+        rows = self.frame.select(columns).filter(pl.int_range(0, pl.len()).shuffle(seed=0) < size)
+        bounds = self.frame.select(
+            [pl.col(name).min().alias(f"min:{name}") for name in numeric]
+            + [pl.col(name).max().alias(f"max:{name}") for name in numeric]
+        )
+        sample, extent = pl.collect_all([rows, bounds])
+        extents = {}
+        for name in numeric:
+            low, high = extent[f"min:{name}"][0], extent[f"max:{name}"][0]
+            if low is not None and high is not None:
+                extents[name] = (float(low), float(high))
+        return _sample_table(_polars_to_pandas(sample), extents)
+
+    def group_means(self, keys, value):
+        """Promedia una columna por grupo con `group_by`.
+
+        Args:
+            keys (List[str]): Columnas de los grupos.
+            value (str): Columna numérica a promediar.
+
+        Returns:
+            ColumnTable: Una fila por grupo con las claves y el promedio.
+        """
+        import polars as pl
+
+        def compute():
+            frame = self.frame.group_by(keys).agg(pl.col(value).mean()).collect()
+            return ColumnTable.from_frame(_polars_to_pandas(frame))
+
+        return self._memoized(("group_means", tuple(keys), value), compute)
+
+    def distinct(self, name):
+        """Devuelve los valores distintos de una columna con `unique`.
+
+        Args:
+            name (str): Nombre de la columna.
+
+        Returns:
+            ColumnTable: Una fila por valor distinto.
+        """
+        import polars as pl
+
+        def compute():
+            frame = self.frame.select(pl.col(name).unique()).collect()
+            return ColumnTable.from_frame(_polars_to_pandas(frame))
+
+        return self._memoized(("distinct", name), compute)
+
+    def bounds(self, name):
+        """Devuelve el mínimo y el máximo de una columna.
+
+        Args:
+            name (str): Nombre de la columna.
+
+        Returns:
+            ColumnTable: Dos filas con el mínimo y el máximo.
+        """
+        import pandas as pd
+        import polars as pl
+
+        def compute():
+            row = self.frame.select(pl.col(name).min().alias("min"), pl.col(name).max().alias("max")).collect()
+            low, high = row["min"][0], row["max"][0]
+            values = [] if low is None else [low, high]
+            return ColumnTable.from_frame(pd.DataFrame({name: values}))
+
+        return self._memoized(("bounds", name), compute)
+
+
+def as_source(data):
+    """Convierte rutas de archivo y datos de Polars en fuentes.
+
+    Args:
+        data: Datos recibidos por un widget.
+
+    Returns:
+        DataSource | None: Fuente de datos, o None si `data` no es una
+            ruta, un `LazyFrame`/`DataFrame` de Polars ni una fuente.
+    """
+    if isinstance(data, DataSource):
+        return data
+    if type(data).__module__.startswith("polars") and hasattr(data, "lazy"):
+        return PolarsSource(data)
+    if isinstance(data, (str, os.PathLike)):
+        return ArrowFileSource(data)
+    return None
+
+
+def _import_pyarrow():
+    """Importa pyarrow o explica cómo instalarlo."""
+    try:
+        import pyarrow
+    except ImportError as error:
+        raise ImportError(
+            "Reading Parquet or Arrow files requires pyarrow: pip install vizproo[arrow]"
+        ) from error
+    return pyarrow
+
+
+def _polars_to_pandas(frame):
+    """Convierte un DataFrame de Polars a pandas columna por columna.
+
+    Evita `to_pandas`, que requiere pyarrow.
+    """
+    import pandas as pd
+
+    return pd.DataFrame({name: frame[name].to_numpy() for name in frame.columns})
+
+
+def _connector(path):
+    """Función que abre conexiones de solo lectura a una base local."""
+    if os.path.splitext(path)[1].lower() in _DUCKDB_SUFFIXES:
+        try:
+            import duckdb
+        except ImportError as error:
+            raise ImportError("Reading DuckDB files requires duckdb: pip install duckdb") from error
+        return lambda: duckdb.connect(path, read_only=True)
+
+    import sqlite3
+    from urllib.request import pathname2url
+
+    uri = f"file:{pathname2url(path)}?mode=ro"
+    return lambda: sqlite3.connect(uri, uri=True, check_same_thread=False)
+
+
+def _quote(name):
+    """Cita un identificador SQL."""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _sample_table(frame, extents):
+    """Construye la tabla de una muestra con la extensión de la fuente completa.
+
+    Args:
+        frame (pd.DataFrame): Filas muestreadas.
+        extents (dict[str, tuple[float, float]]): Extensión de cada columna
+            numérica calculada sobre todas las filas.
+
+    Returns:
+        ColumnTable: Tabla de la muestra.
+    """
+    table = ColumnTable.from_frame(frame)
+    for name, extent in extents.items():
+        # La extensión de la fuente completa reemplaza a la de la muestra.
+        table._stats[("extent", name)] = extent
+    return table
+
+
+def _update_extents(extents, frame):
+    """Combina la extensión de las columnas numéricas de un lote."""
+    for name in frame.columns:
+        extent = _column_extent(_compact_array(frame[name]))
+        if extent is None:
+            continue
+        if name in extents:
+            low, high = extents[name]
+            extent = (min(low, extent[0]), max(high, extent[1]))
+        extents[name] = extent
+
+
+def _means_table(total, keys, value):
+    """Arma la tabla de promedios a partir de sumas y cuentas por grupo.
+
+    Args:
+        total (pd.DataFrame | None): Columnas `sum` y `count` indexadas por
+            las claves de los grupos.
+        keys (List[str]): Columnas de los grupos.
+        value (str): Columna promediada.
+
+    Returns:
+        ColumnTable: Una fila por grupo con las claves y el promedio.
+    """
+    import pandas as pd
+
+    if total is None:
+        return ColumnTable.from_frame(pd.DataFrame(columns=[*keys, value]))
+    means = total["sum"] / total["count"].where(total["count"] > 0)
+    frame = means.rename(value).reset_index()
+    return ColumnTable.from_frame(frame[[*keys, value]])
@@ -0,0 +1,490 @@
+"""Exportación estática de gráficos a SVG y PNG sin navegador.
+
+Reproduce en Python el cálculo de layout del frontend (márgenes, escalas
+lineales y de bandas, ejes, proyecciones RadViz/Star Coordinates y paleta
+de colores) y escribe el SVG directamente a partir de las columnas NumPy
+de la `ColumnTable` del widget, sin construir DataFrames ni registros.
+"""
+
+from html import escape
+
+import numpy as np
+
+from .columns import _category_label, _nice_domain
+
+# Márgenes del gráfico (WIDGET_MARGIN en src/base/base.ts).
+_MARGIN = {"top": 20, "right": 20, "bottom": 30, "left": 20}
+
+# Paleta categórica usada por los gráficos (d3.schemeCategory10).
+_CATEGORY10 = (
+    "#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd",
+    "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf",
+)
+
+# Color de los puntos del scatter sin `hue` (DEFAULT_COLOR en scatterplot.ts).
+_DEFAULT_COLOR = "#4299e1"
+
+# Ancho aproximado de un carácter de los ticks (sans-serif de 10px).
+_CHAR_WIDTH = 6.0
+
+_AXIS_ATTRS = 'fill="none" font-size="10" font-family="sans-serif"'
+
+
+class _LinearScale:
+    """Escala lineal equivalente a `d3.scaleLinear`."""
+
+    def __init__(self, domain, range_, nice=True):
+        low, high = float(domain[0]), float(domain[1])
+        self.domain = _nice_domain(low, high) if nice else (low, high)
+        self.range = [float(range_[0]), float(range_[1])]
+
+    def __call__(self, values):
+        d0, d1 = self.domain
+        r0, r1 = self.range
+        values = np.asarray(values, dtype=np.float64)
+        if d1 == d0:
+            return np.full(values.shape, (r0 + r1) / 2)
+        return r0 + (values - d0) / (d1 - d0) * (r1 - r0)
+
+    def ticks(self, count=10):
+        """Valores de los ticks como `scale.ticks()` de d3."""
+        return _ticks(self.domain[0], self.domain[1], count)
+
+    def tick_labels(self, ticks, count=10):
+        """Textos de los ticks como `scale.tickFormat()` de d3."""
+        start, stop = self.domain
+        precision = 0
+        if stop != start:
+            precision = max(0, -int(np.floor(np.log10(_tick_step(start, stop, count)))))
+        return [f"{tick:,.{precision}f}".replace("-", "−") for tick in ticks]
+
+    def positions(self, ticks):
+        """Posición de cada tick."""
+        return self(ticks).tolist()
+
+
+class _BandScale:
+    """Escala de bandas equivalente a `d3.scaleBand` con `padding`."""
+
+    def __init__(self, values, range_, padding):
+        self.values = list(values)
+        self.range = [float(range_[0]), float(range_[1])]
+        self.padding = padding
+        self._index = {value: i for i, value in enumerate(self.values)}
+
+    def _layout(self):
+        n = len(self.values)
+        r0, r1 = self.range
+        reverse = r1 < r0
+        start, stop = (r1, r0) if reverse else (r0, r1)
+        step = (stop - start) / max(1, n - self.padding + self.padding * 2)
+        start += (stop - start - step * (n - self.padding)) * 0.5
+        positions = start + step * np.arange(n)
+        if reverse:
+            positions = positions[::-1]
+        return positions, step * (1 - self.padding)
+
+    @property
+    def bandwidth(self):
+        return self._layout()[1]
+
+    def __call__(self, values):
+        positions, _ = self._layout()
+        return np.array([positions[self._index[value]] for value in values], dtype=np.float64)
+
+    def ticks(self):
+        return self.values
+
+    def tick_labels(self, ticks):
+        return [str(tick) for tick in ticks]
+
+    def positions(self, ticks):
+        positions, bandwidth = self._layout()
+        return (positions + bandwidth / 2).tolist()
+
+
+def _tick_step(start, stop, count):
+    """Paso entre ticks de `d3.tickStep`."""
+    step = abs(stop - start) / max(0, count)
+    power = np.floor(np.log10(step))
+    error = step / 10 ** power
+    factor = 10 if error >= 50 ** 0.5 else 5 if error >= 10 ** 0.5 else 2 if error >= 2 ** 0.5 else 1
+    return factor * 10 ** power
+
+
+def _ticks(start, stop, count):
+    """Ticks equivalentes a `d3.ticks`."""
+    if stop == start:
+        return [start]
+    step = (stop - start) / count
+    power = np.floor(np.log10(step))
+    error = step / 10 ** power
+    factor = 10 if error >= 50 ** 0.5 else 5 if error >= 10 ** 0.5 else 2 if error >= 2 ** 0.5 else 1
+    if power < 0:
+        inc = 10 ** -power / factor
+        i1, i2 = round(start * inc), round(stop * inc)
+        if i1 / inc < start:
+            i1 += 1
+        if i2 / inc > stop:
+            i2 -= 1
+        return [(i1 + i) / inc for i in range(int(i2 - i1) + 1)]
+    inc = 10 ** power * factor
+    i1, i2 = round(start / inc), round(stop / inc)
+    if i1 * inc < start:
+        i1 += 1
+    if i2 * inc > stop:
+        i2 -= 1
+    return [(i1 + i) * inc for i in range(int(i2 - i1) + 1)]
+
+
+def _fmt(value):
+    """Formatea una coordenada con dos decimales como máximo."""
+    return f"{value:.2f}".rstrip("0").rstrip(".")
+
+
+def _numeric(array):
+    """Convierte una columna en float64, con NaN donde no hay número."""
+    import pandas as pd
+
+    if isinstance(array, np.ndarray) and array.dtype.kind in "iuf":
+        return array.astype(np.float64, copy=False)
+    if isinstance(array, np.ndarray) and array.dtype.kind in "bM":
+        return np.full(len(array), np.nan)
+    return pd.to_numeric(pd.Series(np.asarray(array, dtype=object)), errors="coerce").to_numpy(np.float64)
+
+
+def _labels(array):
+    """Texto de cada valor de una columna como `String(value)` en JavaScript."""
+    import pandas as pd
+
+    if isinstance(array, pd.Categorical):
+        labels = np.array([_category_label(value) for value in array.categories.tolist()] + ["null"], dtype=object)
+        return labels[array.codes]
+    return np.array([_category_label(value) for value in array.tolist()], dtype=object)
+
+
+def _first_rows(labels):
+    """Etiquetas distintas en orden de aparición y la primera fila de cada una.
+
+    Returns:
+        dict[str, int]: Primera fila por etiqueta, en orden de aparición.
+    """
+    uniques, first = np.unique(labels.astype(str), return_index=True)
+    order = np.argsort(first, kind="stable")
+    return dict(zip(uniques[order].tolist(), first[order].tolist()))
+
+
+def _color_indices(labels):
+    """Índice en la paleta de cada etiqueta, por orden de aparición."""
+    _, first, inverse = np.unique(labels.astype(str), return_index=True, return_inverse=True)
+    order = np.empty(len(first), dtype=np.int64)
+    order[np.argsort(first, kind="stable")] = np.arange(len(first))
+    return order[inverse] % len(_CATEGORY10)
+
+
+def _axes(x_scale, y_scale, x_label, y_label):
+    """Dibuja los ejes como `BasePlot.plotAxes` y ajusta el rango de X.
+
+    Args:
+        x_scale (_LinearScale | _BandScale): Escala del eje X; su rango se
+            desplaza según el ancho de los ticks del eje Y.
+        y_scale (_LinearScale | _BandScale): Escala del eje Y.
+        x_label (str): Etiqueta del eje X.
+        y_label (str): Etiqueta del eje Y.
+
+    Returns:
+        str: Marcado SVG de ambos ejes.
+    """
+    y_ticks = y_scale.ticks()
+    y_texts = y_scale.tick_labels(y_ticks)
+    x_scale.range[0] += max((len(text) * _CHAR_WIDTH for text in y_texts), default=0)
+    height = y_scale.range[0]
+
+    y_parts = [
+        f'<g class="y axis" {_AXIS_ATTRS} text-anchor="end" transform="translate({_fmt(x_scale.range[0])}, 0)">',
+        f'<path class="domain" stroke="currentColor" d="M-6,{_fmt(y_scale.range[0] + 0.5)}H0.5V{_fmt(y_scale.range[1] + 0.5)}H-6"></path>',
+    ]
+    for position, text in zip(y_scale.positions(y_ticks), y_texts):
+        y_parts.append(
+            f'<g class="tick" opacity="1" transform="translate(0,{_fmt(position + 0.5)})">'
+            f'<line stroke="currentColor" x2="-6"></line>'
+            f'<text fill="currentColor" x="-9" dy="0.32em">{escape(text)}</text></g>'
+        )
+    y_parts.append(
+        f'<text class="label" transform="rotate(-90)" y="6" dx="{_fmt(-y_scale.range[1])}" dy=".71em" '
+        f'style="text-anchor: end;" fill="black">{escape(y_label)}</text></g>'
+    )
+
+    x_ticks = x_scale.ticks()
+    x_parts = [
+        f'<g class="x axis" {_AXIS_ATTRS} text-anchor="middle" transform="translate(0, {_fmt(height)})">',
+        f'<path class="domain" stroke="currentColor" d="M{_fmt(x_scale.range[0] + 0.5)},6V0.5H{_fmt(x_scale.range[1] + 0.5)}V6"></path>',
+    ]
+    for position, text in zip(x_scale.positions(x_ticks), x_scale.tick_labels(x_ticks)):
+        x_parts.append(
+            f'<g class="tick" opacity="1" transform="translate({_fmt(position + 0.5)},0)">'
+            f'<line stroke="currentColor" y2="6"></line>'
+            f'<text fill="currentColor" y="9" dy="0.71em">{escape(text)}</text></g>'
+        )
+    x_parts.append(
+        f'<text class="label" x="{_fmt(x_scale.range[1])}" y="-6" '
+        f'style="text-anchor: end;" fill="black">{escape(x_label)}</text></g>'
+    )
+    return "".join(y_parts) + "".join(x_parts)
+
+
+def _scatter_body(widget, table, width, height):
+    """Contenido de un ScatterPlot (ver `ScatterPlot.plot` en el frontend)."""
+    if widget.x not in table or widget.y not in table:
+        return ""
+    xs = _numeric(table.column(widget.x))
+    ys = _numeric(table.column(widget.y))
+    valid = ~(np.isnan(xs) | np.isnan(ys))
+    xs, ys = xs[valid], ys[valid]
+    if not xs.size:
+        return ""
+
+    def extent(name, values):
+        domain = table.domain(name)
+        return domain["nice"] if domain else (values.min(), values.max())
+
+    inner_width = width - _MARGIN["left"] - _MARGIN["right"]
+    inner_height = height - _MARGIN["top"] - _MARGIN["bottom"]
+    x_scale = _LinearScale(extent(widget.x, xs), (0, inner_width))
+    y_scale = _LinearScale(extent(widget.y, ys), (inner_height, 0))
+    axes = _axes(x_scale, y_scale, widget.x, widget.y)
+
+    point_size = widget.pointSize
+    radius = np.full(xs.shape, point_size)
+    if widget.size and widget.size in table:
+        sizes = _numeric(table.column(widget.size))[valid]
+        has_size = ~np.isnan(sizes)
+        if has_size.any():
+            domain = table.extent(widget.size) or (sizes[has_size].min(), sizes[has_size].max())
+            size_scale = _LinearScale(domain, (point_size * 0.5, point_size * 2), nice=False)
+            radius[has_size] = size_scale(sizes[has_size])
+
+    if widget.hue and widget.hue in table:
+        palette = np.array(_CATEGORY10, dtype=object)
+        fills = palette[_color_indices(_labels(table.column(widget.hue))[valid])]
+    else:
+        fills = np.full(xs.shape, _DEFAULT_COLOR, dtype=object)
+
+    opacity = _fmt(widget.opacity)
+    dots = "".join(
+        f'<circle class="scatter_dot" cx="{cx:.2f}" cy="{cy:.2f}" r="{r:.2f}" fill="{fill}" fill-opacity="{opacity}"></circle>'
+        for cx, cy, r, fill in zip(x_scale(xs).tolist(), y_scale(ys).tolist(), radius.tolist(), fills.tolist())
+    )
+    return axes + dots
+
+
+def _bar_body(widget, table, width, height):
+    """Contenido de un BarPlot (ver `BarPlot.plot` en el frontend)."""
+    vertical = widget.direction == "vertical"
+    by, value = (widget.x, widget.y) if vertical else (widget.y, widget.x)
+    if by not in table or value not in table:
+        return ""
+    means = table.group_means(by, value)
+    if not means or not means[0]:
+        return ""
+    groups, averages = means
+    finite = [mean for mean in averages if np.isfinite(mean)] or [0.0]
+    low, high = min(finite), max(finite)
+    if low > 0 and high > 0:
+        low = 0.0
+    elif low < 0 and high < 0:
+        high = 0.0
+
+    inner_width = width - _MARGIN["left"] - _MARGIN["right"]
+    inner_height = height - _MARGIN["top"] - _MARGIN["bottom"]
+    if vertical:
+        band = x_scale = _BandScale(groups, (0, inner_width), 0.2)
+        side = y_scale = _LinearScale((low, high), (inner_height, 0))
+    else:
+        side = x_scale = _LinearScale((low, high), (0, inner_width))
+        band = y_scale = _BandScale(groups, (inner_height, 0), 0.2)
+    axes = _axes(x_scale, y_scale, widget.x if vertical else widget.y, widget.y if vertical else widget.x)
+
+    # Color por grupo (o por el `hue` de la primera fila del grupo) según
+    # el orden de aparición en los datos.
+    group_rows = _first_rows(_labels(table.column(by)))
+    if widget.hue and widget.hue in table:
+        hue_labels = _labels(table.column(widget.hue))
+        color_index = {key: i for i, key in enumerate(_first_rows(hue_labels))}
+        keys = [hue_labels[group_rows[group]] for group in groups]
+    else:
+        color_index = {key: i for i, key in enumerate(group_rows)}
+        keys = groups
+
+    base = band(groups)
+    bandwidth = band.bandwidth
+    side_values = side(np.nan_to_num(np.array(averages, dtype=np.float64)))
+    zero = float(side([0.0])[0])
+    rects = []
+    for position, side_value, key in zip(base.tolist(), side_values.tolist(), keys):
+        fill = _CATEGORY10[color_index.get(key, len(color_index)) % len(_CATEGORY10)]
+        start, length = min(side_value, zero), abs(zero - side_value)
+        if vertical:
+            attrs = f'x="{position:.2f}" y="{start:.2f}" width="{bandwidth:.2f}" height="{length:.2f}"'
+        else:
+            attrs = f'x="{start:.2f}" y="{position:.2f}" width="{length:.2f}" height="{bandwidth:.2f}"'
+        rects.append(f'<rect class="bar" {attrs} fill="{fill}"></rect>')
+    return axes + "".join(rects)
+
+
+def _normalized(table, dimensions):
+    """Normaliza cada dimensión a [0, 1] con la extensión de su columna."""
+    columns = []
+    for name in dimensions:
+        values = _numeric(table.column(name))
+        low, high = table.extent(name) or (np.nan, np.nan)
+        columns.append((values - low) / (high - low) if high != low else np.full(values.shape, 0.5))
+    return np.column_stack(columns)
+
+
+def _dial_colors(widget, table):
+    """Color de cada punto de RadViz / Star Coordinates."""
+    if widget.hue and widget.hue in table and len(table):
+        palette = np.array(_CATEGORY10, dtype=object)
+        return palette[_color_indices(_labels(table.column(widget.hue)))].tolist()
+    return ["#1f77b4"] * len(table)
+
+
+def _finite_points(xs, ys, fills):
+    """Descarta los puntos con coordenadas faltantes, como hace el scatter."""
+    valid = np.isfinite(xs) & np.isfinite(ys)
+    return xs[valid], ys[valid], np.array(fills, dtype=object)[valid]
+
+
+def _dial_layout(width, height):
+    """Ancho y alto internos del dial."""
+    return width - _MARGIN["left"] - _MARGIN["right"], height - _MARGIN["top"] - _MARGIN["bottom"]
+
+
+def _radviz_body(widget, table, width, height):
+    """Contenido de un RadViz (ver `RadViz.plot` en el frontend)."""
+    dimensions = [name for name in widget.dimensions if name in table]
+    chart_width, chart_height = _dial_layout(width, height)
+    radius = min(chart_width, chart_height) / 2 - 50
+    parts = [f'<g transform="translate({_fmt(chart_width / 2)}, {_fmt(chart_height / 2)})">']
+    if len(dimensions) >= 2:
+        angles = 2 * np.pi * np.arange(len(dimensions)) / len(dimensions)
+        cos, sin = np.cos(angles), np.sin(angles)
+        for label, x, y in zip(dimensions, cos.tolist(), sin.tolist()):
+            parts.append(
+                f'<text class="axis-label" x="{_fmt(x * (radius + 15))}" y="{_fmt(y * (radius + 15))}" '
+                f'text-anchor="middle" font-family="sans-serif" font-size="12" fill="black">{escape(label)}</text>'
+            )
+        for x, y in zip(cos.tolist(), sin.tolist()):
+            parts.append(f'<circle class="axis-point" cx="{_fmt(x * radius)}" cy="{_fmt(y * radius)}" r="6" fill="#f00a0aff"></circle>')
+        parts.append(f'<circle cx="0" cy="0" r="{_fmt(radius)}" fill="none" stroke="#ddd" stroke-width="1"></circle>')
+
+        weights = _normalized(table, dimensions)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            total = weights.sum(axis=1)
+            xs = weights @ cos / total * radius
+            ys = weights @ sin / total * radius
+        xs, ys, fills = _finite_points(xs, ys, _dial_colors(widget, table))
+        parts.extend(
+            f'<circle class="point" cx="{cx:.2f}" cy="{cy:.2f}" r="4" fill="{fill}" fill-opacity="0.7" stroke="#000" stroke-width="0.5"></circle>'
+            for cx, cy, fill in zip(xs.tolist(), ys.tolist(), fills.tolist())
+        )
+    parts.append("</g>")
+    return "".join(parts)
+
+
+def _starcoordinates_body(widget, table, width, height):
+    """Contenido de un Star Coordinates (ver `StarCoordinates.plot` en el frontend)."""
+    dimensions = [name for name in widget.dimensions if name in table]
+    chart_width, chart_height = _dial_layout(width, height)
+    side = min(chart_width, chart_height)
+    radius = max(50, side / 2 - max(40, min(100, side * 0.15)))
+    parts = [f'<g transform="translate({_fmt(chart_width / 2)}, {_fmt(chart_height / 2)})">']
+    if len(dimensions) >= 2:
+        angles = 2 * np.pi * np.arange(len(dimensions)) / len(dimensions)
+        cos, sin = np.cos(angles), np.sin(angles)
+        for label, x, y in zip(dimensions, cos.tolist(), sin.tolist()):
+            anchor = "start" if x > 0.1 else "end" if x < -0.1 else "middle"
+            baseline = "hanging" if y > 0.1 else "baseline" if y < -0.1 else "central"
+            parts.append(
+                f'<text class="anchor-label" x="{_fmt(x * radius + x * 25)}" y="{_fmt(y * radius + y * 25)}" '
+                f'text-anchor="{anchor}" dominant-baseline="{baseline}" '
+                f'style="font-size: 12px; font-weight: bold; fill: #333;">{escape(label)}</text>'
+            )
+        for x, y in zip(cos.tolist(), sin.tolist()):
+            parts.append(
+                f'<line class="axis-line" x1="0" y1="0" x2="{_fmt(x * radius)}" y2="{_fmt(y * radius)}" '
+                f'style="stroke: #999; stroke-width: 1; stroke-dasharray: 4 2;"></line>'
+            )
+        for x, y in zip(cos.tolist(), sin.tolist()):
+            parts.append(
+                f'<circle class="anchor-node" cx="{_fmt(x * radius)}" cy="{_fmt(y * radius)}" r="6" '
+                f'fill="#f00b0bff" stroke="white" stroke-width="2"></circle>'
+            )
+
+        weights = _normalized(table, dimensions)
+        xs = weights @ cos * radius
+        ys = weights @ sin * radius
+        xs, ys, fills = _finite_points(xs, ys, _dial_colors(widget, table))
+        parts.extend(
+            f'<circle class="point" cx="{cx:.2f}" cy="{cy:.2f}" r="4" fill="{fill}" fill-opacity="0.8" stroke="white" stroke-width="2"></circle>'
+            for cx, cy, fill in zip(xs.tolist(), ys.tolist(), fills.tolist())
+        )
+    parts.append("</g>")
+    return "".join(parts)
+
+
+# Función que dibuja el contenido de cada vista del frontend.
+_RENDERERS = {
+    "ScatterPlotView": _scatter_body,
+    "BarPlotView": _bar_body,
+    "RadVizView": _radviz_body,
+    "StarCoordinatesView": _starcoordinates_body,
+}
+
+
+def render_svg(widget, width=800, height=500):
+    """Dibuja un gráfico como SVG, con el mismo layout que el frontend.
+
+    Args:
+        widget (DataWidget): ScatterPlot, BarPlot, RadViz o StarCoordinates.
+        width (int, optional): Ancho en píxeles. Por defecto 800.
+        height (int, optional): Alto en píxeles. Por defecto 500.
+
+    Returns:
+        str: Documento SVG.
+
+    Raises:
+        TypeError: Si el widget no tiene exportación estática.
+    """
+    renderer = _RENDERERS.get(widget._view_name)
+    if renderer is None:
+        raise TypeError(f"{type(widget).__name__} does not support static export")
+    body = renderer(widget, widget._table, width, height)
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width - 2}" height="{height}" class="graph">'
+        f'<g transform="translate({_MARGIN["left"]},{_MARGIN["top"]})">{body}</g></svg>'
+    )
+
+
+def render_png(widget, width=800, height=500, scale=1.0):
+    """Dibuja un gráfico como PNG rasterizando su SVG con `cairosvg`.
+
+    Args:
+        widget (DataWidget): Gráfico a exportar.
+        width (int, optional): Ancho en píxeles. Por defecto 800.
+        height (int, optional): Alto en píxeles. Por defecto 500.
+        scale (float, optional): Factor de escala del raster. Por defecto 1.0.
+
+    Returns:
+        bytes: Imagen PNG.
+
+    Raises:
+        ImportError: Si `cairosvg` no está instalado.
+    """
+    try:
+        import cairosvg
+    except ImportError as error:
+        raise ImportError("PNG export requires cairosvg: pip install vizproo[png]") from error
+    svg = render_svg(widget, width, height)
+    return cairosvg.svg2png(bytestring=svg.encode("utf-8"), scale=scale)
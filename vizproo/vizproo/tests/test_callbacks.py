@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) MATIUS.
+# Distributed under the terms of the Modified BSD License.
+
+import asyncio
+import logging
+
+from ..widgets import Checkbox, RangeSlider
+
+
+def test_async_callbacks_cancel_stale_events():
+    started, finished, cancelled = [], [], []
+
+    async def on_drag(change):
+        started.append(change["new"])
+        try:
+            await asyncio.sleep(0.05)
+        except asyncio.CancelledError:
+            cancelled.append(change["new"])
+            raise
+        finished.append(change["new"])
+
+    async def main():
+        slider = RangeSlider(minValue=0, maxValue=10)
+        slider.on_drag(on_drag)
+        slider.toValue = 1
+        await asyncio.sleep(0)
+        slider.toValue = 2
+        await asyncio.sleep(0.1)
+
+    asyncio.run(main())
+    assert started == [1, 2]
+    assert cancelled == [1]
+    assert finished == [2]
+
+
+def test_async_callback_runs_without_event_loop():
+    seen = []
+
+    async def on_check(change):
+        await asyncio.sleep(0)
+        seen.append(change["new"])
+
+    checkbox = Checkbox()
+    checkbox.on_check(on_check)
+    checkbox.checked = True
+    assert seen == [True]
+
+
+def test_failing_async_callback_is_reported(caplog):
+    async def on_check(change):
+        raise ValueError("boom")
+
+    async def main():
+        checkbox = Checkbox()
+        checkbox.on_check(on_check)
+        checkbox.checked = True
+        await asyncio.sleep(0.01)
+
+    with caplog.at_level(logging.ERROR):
+        asyncio.run(main())
+    [record] = [r for r in caplog.records if "on_check" in r.getMessage()]
+    assert isinstance(record.exc_info[1], ValueError)
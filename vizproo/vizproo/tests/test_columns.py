@@ -0,0 +1,292 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) MATIUS.
+# Distributed under the terms of the Modified BSD License.
+
+import asyncio
+import gc
+import json
+import logging
+import queue
+import threading
+import tracemalloc
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from ipywidgets.widgets.widget import _put_buffers, _remove_buffers
+
+from .. import cache, columns
+from ..columns import ColumnTable, table_to_json
+from ..dataset import Dataset
+from ..graphs import BarPlot, ScatterPlot
+from ..widgets import Dropdown
+from ..settings import settings
+
+
+def _numeric_frame(rows=200_000, columns=5):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({f"c{i}": rng.random(rows) for i in range(columns)})
+
+
+def test_column_table_roundtrip():
+    df = pd.DataFrame({
+        "x": [1.5, 2.5, np.nan],
+        "n": [1, 2, 3],
+        "flag": [True, False, True],
+        "label": ["a", None, "c"],
+    })
+    table = ColumnTable.from_frame(df)
+    assert table.names == ["x", "n", "flag", "label"]
+    assert len(table) == 3
+    pd.testing.assert_frame_equal(table.to_frame(), df)
+
+
+def test_numeric_columns_are_sent_as_buffers():
+    table = ColumnTable.from_frame(_numeric_frame(rows=10, columns=2))
+    state = table_to_json(table, None)
+    assert state["length"] == 10
+    assert all(isinstance(c["data"], memoryview) for c in state["columns"])
+
+
+def test_mixed_frame_encoding_is_compact():
+    rng = np.random.default_rng(0)
+    rows = 10_000
+    df = pd.DataFrame({
+        "length": np.round(rng.normal(5, 1, rows), 1),
+        "price": np.round(rng.random(rows) * 100, 2),
+        "count": rng.integers(0, 500, rows),
+        "species": pd.Categorical(rng.choice(["setosa", "versicolor", "virginica"], rows)),
+        "city": rng.choice(["Lima", "Cusco", "Arequipa", None], rows),
+        "when": pd.date_range("2020-01-01", periods=rows, freq="h"),
+        "score": pd.array(np.where(rng.random(rows) < 0.1, None, rng.integers(0, 10, rows)), dtype="Int64"),
+    })
+    state = table_to_json(ColumnTable.from_frame(df), None)
+    columns = {c["name"]: c for c in state["columns"]}
+    assert columns["length"]["dtype"] == "float32"
+    assert columns["count"]["dtype"] == "int16"
+    assert columns["species"]["kind"] == "dictionary"
+    assert columns["species"]["dictionary"] == ["setosa", "versicolor", "virginica"]
+    assert columns["city"]["kind"] == "dictionary" and "validity" in columns["city"]
+    assert columns["when"]["kind"] == "datetime"
+    assert columns["score"]["dtype"] == "int8" and "validity" in columns["score"]
+
+    stripped, _, buffers = _remove_buffers(state)
+    size = len(json.dumps(stripped)) + sum(buffer.nbytes for buffer in buffers)
+    assert size * 5 <= len(df.to_json(orient="records"))
+
+
+def test_float32_values_round_trip_through_the_frontend():
+    # El frontend restaura los float32 redondeando a 6 cifras significativas.
+    for value in (0.00097736, 9.791109e-07, 8664939000.0, 12.34):
+        column = table_to_json(ColumnTable.from_frame(pd.DataFrame({"v": [0.5, value]})), None)["columns"][0]
+        sent = float(np.frombuffer(column["data"], dtype=column["dtype"])[1])
+        restored = float(f"{sent:.5e}") if column["dtype"] == "float32" else sent
+        assert restored == value
+
+
+def test_widget_memory_overhead_close_to_column_bytes():
+    df = _numeric_frame()
+    raw_bytes = sum(df[c].to_numpy().nbytes for c in df.columns)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        plot = ScatterPlot(df, x="c0", y="c1")
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert plot.dataColumns.nbytes == raw_bytes
+    # La tabla columnar es la única copia retenida por el widget.
+    assert retained < raw_bytes * 1.2
+
+
+def test_only_used_columns_are_synced():
+    df = pd.DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0], "c": [5.0, 6.0], "d": ["u", "v"]})
+    plot = ScatterPlot(df, x="a", y="b", tooltip_columns=["d"])
+    state = plot.get_state("dataColumns")["dataColumns"]
+    assert [c["name"] for c in state["columns"]] == ["a", "b", "d"]
+
+    sent = []
+    plot.send = lambda content, buffers=None: sent.append((content, buffers))
+    plot.x = "c"
+    assert [c["name"] for c in sent[0][0]["columns"]] == ["c"]
+    assert sent[0][0]["buffer_paths"] == [["columns", 0, "data"]]
+    plot.x = "a"
+    assert len(sent) == 1
+
+
+def test_compression_above_threshold_reports_stats(monkeypatch):
+    monkeypatch.setattr(settings, "compression_threshold", 1000)
+    df = pd.DataFrame({"a": np.arange(10_000) % 7 * 0.5, "b": np.zeros(10)[np.arange(10_000) % 10]})
+
+    plot = ScatterPlot(df, x="a", y="b", compression=True)
+    columns = plot.get_state("dataColumns")["dataColumns"]["columns"]
+    assert all(c["compression"] == "deflate" for c in columns)
+    decoded = np.frombuffer(zlib.decompress(columns[0]["data"]), dtype=columns[0]["dtype"])
+    np.testing.assert_array_equal(decoded, df["a"].to_numpy(dtype=decoded.dtype))
+    assert plot.stats["compression_ratio"] > 1
+    assert plot.stats["sent_bytes"] < plot.stats["raw_bytes"]
+
+    plain = ScatterPlot(df, x="a", y="b")
+    plain.get_state("dataColumns")
+    assert plain.stats["compression_ratio"] == 1.0
+
+
+def test_column_stats_are_computed_once_per_dataset(monkeypatch):
+    df = pd.DataFrame({
+        "g": ["b", "a", None, "b"],
+        "v": [1.0, 3.0, np.nan, 5.0],
+    })
+    table = ColumnTable.from_frame(df)
+    assert table.value_counts("g") == (["a", "b"], [1, 2])
+    assert table.null_count("g") == 1 and table.null_count("v") == 1
+    assert table.extent("v") == (1.0, 5.0)
+    assert sum(table.histogram("v", bins=2)["counts"]) == 3
+
+    calls = []
+    original = columns._value_counts
+    monkeypatch.setattr(columns, "_value_counts", lambda array: calls.append(1) or original(array))
+    dataset = Dataset(df)
+    first = Dropdown(dataset, variable="g")
+    second = Dropdown(dataset, variable="g")
+    assert first.dataOptions == second.dataOptions == ["a", "b"]
+    assert len(calls) == 1
+
+    bars = BarPlot(dataset, x="g", y="v")
+    assert bars.groupDomain == ["a", "b", "null"]
+    assert bars.valueDomain == [3.0, 3.0]
+
+
+def test_group_means_skip_missing_values():
+    df = pd.DataFrame({"g": ["a", "a", "b", "c"], "v": [-5.0, np.nan, 10.0, np.nan]})
+    labels, means = ColumnTable.from_frame(df).group_means("g", "v")
+    assert labels == ["a", "b", "c"]
+    assert means[:2] == [-5.0, 10.0] and np.isnan(means[2])
+
+    bars = BarPlot(df, x="g", y="v")
+    assert bars.valueDomain == [-5.0, 10.0]
+
+
+def test_parallel_encoding_sends_columns_when_ready(monkeypatch):
+    sent = queue.Queue()
+    monkeypatch.setattr(settings, "parallel_encoding", True)
+    monkeypatch.setattr(ScatterPlot, "send", lambda self, content, buffers=None: sent.put((self, content)))
+    df = _numeric_frame(rows=1000, columns=3)
+
+    plots = [ScatterPlot(df, x="c0", y="c1") for _ in range(4)]
+    messages = dict(sent.get(timeout=10) for _ in plots)
+    assert set(messages) == set(plots)
+    for message in messages.values():
+        assert message["event"] == "add_columns"
+        assert [column["name"] for column in message["columns"]] == ["c0", "c1"]
+    assert plots[0].stats["raw_bytes"] > 0
+    # Leer el estado fuera del comm (embed, get_state) codifica la tabla completa
+    state = plots[0].get_state("dataColumns")["dataColumns"]
+    assert [column["name"] for column in state["columns"]] == ["c0", "c1"]
+
+
+def test_background_columns_are_sent_from_the_event_loop(monkeypatch, caplog):
+    sent = []
+    monkeypatch.setattr(settings, "parallel_encoding", True)
+    monkeypatch.setattr(ScatterPlot, "send", lambda self, content, buffers=None: sent.append(
+        (threading.current_thread(), content)
+    ))
+    original = columns._encode_payload
+
+    def encode_payload(*args):
+        # Falla en el pool para forzar la codificación de respaldo
+        if threading.current_thread() is not threading.main_thread():
+            raise MemoryError("no memory left")
+        return original(*args)
+
+    monkeypatch.setattr(columns, "_encode_payload", encode_payload)
+    df = _numeric_frame(rows=1000, columns=3)
+
+    async def main():
+        plot = ScatterPlot(df, x="c0", y="c1")
+        while not sent:
+            await asyncio.sleep(0.01)
+        return plot
+
+    with caplog.at_level(logging.ERROR, logger="vizproo.columns"):
+        asyncio.run(asyncio.wait_for(main(), 10))
+    [(thread, message)] = sent
+    assert thread is threading.main_thread()
+    assert [column["name"] for column in message["columns"]] == ["c0", "c1"]
+    assert "Background encoding failed" in caplog.text
+
+
+def test_reassigned_data_sends_only_changes(monkeypatch):
+    messages, states = [], []
+    def send(self, content, buffers=None):
+        _put_buffers(content, content["buffer_paths"], buffers)
+        messages.append(content)
+
+    monkeypatch.setattr(ScatterPlot, "send", send)
+    monkeypatch.setattr(ScatterPlot, "send_state", lambda self, key=None: states.append(key))
+    df = _numeric_frame(rows=1000, columns=3)
+    plot = ScatterPlot(df, x="c0", y="c1")
+    plot.get_state("dataColumns")
+    table = plot.dataColumns
+
+    plot.data = df.copy()
+    assert plot.dataColumns is table and not messages and not states
+
+    edited = df.copy()
+    edited.loc[7, "c0"] = 2.5
+    edited["c1"] = edited["c1"] + 1
+    edited.loc[3, "c2"] = -1.0
+    plot.data = edited
+    assert "dataColumns" not in states
+    [message] = messages
+    assert message["event"] == "patch_columns"
+    patches = {column["name"]: column for column in message["columns"]}
+    assert set(patches) == {"c0", "c1"}
+    assert np.frombuffer(patches["c0"]["rows"], dtype=np.uint32).tolist() == [7]
+    assert "rows" not in patches["c1"]
+    assert plot.data.equals(edited)
+    assert plot.domains["c0"]["max"] == 2.5
+
+
+def test_disk_cache_reuses_encoded_columns_and_stats(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "cache", True)
+    monkeypatch.setattr(settings, "cache_dir", str(tmp_path))
+    df = pd.DataFrame({"g": ["a", "b", None, "a"] * 500, "v": np.arange(2000) / 7})
+    first = BarPlot(df, x="g", y="v").get_state("dataColumns")
+
+    calls = []
+    for name in ("_column_to_json", "_column_domain", "_group_means"):
+        original = getattr(columns, name)
+        monkeypatch.setattr(columns, name, lambda *args, original=original: calls.append(1) or original(*args))
+    plot = BarPlot(df.copy(), x="g", y="v")
+    second = plot.get_state("dataColumns")
+    assert not calls
+    assert plot.groupDomain == ["a", "b", "null"]
+    assert json.dumps(_remove_buffers(first)[0]) == json.dumps(_remove_buffers(second)[0])
+    assert [bytes(b) for b in _remove_buffers(first)[2]] == [bytes(b) for b in _remove_buffers(second)[2]]
+
+    monkeypatch.setattr(settings, "cache_max_bytes", 0)
+    cache.store_stat(cache.entry_key("x"), 1)
+    assert not list(tmp_path.iterdir())
+
+
+def test_disk_cache_scans_only_when_over_the_limit(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "cache_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "cache_max_bytes", 1000)
+    scans = []
+    entries = cache._entries
+    monkeypatch.setattr(cache, "_entries", lambda: scans.append(1) or entries())
+
+    for i in range(50):
+        cache.store_stat(cache.entry_key(i), i)
+    assert len(scans) == 1
+
+    for i in range(50, 500):
+        cache.store_stat(cache.entry_key(i), i)
+    assert 1 < len(scans) < 100
+    assert sum(path.stat().st_size for path in tmp_path.iterdir()) <= 1000
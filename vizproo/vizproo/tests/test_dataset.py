@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) MATIUS.
+# Distributed under the terms of the Modified BSD License.
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ..dataset import Dataset
+from ..graphs import RadViz, ScatterPlot
+
+
+def test_for_frame_returns_shared_dataset():
+    df = pd.DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0], "c": ["x", "y"]})
+    assert Dataset.for_frame(df) is Dataset.for_frame(df)
+    assert Dataset.for_frame(df.copy()) is not Dataset.for_frame(df)
+
+
+def test_charts_reference_dataset_instead_of_copying():
+    df = pd.DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0], "c": ["x", "y"]})
+    dataset = Dataset(df)
+    scatter = ScatterPlot(dataset, x="a", y="b")
+    radviz = RadViz(dataset, dimensions=["a", "b"], hue="c")
+
+    for chart in (scatter, radviz):
+        assert chart.dataset is dataset
+        assert len(chart.dataColumns) == 0
+        assert chart.get_state()["dataset"] == "IPY_MODEL_" + dataset.model_id
+        pd.testing.assert_frame_equal(chart.data, df)
+
+
+def test_dataset_syncs_union_of_consumer_columns():
+    df = pd.DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0], "c": ["x", "y"], "d": [0, 1]})
+    dataset = Dataset(df)
+    ScatterPlot(dataset, x="a", y="b")
+    RadViz(dataset, dimensions=["a"], hue="c")
+    state = dataset.get_state("dataColumns")["dataColumns"]
+    assert [c["name"] for c in state["columns"]] == ["a", "b", "c"]
+
+
+def test_charts_start_with_empty_selection():
+    df = pd.DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0]})
+    scatter = ScatterPlot(df, x="a", y="b")
+    assert scatter.selectedValuesRecords == []
+    assert scatter.selectedValues.empty
+
+
+def test_linked_charts_share_precomputed_domains():
+    df = pd.DataFrame({"a": [0.3, 9.6, 4.0], "b": [1.0, 2.0, 3.0], "c": ["x", "y", "z"]})
+    dataset = Dataset(df)
+    scatter = ScatterPlot(dataset, x="a", y="b")
+    radviz = RadViz(dataset, dimensions=["a", "b"], hue="c")
+
+    assert set(dataset.domains) == {"a", "b"}
+    assert dataset.domains["a"]["nice"] == [0, 10]
+    assert dataset.domains["a"]["min"] == 0.3 and dataset.domains["a"]["max"] == 9.6
+    assert len(dataset.domains["b"]["quantiles"]) == 5
+    assert scatter.domains == radviz.domains == {}
+
+
+def test_published_dataset_is_memory_mapped(tmp_path):
+    df = pd.DataFrame({
+        "x": np.arange(1000) / 3,
+        "n": np.arange(1000),
+        "s": ["a", "b", None, "c"] * 250,
+        "t": pd.date_range("2024-01-01", periods=1000, freq="h"),
+    })
+    Dataset.publish(df, "reference", directory=tmp_path)
+    dataset = Dataset.attach("reference", directory=tmp_path)
+
+    table = dataset.dataColumns
+    assert isinstance(table.column("x"), np.memmap)
+    assert isinstance(table.column("t"), np.memmap)
+    data = dataset.data
+    pd.testing.assert_frame_equal(data.drop(columns="s"), df.drop(columns="s"))
+    assert data["s"].astype(object).fillna("-").tolist() == df["s"].fillna("-").tolist()
+
+    plot = ScatterPlot(dataset, x="x", y="n")
+    assert plot.dataset is dataset and dataset.domains["n"]["max"] == 999
+    assert Dataset.attach("reference", directory=tmp_path).dataColumns.fingerprint("x") == table.fingerprint("x")
+
+
+def test_publish_rejects_columns_that_need_pickle(tmp_path):
+    df = pd.DataFrame({"x": [1.0, 2.0], "o": [{"a": 1}, {"b": 2}]})
+    with pytest.raises(TypeError, match="cannot be shared"):
+        Dataset.publish(df, "objects", directory=tmp_path)
+    assert not [entry for entry in os.listdir(tmp_path) if entry.startswith(".objects-")]
+
+    Dataset.publish(df[["x"]], "numbers", directory=tmp_path)
+    [target] = [entry for entry in os.listdir(tmp_path) if entry.startswith("numbers-")]
+    # Un archivo con objetos puesto en el directorio compartido no se carga
+    np.save(os.path.join(tmp_path, target, "0.npy"), np.array([{"a": 1}, None], dtype=object), allow_pickle=True)
+    with pytest.raises(ValueError):
+        Dataset.attach("numbers", directory=tmp_path)
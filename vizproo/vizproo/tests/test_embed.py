@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) MATIUS.
+# Distributed under the terms of the Modified BSD License.
+
+import json
+import re
+
+import numpy as np
+import pandas as pd
+
+from ..graphs import BarPlot, ScatterPlot
+from ..layouts import MatrixLayout
+
+
+def _page(path):
+    html = path.read_text(encoding="utf-8")
+    return json.loads(re.search(r'id="vizproo-state">\n(.*)\n</script>', html).group(1))
+
+
+def test_dashboard_html_embeds_each_dataset_once(tmp_path):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"a": rng.random(20_000), "b": rng.random(20_000), "c": rng.choice(["x", "y"], 20_000)})
+    layout = MatrixLayout([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+    charts = [ScatterPlot(df.copy(), x="a", y="b") if i % 2 else BarPlot(df, x="c", y="a") for i in range(1, 10)]
+    for position, chart in enumerate(charts, start=1):
+        layout.add(chart, position)
+
+    path = layout.to_html(tmp_path / "dashboard.html")
+    page = _page(path)
+    models = page["state"]["state"]
+
+    datasets = [model_id for model_id, model in models.items() if model["model_name"] == "DatasetModel"]
+    assert len(datasets) == 1
+    dataset = models[datasets[0]]
+    assert [c["name"] for c in dataset["state"]["dataColumns"]["columns"]] == ["a", "b", "c"]
+    assert all(buffer["encoding"] == "base64" for buffer in dataset["buffers"])
+    for chart in charts:
+        state = models[chart.model_id]["state"]
+        assert state["dataset"] == "IPY_MODEL_" + datasets[0]
+        assert state["dataColumns"]["columns"] == []
+        assert page["areas"][chart.elementId] == chart.model_id
+    assert page["root"] == layout.model_id
+    assert path.stat().st_size < 20_000 * 8 * 3
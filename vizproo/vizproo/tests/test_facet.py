@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) MATIUS.
+# Distributed under the terms of the Modified BSD License.
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ..dataset import Dataset
+from ..graphs import BarPlot, FacetGrid, RadViz, ScatterPlot, facet
+
+
+def _grouped_frame(rows=50_000, groups=200):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "g": rng.integers(0, groups, rows),
+        "a": rng.random(rows),
+        "b": rng.random(rows),
+        "unused": rng.random(rows),
+    })
+
+
+def test_facet_groups_once_into_contiguous_panels():
+    df = _grouped_frame()
+    grid = facet(df, by="g", x="a", y="b")
+
+    assert isinstance(grid, FacetGrid)
+    assert len(grid.facetLabels) == 200
+    assert grid.facetOffsets[0] == 0 and grid.facetOffsets[-1] == len(df)
+    ordered = grid.data
+    for p in (0, 57, 199):
+        panel = ordered.iloc[grid.facetOffsets[p]:grid.facetOffsets[p + 1]]
+        assert (panel["g"].astype(str) == grid.facetLabels[p]).all()
+
+    state = grid.get_state("dataColumns")["dataColumns"]
+    assert [c["name"] for c in state["columns"]] == ["g", "a", "b"]
+
+
+def test_facet_keeps_rows_without_a_facet_value():
+    df = pd.DataFrame({"g": ["a", None, "b", "a"], "a": [1.0, 2.0, 3.0, 4.0], "b": [4.0, 3.0, 2.0, 1.0]})
+    grid = facet(df, by="g", x="a", y="b")
+
+    assert grid.facetLabels == ["a", "b", "null"]
+    assert grid.facetOffsets == [0, 2, 3, 4]
+    assert grid.data["a"].tolist() == [1.0, 4.0, 3.0, 2.0]
+
+
+def test_facet_costs_about_one_chart():
+    df = _grouped_frame()
+    ScatterPlot(df, x="a", y="b").get_state()
+    facet(df, by="g", x="a", y="b").get_state()
+
+    start = time.perf_counter()
+    ScatterPlot(df, x="a", y="b").get_state()
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    facet(df, by="g", chart=BarPlot, x="a", y="b").get_state()
+    grid = time.perf_counter() - start
+
+    assert grid < single * 3 + 0.05
+
+
+def test_facet_rejects_unsupported_charts():
+    with pytest.raises(ValueError):
+        facet(_grouped_frame(rows=10), by="g", chart=RadViz)
+
+
+def test_facet_regroups_when_the_facet_column_changes():
+    df = pd.DataFrame(
+        {"g": ["a", "b", "a"], "h": [2, 1, 1], "a": [1.0, 2.0, 3.0]}, index=[10, 20, 30]
+    )
+    grid = facet(df, by="g", x="a", y="a")
+    grid.facet = "h"
+
+    assert grid.facetLabels == ["1", "2"]
+    assert grid.facetOffsets == [0, 2, 3]
+    assert grid.data["a"].tolist() == [2.0, 3.0, 1.0]
+    assert grid._index.tolist() == [20, 30, 10]
+
+    grid.facet = "g"
+    assert grid.facetLabels == ["a", "b"]
+    assert grid.data["a"].tolist() == [1.0, 3.0, 2.0]
+
+
+def test_facet_rejects_shared_datasets_and_sources(tmp_path):
+    df = pd.DataFrame({"g": ["a", "b"], "a": [1.0, 2.0]})
+    with pytest.raises(TypeError, match="Dataset"):
+        facet(Dataset(df), by="g", x="a", y="a")
+    with pytest.raises(TypeError, match="DataFrame"):
+        facet(str(tmp_path / "data.parquet"), by="g", x="a", y="a")
+    grid = facet(df, by="g", x="a", y="a")
+    with pytest.raises(TypeError, match="Dataset"):
+        grid.data = Dataset(df)
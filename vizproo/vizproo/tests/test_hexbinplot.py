@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) MATIUS.
+# Distributed under the terms of the Modified BSD License.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ..binning import hex_radius, hexbin
+from ..graphs import HexbinPlot
+from ..sources import DataSource
+
+
+def _cloud(rows=200_000):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "a": rng.standard_normal(rows),
+        "b": rng.standard_normal(rows),
+        "label": rng.choice(["p", "q", "r"], rows),
+    })
+
+
+def test_hexbin_assigns_each_point_to_the_nearest_center():
+    rng = np.random.default_rng(1)
+    x, y = rng.random(5_000) * 10, rng.random(5_000) * 4
+    bins, center_x, center_y, counts = hexbin(x, y, (0, 10), (0, 4), 20, 0.5)
+
+    assert (bins >= 0).all() and counts.sum() == len(x)
+    # Distancias en el espacio de la pantalla (ancho 1, alto 0.5)
+    u, v = x / 10, y / 4 * 0.5
+    cu, cv = center_x / 10, center_y / 4 * 0.5
+    distances = (u[:, None] - cu[None]) ** 2 + (v[:, None] - cv[None]) ** 2
+    assert (distances.argmin(axis=1) == bins).all()
+    assert np.sqrt(distances.min(axis=1)).max() <= hex_radius(20) + 1e-12
+
+
+def test_hexbin_plot_ships_only_the_bins():
+    df = _cloud()
+    plot = HexbinPlot(df, x="a", y="b", grid_size=30)
+
+    state = plot.get_state("dataColumns")["dataColumns"]
+    assert [c["name"] for c in state["columns"]] == ["x", "y", "count"]
+    assert state["length"] < 2_000
+    assert plot.dataColumns.column("count").sum() == len(df)
+    assert plot.xDomain == plot._full.domain("a")["nice"]
+
+    plot.aspect = 1.0
+    assert plot.dataColumns.column("count").sum() == len(df)
+
+
+def test_selected_bins_map_back_to_member_rows():
+    df = _cloud()
+    df.index = df.index * 10 + 7
+    plot = HexbinPlot(df, x="a", y="b")
+    counts = plot.dataColumns.column("count")
+    plot.selectedBins = [0, 7, len(counts) - 1]
+
+    rows = plot.selectedRows
+    assert len(rows) == counts[[0, 7, len(counts) - 1]].sum()
+    assert set(plot._bins[rows]) == {0, 7, len(counts) - 1}
+    selected = plot.selectedValues
+    assert list(selected.columns) == ["a", "b", "label"]
+    pd.testing.assert_frame_equal(selected, df.iloc[rows], check_dtype=False)
+
+
+class _BatchSource(DataSource):
+    """Fuente en memoria que entrega el DataFrame por lotes."""
+
+    batch_size = 10_000
+
+    def __init__(self, frame):
+        self.frame = frame
+
+    @property
+    def names(self):
+        return list(self.frame.columns)
+
+    def _batches(self, columns):
+        for start in range(0, len(self.frame), self.batch_size):
+            yield self.frame.iloc[start:start + self.batch_size][columns]
+
+
+def test_selected_values_read_only_the_selected_rows_of_a_source(monkeypatch):
+    df = _cloud()
+    source = _BatchSource(df)
+    plot = HexbinPlot(source, x="a", y="b")
+    plot.selectedBins = [0, 5]
+
+    monkeypatch.setattr(source, "read", lambda columns: pytest.fail("read the whole source"))
+    rows = plot.selectedRows
+    assert len(rows) > 0
+    pd.testing.assert_frame_equal(plot.selectedValues, df.iloc[rows], check_dtype=False)
+
+
+def test_hexbin_plot_rejects_text_columns():
+    with pytest.raises(TypeError, match="must be numeric"):
+        HexbinPlot(_cloud(100), x="a", y="label")
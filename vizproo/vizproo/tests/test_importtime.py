@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) MATIUS.
+# Distributed under the terms of the Modified BSD License.
+
+import os
+import subprocess
+import sys
+
+# Raíz del paquete bajo prueba, para no medir otra copia instalada.
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _imported_modules(code):
+    """Ejecuta `code` con `-X importtime` y devuelve los módulos importados."""
+    path = os.environ.get("PYTHONPATH")
+    env = {**os.environ, "PYTHONPATH": _PACKAGE_ROOT + (os.pathsep + path if path else "")}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, check=True, cwd=_PACKAGE_ROOT, env=env,
+    )
+    modules = set()
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            modules.add(line.rsplit("|", 1)[1].strip())
+    return modules
+
+
+def test_import_does_not_load_heavy_dependencies():
+    modules = _imported_modules("import vizproo")
+    for heavy in ("pandas", "numpy", "anywidget", "urllib3", "vizproo.widgets"):
+        assert heavy not in modules
+
+
+def test_importing_a_chart_does_not_load_pandas():
+    modules = _imported_modules("from vizproo import ScatterPlot")
+    assert "vizproo.graphs_.scatterplot" in modules
+    for heavy in ("pandas", "anywidget", "urllib3"):
+        assert heavy not in modules
+
+
+def test_controls_without_data_do_not_load_pandas():
+    modules = _imported_modules(
+        "from vizproo import Dropdown, RangeSlider; Dropdown(options=['a']); RangeSlider()"
+    )
+    assert "pandas" not in modules
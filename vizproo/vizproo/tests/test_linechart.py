@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) MATIUS.
+# Distributed under the terms of the Modified BSD License.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ..downsample import lttb, m4
+from ..graphs import LineChart
+
+
+def _series(rows=1_000_000):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "t": np.arange(rows, dtype=np.float64),
+        "v": np.cumsum(rng.standard_normal(rows)),
+    })
+
+
+def test_m4_keeps_first_last_min_and_max_of_each_pixel():
+    df = _series(10_000)
+    x, y = df["t"].to_numpy(), df["v"].to_numpy()
+    kept = m4(x, y, 0, 9_999, 50)
+
+    assert len(kept) <= 4 * 50
+    assert (np.diff(kept) > 0).all()
+    column = np.minimum((x * 50 / 9_999).astype(int), 49)
+    for pixel in (0, 17, 49):
+        rows = np.flatnonzero(column == pixel)
+        values = y[np.intersect1d(kept, rows)]
+        assert values.min() == y[rows].min() and values.max() == y[rows].max()
+        assert rows[0] in kept and rows[-1] in kept
+
+
+def test_lttb_keeps_endpoints_and_four_points_per_pixel():
+    df = _series(10_000)
+    kept = lttb(df["t"].to_numpy(), df["v"].to_numpy(), 0, 9_999, 50)
+
+    assert len(kept) == 4 * 50
+    assert kept[0] == 0 and kept[-1] == 9_999
+    assert (np.diff(kept) > 0).all()
+
+
+def test_line_chart_sends_only_the_reduced_window():
+    df = _series()
+    chart = LineChart(df, x="t", y="v", pixels=500)
+
+    state = chart.get_state("dataColumns")["dataColumns"]
+    assert state["length"] <= 4 * 500
+    assert chart.xDomain == [0.0, len(df) - 1.0]
+    assert chart.yDomain == [df["v"].min(), df["v"].max()]
+    assert len(chart.data) == len(df)
+
+    chart.xWindow = [1_000.0, 1_100.0]
+    window = chart.dataColumns.column("t")
+    assert window[0] == 999 and window[-1] == 1_101
+    assert len(window) == 103
+
+    chart.method = "lttb"
+    chart.xWindow = [0.0, 500_000.0]
+    assert len(chart.dataColumns) <= 4 * 500 + 2
+
+
+def test_line_chart_sorts_dates_and_drops_missing_values():
+    times = pd.date_range("2024-01-01", periods=1_000, freq="min")
+    df = pd.DataFrame({"when": times[::-1], "v": np.arange(1_000, dtype=float)})
+    df.loc[3, "v"] = np.nan
+    chart = LineChart(df, x="when", y="v", pixels=10)
+
+    when = chart.dataColumns.column("when")
+    assert when.dtype.kind == "M"
+    assert (np.diff(when.astype("int64")) > 0).all()
+    assert not np.isnan(chart.dataColumns.column("v")).any()
+    assert chart.xDomain[0] == times[0].value // 1_000_000
+
+
+def test_line_chart_rejects_unknown_methods_and_text_columns():
+    with pytest.raises(Exception, match="Unknown downsampling method"):
+        LineChart(_series(10), x="t", y="v", method="mean")
+    with pytest.raises(TypeError, match="numeric or datetime"):
+        LineChart(pd.DataFrame({"t": [1, 2], "v": ["a", "b"]}), x="t", y="v")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) MATIUS.
+# Distributed under the terms of the Modified BSD License.
+
+import numpy as np
+import pandas as pd
+
+from ..graphs import ScatterMatrix
+
+
+def _frame(rows=1_000):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "a": rng.standard_normal(rows),
+        "b": rng.random(rows),
+        "c": rng.integers(0, 10, rows),
+        "label": rng.choice(["p", "q", "r"], rows),
+    })
+
+
+def test_scatter_matrix_ships_each_column_once():
+    matrix = ScatterMatrix(_frame(), hue="label")
+
+    assert matrix.columns == ["a", "b", "c"]
+    state = matrix.get_state("dataColumns")["dataColumns"]
+    assert [c["name"] for c in state["columns"]] == ["a", "b", "c", "label"]
+    assert sorted(matrix.get_state("domains")["domains"]) == ["a", "b", "c"]
+
+
+def test_selected_rows_round_trip_through_the_bitset():
+    df = _frame(21)
+    matrix = ScatterMatrix(df, columns=["a", "b"])
+    matrix.selectedRows = [0, 8, 20]
+
+    assert matrix.selection == bytes([0b00000001, 0b00000001, 0b00010000])
+    assert list(matrix.selectedRows) == [0, 8, 20]
+    pd.testing.assert_frame_equal(matrix.selectedValues, df.iloc[[0, 8, 20]], check_dtype=False)
+
+    matrix.data = df
+    assert list(matrix.selectedRows) == []
+
+
+def test_selected_values_keep_the_original_index():
+    df = _frame(4)
+    df.index = [10, 20, 30, 40]
+    matrix = ScatterMatrix(df, columns=["a", "b"])
+    matrix.selectedRows = [1, 3]
+
+    assert list(matrix.selectedValues.index) == [20, 40]
+    pd.testing.assert_frame_equal(matrix.selectedValues, df.loc[[20, 40]], check_dtype=False)
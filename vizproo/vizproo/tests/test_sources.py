@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) MATIUS.
+# Distributed under the terms of the Modified BSD License.
+
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ..graphs import BarPlot, ScatterPlot
+from ..settings import settings
+from ..sources import DataSource, PolarsSource, SQLSource, connection_pool
+from ..widgets import Dropdown, RangeSlider
+
+
+class _FrameSource(DataSource):
+    """Fuente que entrega un DataFrame por lotes y cuenta las filas leídas."""
+
+    batch_size = 1000
+
+    def __init__(self, frame):
+        self.frame = frame
+        self.largest_batch = 0
+
+    @property
+    def names(self):
+        return list(self.frame.columns)
+
+    def _batches(self, columns):
+        for start in range(0, len(self.frame), self.batch_size):
+            batch = self.frame.iloc[start:start + self.batch_size][columns]
+            self.largest_batch = max(self.largest_batch, len(batch))
+            yield batch
+
+
+def _frame(rows=20_000):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "g": rng.choice(["a", "b", "c"], rows),
+        "x": rng.normal(size=rows),
+        "y": rng.random(rows),
+        "unused": rng.random(rows),
+    })
+
+
+def test_source_reductions_stream_in_batches(monkeypatch):
+    df = _frame()
+    source = _FrameSource(df)
+    monkeypatch.setattr(settings, "sample_size", 500)
+
+    plot = ScatterPlot(source, x="x", y="y")
+    assert len(plot.dataColumns) == 500
+    assert plot.dataColumns.names == ["x", "y"]
+    assert plot.domains["x"]["min"] == df["x"].min()
+    assert plot.domains["x"]["max"] == df["x"].max()
+    assert source.largest_batch == 1000
+
+    bars = BarPlot(source, x="g", y="y")
+    expected = df.groupby("g")["y"].mean()
+    assert bars.groupDomain == ["a", "b", "c"]
+    assert bars.valueDomain == pytest.approx([expected.min(), expected.max()])
+    assert len(bars.dataColumns) == 3
+
+    assert Dropdown(source, variable="g").dataOptions == ["a", "b", "c"]
+    slider = RangeSlider(source, variable="x")
+    assert slider.domains["x"]["min"] == df["x"].min()
+    assert len(slider.dataColumns) == 2
+
+
+def test_arrow_file_source_reads_only_used_columns(tmp_path):
+    pytest.importorskip("pyarrow")
+    df = _frame(rows=5000)
+    path = tmp_path / "frame.parquet"
+    df.to_parquet(path)
+
+    plot = ScatterPlot(str(path), x="x", y="y")
+    assert plot.dataColumns.names == ["x", "y"]
+    assert plot.domains["y"]["max"] == df["y"].max()
+
+
+def test_sql_source_pushes_reductions_down(tmp_path, monkeypatch):
+    df = _frame(rows=5000)
+    path = tmp_path / "items.db"
+    with sqlite3.connect(path) as connection:
+        df.to_sql("items", connection, index=False)
+    monkeypatch.setattr(settings, "sample_size", 300)
+
+    source = SQLSource(path, "items")
+    assert source.names == ["g", "x", "y", "unused"]
+    assert connection_pool(path) is SQLSource(str(path), "items")._pool
+
+    plot = ScatterPlot(source, x="x", y="y")
+    assert len(plot.dataColumns) == 300
+    assert plot.domains["x"]["max"] == pytest.approx(df["x"].max())
+
+    filtered = source.where("g = ?", ["b"])
+    bars = BarPlot(filtered, x="g", y="y")
+    assert bars.groupDomain == ["b"]
+    assert bars.valueDomain[0] == pytest.approx(df.loc[df["g"] == "b", "y"].mean())
+
+    assert Dropdown(source, variable="g").dataOptions == ["a", "b", "c"]
+    slider = RangeSlider(source.where("x > ?", [0]), variable="x")
+    assert slider.domains["x"]["min"] == pytest.approx(df.loc[df["x"] > 0, "x"].min())
+
+
+def test_sql_batches_do_not_hold_a_connection(tmp_path):
+    df = _frame(rows=250)
+    path = tmp_path / "items.db"
+    with sqlite3.connect(path) as connection:
+        df.to_sql("items", connection, index=False)
+
+    source = SQLSource(sqlite3.connect(path), "items")
+    source.batch_size = 100
+    batches = source._batches(["x"])
+    next(batches)
+    # La conexión quedó libre: otra consulta no espera al recorrido.
+    assert source.names == ["g", "x", "y", "unused"]
+    rest = list(batches)
+    assert [len(frame) for frame in rest] == [100, 50]
+    assert source.read(["x", "y"]).column("x").tolist() == df["x"].tolist()
+
+
+def test_polars_lazy_frame_adds_reductions_to_the_plan(monkeypatch):
+    pl = pytest.importorskip("polars")
+    df = _frame(rows=5000)
+    lazy = pl.from_dict({name: df[name].to_numpy() for name in df.columns}).lazy()
+    monkeypatch.setattr(settings, "sample_size", 300)
+
+    plot = ScatterPlot(lazy, x="x", y="y")
+    assert plot.dataColumns.names == ["x", "y"] and len(plot.dataColumns) == 300
+    assert plot.domains["x"]["max"] == pytest.approx(df["x"].max())
+
+    source = plot._source
+    filtered = source.where(pl.col("g") == "a")
+    assert source.where(pl.col("g") == "a") is filtered
+    bars = BarPlot(filtered, x="g", y="y")
+    assert bars.groupDomain == ["a"]
+
+
+def test_polars_where_tells_apart_predicates_that_print_the_same():
+    pl = pytest.importorskip("polars")
+    source = PolarsSource(pl.DataFrame({"x": np.arange(6000)}))
+    values = list(range(200))
+    first = source.where(pl.col("x").is_in(values))
+    values[100] = 5000
+    second = source.where(pl.col("x").is_in(values))
+
+    assert str(pl.col("x").is_in(list(range(200)))) == str(pl.col("x").is_in(values))
+    assert second is not first
+    assert second.bounds("x").column("x").max() == 5000
+    assert source.where(pl.col("x").is_in(values)) is second
+
+    for limit in range(100):
+        source.where(pl.col("x") < limit).bounds("x")
+    assert len(source._filtered) <= 32
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright (c) MATIUS.
+# Distributed under the terms of the Modified BSD License.
+
+import time
+import xml.etree.ElementTree as ET
+
+import numpy as np
+import pandas as pd
+
+from ..graphs import BarPlot, FacetGrid, HexbinPlot, RadViz, ScatterPlot, StarCoordinates
+
+_SVG = "{http://www.w3.org/2000/svg}"
+
+
+def _frame(rows=1000):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "a": rng.random(rows) * 10,
+        "b": rng.normal(size=rows),
+        "c": rng.choice(["x", "y", "z"], rows),
+    })
+
+
+def _classes(svg, name):
+    root = ET.fromstring(svg)
+    return [el for el in root.iter() if el.get("class") == name]
+
+
+def test_scatter_svg_matches_frontend_layout():
+    df = pd.DataFrame({"a": [0.3, 9.6, 4.0], "b": [1.0, 2.0, None], "c": ["x", "y", "x"]})
+    svg = ScatterPlot(df, x="a", y="b", hue="c").to_svg(width=402, height=250)
+    root = ET.fromstring(svg)
+    assert root.get("width") == "400" and root.get("height") == "250"
+
+    dots = _classes(svg, "scatter_dot")
+    assert len(dots) == 2
+    assert [dot.get("fill") for dot in dots] == ["#1f77b4", "#ff7f0e"]
+    ticks = [t.text for t in _classes(svg, "x axis")[0].iter(_SVG + "text")]
+    assert ticks[:3] == ["0", "1", "2"] and ticks[-1] == "a"
+
+
+def test_bar_and_dial_charts_export():
+    df = _frame()
+    bars = _classes(BarPlot(df, x="c", y="a").to_svg(), "bar")
+    assert len(bars) == 3
+    assert _classes(BarPlot(df, x="a", y="c", direction="horizontal").to_svg(), "bar")
+    for chart in (RadViz, StarCoordinates):
+        svg = chart(df, dimensions=["a", "b"], hue="c").to_svg()
+        assert len(_classes(svg, "point")) == len(df)
+
+
+def test_dial_charts_skip_rows_with_missing_values():
+    df = pd.DataFrame({"a": [1.0, None, 3.0, 0.0], "b": [2.0, 1.0, None, 0.0], "c": ["x", "y", "z", "x"]})
+    for chart in (RadViz, StarCoordinates):
+        points = _classes(chart(df, dimensions=["a", "b"], hue="c").to_svg(), "point")
+        # RadViz tampoco ubica la fila con todos los pesos en cero.
+        assert len(points) == (1 if chart is RadViz else 2)
+        assert all("nan" not in point.get("cx") + point.get("cy") for point in points)
+
+
+def test_static_export_throughput_and_errors():
+    charts = [ScatterPlot(_frame(), x="a", y="b", hue="c") for _ in range(5)]
+    start = time.perf_counter()
+    for _ in range(20):
+        for chart in charts:
+            chart.to_svg()
+    assert time.perf_counter() - start < 2.0
+
+    assert not hasattr(FacetGrid(_frame(rows=10), by="c"), "to_svg")
+    assert not hasattr(HexbinPlot(_frame(rows=10), x="a", y="b"), "to_png")
@@ -1,7 +1,6 @@
 import ipywidgets as widgets
-import pandas as pd
 from traitlets import Bool, Float, List, Unicode, Int
-from vizproo.base_widget import BaseWidget
+from vizproo.base_widget import BaseWidget, DataWidget
 
 class TextBaseWidget(BaseWidget):
     """Base para widgets de texto con sincronización de valor y estado.
@@ -39,9 +38,9 @@ class Button(BaseWidget):
         """Registra un callback para el evento de click.
 
         Args:
-            callback (Callable): Función que recibe el cambio del trait `_clicked`.
+            callback (Callable): Función o corrutina que recibe el cambio del trait `_clicked`.
         """
-        self.observe(callback, names=["_clicked"])
+        self._observe_callback(callback, names=["_clicked"])
 
 @widgets.register
 class Checkbox(BaseWidget):
@@ -61,68 +60,81 @@ class Checkbox(BaseWidget):
         """Registra un callback para cambios en `checked`.
 
         Args:
-            callback (Callable): Función que recibe el cambio del trait `checked`.
+            callback (Callable): Función o corrutina que recibe el cambio del trait `checked`.
         """
-        self.observe(callback, names=["checked"])
+        self._observe_callback(callback, names=["checked"])
 
 @widgets.register
-class Dropdown(BaseWidget):
+class Dropdown(DataWidget):
     """Selector desplegable con opciones y datos tabulares opcionales.
 
     Attributes:
-        dataRecords (List): Registros de datos en formato dict (sincronizados).
+        dataColumns (Instance): Tabla columnar compacta (sincronizada).
         variable (Unicode): Nombre de la variable asociada (opcional).
         description (Unicode): Etiqueta del selector.
         options (List): Lista de opciones disponibles.
+        dataOptions (List): Valores distintos de `variable` en los datos,
+            usados cuando `options` está vacía.
         value (Unicode): Valor seleccionado.
         disabled (Bool): Estado de deshabilitado.
     """
     _view_name = Unicode("DropdownView").tag(sync=True)
     _model_name = Unicode("DropdownModel").tag(sync=True)
 
-    dataRecords = List([]).tag(sync=True)
     variable = Unicode().tag(sync=True)
     description = Unicode().tag(sync=True)
     options = List().tag(sync=True)
+    dataOptions = List().tag(sync=True)
     value = Unicode().tag(sync=True)
     disabled = Bool().tag(sync=True)
     _clicked = Bool().tag(sync=True)
 
-    def __init__(self, data=pd.DataFrame(), **kwargs):
+    _column_traits = ("variable",)
+
+    def __init__(self, data=None, **kwargs):
         """Inicializa el Dropdown con un DataFrame opcional.
 
         Args:
-            data (pd.DataFrame, optional): Datos para inicializar `dataRecords`.
+            data (pd.DataFrame | Dataset | DataSource | str, optional): Datos
+                para inicializar el widget. Si es None, el widget queda sin
+                datos y no se construye ni serializa ningún DataFrame.
             **kwargs: Argumentos adicionales propagados a BaseWidget.
         """
-        self.data = data
+        if data is not None:
+            self.data = data
         super().__init__(**kwargs)
 
-    @property
-    def data(self):
-        """Devuelve los datos como DataFrame.
+    def _reduce_source(self, source):
+        """Toma de la fuente solo los valores distintos de `variable`.
+
+        Args:
+            source (DataSource): Fuente de datos del widget.
 
         Returns:
-            pd.DataFrame: DataFrame construido desde `dataRecords`.
+            ColumnTable: Una fila por opción.
         """
-        return pd.DataFrame.from_records(self.dataRecords)
+        if not self.variable:
+            return super()._reduce_source(source)
+        return source.distinct(self.variable)
 
-    @data.setter
-    def data(self, val):
-        """Establece los datos desde un DataFrame.
+    def _update_stats(self, table):
+        """Toma los valores distintos de `variable` de las estadísticas de la tabla.
 
         Args:
-            val (pd.DataFrame): DataFrame a convertir a registros dict.
+            table (ColumnTable): Tabla completa del widget.
         """
-        self.dataRecords = val.to_dict(orient="records")
+        if self.variable in table:
+            self.dataOptions = table.value_counts(self.variable)[0]
+        else:
+            self.dataOptions = []
 
     def on_select(self, callback):
         """Registra un callback para cambios en `value`.
 
         Args:
-            callback (Callable): Función que recibe el cambio del trait `value`.
+            callback (Callable): Función o corrutina que recibe el cambio del trait `value`.
         """
-        self.observe(callback, names=["value"])
+        self._observe_callback(callback, names=["value"])
 
 @widgets.register
 class Input(TextBaseWidget):
@@ -137,16 +149,16 @@ class Input(TextBaseWidget):
         """Registra un callback para cambios en `value`.
 
         Args:
-            callback (Callable): Función que recibe el cambio del trait `value`.
+            callback (Callable): Función o corrutina que recibe el cambio del trait `value`.
         """
-        self.observe(callback, names=["value"])
+        self._observe_callback(callback, names=["value"])
 
 @widgets.register
-class RangeSlider(BaseWidget):
+class RangeSlider(DataWidget):
     """Selector de rango numérico con límites y paso configurables.
 
     Attributes:
-        dataRecords (List): Registros de datos (opcional).
+        dataColumns (Instance): Tabla columnar compacta (opcional).
         variable (Unicode): Variable asociada (opcional).
         step (Float): Incremento del slider.
         description (Unicode): Etiqueta del control.
@@ -158,7 +170,6 @@ class RangeSlider(BaseWidget):
     _view_name = Unicode("RangeSliderView").tag(sync=True)
     _model_name = Unicode("RangeSliderModel").tag(sync=True)
 
-    dataRecords = List([]).tag(sync=True)
     variable = Unicode().tag(sync=True)
     step = Float().tag(sync=True)
     description = Unicode().tag(sync=True)
@@ -167,41 +178,41 @@ class RangeSlider(BaseWidget):
     minValue = Float().tag(sync=True)
     maxValue = Float().tag(sync=True)
 
-    def __init__(self, data=pd.DataFrame(), **kwargs):
+    _column_traits = ("variable",)
+
+    def __init__(self, data=None, **kwargs):
         """Inicializa el RangeSlider con un DataFrame opcional.
 
         Args:
-            data (pd.DataFrame, optional): Datos para inicializar `dataRecords`.
+            data (pd.DataFrame | Dataset | DataSource | str, optional): Datos
+                para inicializar el widget. Si es None, el widget queda sin
+                datos y no se construye ni serializa ningún DataFrame.
             **kwargs: Argumentos adicionales propagados a BaseWidget.
         """
-        self.data = data
+        if data is not None:
+            self.data = data
         super().__init__(**kwargs)
 
-    @property
-    def data(self):
-        """Devuelve los datos como DataFrame.
-
-        Returns:
-            pd.DataFrame: DataFrame construido desde `dataRecords`.
-        """
-        return pd.DataFrame.from_records(self.dataRecords)
-
-    @data.setter
-    def data(self, val):
-        """Establece los datos desde un DataFrame.
+    def _reduce_source(self, source):
+        """Toma de la fuente solo el mínimo y el máximo de `variable`.
 
         Args:
-            val (pd.DataFrame): DataFrame a convertir a registros dict.
+            source (DataSource): Fuente de datos del widget.
+
+        Returns:
+            ColumnTable: Extremos de la variable.
         """
-        self.dataRecords = val.to_dict(orient="records")
+        if not self.variable:
+            return super()._reduce_source(source)
+        return source.bounds(self.variable)
 
     def on_drag(self, callback):
         """Registra un callback para cambios en `fromValue` y `toValue`.
 
         Args:
-            callback (Callable): Función que recibe cambios del rango.
+            callback (Callable): Función o corrutina que recibe cambios del rango.
         """
-        self.observe(callback, names=["fromValue", "toValue"])
+        self._observe_callback(callback, names=["fromValue", "toValue"])
 
 @widgets.register
 class TextArea(TextBaseWidget):
@@ -216,9 +227,9 @@ class TextArea(TextBaseWidget):
         """Registra un callback para cambios en `value`.
 
         Args:
-            callback (Callable): Función que recibe el cambio del trait `value`.
+            callback (Callable): Función o corrutina que recibe el cambio del trait `value`.
         """
-        self.observe(callback, names=["value"])
+        self._observe_callback(callback, names=["value"])
 
 @widgets.register
 class Text(TextBaseWidget):